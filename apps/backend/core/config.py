@@ -20,6 +20,48 @@ class Settings(BaseSettings):
     # AI/ML Settings
     EMBEDDING_MODEL: str = "sentence-transformers/all-mpnet-base-v2"
     EMBEDDING_DIM: int = 768
+    EMBEDDING_BACKEND: str = "torch"  # torch, onnx or onnx-int8
+    EMBEDDING_ONNX_PATH: str = "models/onnx/all-mpnet-base-v2"  # Output of scripts/onnx_embeddings.py export
+    PRELOAD_MODEL: bool = True  # Load and warm the model and vector indexes at startup (else on first use; /ready then waits only for the DB)
+    EMBEDDING_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # In-memory LRU budget (~21k vectors)
+    EMBEDDING_DISK_CACHE_PATH: str = ""  # SQLite file shared by workers; empty disables
+    EMBEDDING_DISK_CACHE_MAX_ROWS: int = 100000  # Oldest entries beyond this are pruned (~3 KB each); 0 = no limit
+    EMBEDDING_BATCHING_ENABLED: bool = True  # Coalesce concurrent encode_text calls
+    EMBEDDING_BATCH_MAX_SIZE: int = 32
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_INFERENCE_WORKERS: int = 1  # Dedicated model threads per process
+    EMBEDDING_INFERENCE_MAX_PENDING: int = 256  # Reject new encodes beyond this backlog
+    EMBEDDING_TORCH_THREADS: int = 0  # torch intra-op threads; 0 keeps torch's default
+    EMBEDDING_CHUNK_THRESHOLD_CHARS: int = 10000  # Longer texts are chunked and pooled
+    EMBEDDING_MAX_TEXT_CHARS: int = 200000  # Hard limit, even in long-document mode
+    EMBEDDING_CHUNK_TOKENS: int = 256  # Tokens per chunk; must fit the model's 384-token window
+    EMBEDDING_CHUNK_OVERLAP_TOKENS: int = 32
+    EMBEDDING_CHUNK_POOLING: str = "mean"  # mean or weighted (by chunk token count)
+    EMBEDDING_BACKFILL_INTERVAL_SECONDS: int = 900  # In-process backfill of missing/stale vectors; 0 disables
+    EMBEDDING_BACKFILL_BATCH_SIZE: int = 256  # Rows per keyset page and bulk update
+    EMBEDDING_BACKFILL_RATE: float = 50.0  # Max texts encoded per second by the backfill
+    EMBEDDING_BACKFILL_CHECKPOINT_PATH: str = "cache/embedding_backfill.json"  # Resume point; also the cross-worker lock
+    VECTOR_INDEX_REFRESH_SECONDS: int = 3600  # Full rebuild after this age (job changes are applied incrementally)
+    VECTOR_INDEX_SHARED_DIR: str = ""  # tmpfs dir for index snapshots shared by all workers; empty = per-process
+    VECTOR_INDEX_SHARED_CHECK_SECONDS: float = 2.0  # How often workers look for a newer shared snapshot
+    VECTOR_INDEX_SYNC_SECONDS: float = 5.0  # Poll for jobs changed by other workers; 0 disables
+    VECTOR_INDEX_SYNC_LOOKBACK_SECONDS: float = 60.0  # Re-check jobs updated this long before the last poll
+    VECTOR_INDEX_SYNC_DEBOUNCE_MS: float = 500.0  # Collect job change events for this long before embedding
+    VECTOR_INDEX_ANN: str = "exact"  # exact or ivf (approximate nearest neighbour)
+    VECTOR_INDEX_ANN_MIN_SIZE: int = 20000  # Smaller indexes are always scanned exactly
+    VECTOR_INDEX_IVF_NLIST: int = 0  # IVF lists; 0 picks sqrt(n)
+    VECTOR_INDEX_IVF_NPROBE: int = 16  # Lists visited per query (recall vs latency)
+    KEYWORD_INDEX_REFRESH_SECONDS: int = 3600  # Full rebuild of the BM25 keyword indexes after this age
+    KEYWORD_SEARCH_MAX_RESULTS: int = 1000  # Deepest keyword match a relevance-ordered page can reach
+    KEYWORD_SEARCH_BACKEND: str = "index"  # index (in-process BM25) or fulltext (MariaDB MATCH ... AGAINST; ILIKE elsewhere)
+    KEYWORD_FULLTEXT_MODE: str = "natural"  # natural (ranked, any term) or boolean (every term required, prefix match)
+    
+    # Batch Recommendations (scripts/compute_recommendations.py)
+    RECOMMENDATION_TOP_K: int = 20  # Careers and jobs stored per user
+    RECOMMENDATION_MIN_SCORE: float = 0.3  # Lower similarities are not stored
+    RECOMMENDATION_BATCH_USERS: int = 5000  # Users scored and written per transaction
+    RECOMMENDATION_BATCH_MEMORY_MB: int = 512  # Budget for one users × catalog slice (scores plus partition indexes)
+    RECOMMENDATION_MAX_AGE_HOURS: float = 26.0  # Older stored recommendations are recomputed on read
     
     # CORS Settings
     CORS_ORIGINS: list[str] = Field(
@@ -8,6 +8,8 @@ from sqlalchemy.exc import SQLAlchemyError
 import logging
 from fastapi.exceptions import HTTPException
 
+from apps.backend.services.ai.inference import InferenceBusyError
+
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +92,16 @@ def register_exception_handlers(app: FastAPI):
             }
         )
     
+    @app.exception_handler(InferenceBusyError)
+    async def inference_busy_exception_handler(request: Request, exc: InferenceBusyError):
+        """Handle a full inference queue: ask the client to retry shortly."""
+        logger.warning(f"Inference busy: {str(exc)}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "The AI service is busy. Please retry shortly."},
+            headers={"Retry-After": "1"}
+        )
+    
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle all other exceptions."""
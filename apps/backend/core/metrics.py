@@ -0,0 +1,158 @@
+"""
+Green Matchers - Prometheus Metrics
+HTTP, database pool, embedding cache, inference and vector index metrics.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty
+directory shared by the workers; each process writes its samples there and
+/metrics aggregates all of them.
+"""
+import os
+import time
+
+from fastapi import Request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from starlette.middleware.base import BaseHTTPMiddleware
+
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    multiprocess_mode="livesum",
+)
+
+# Database pool
+DB_POOL_CHECKOUTS = Counter("db_pool_checkouts_total", "Connections checked out of the pool")
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond pool_size", multiprocess_mode="livesum"
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+# Embeddings
+EMBEDDING_CACHE_LOOKUPS = Counter(
+    "embedding_cache_lookups_total", "Embedding cache lookups", ["tier", "result"]
+)
+EMBEDDING_BATCH_SIZE = Histogram(
+    "embedding_batch_size",
+    "Texts per batched model call",
+    ["kind"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+EMBEDDING_OPERATION_DURATION = Histogram(
+    "embedding_operation_duration_seconds",
+    "Embedding service operation latency",
+    ["operation"],
+    buckets=LATENCY_BUCKETS + (30.0, 60.0),
+)
+EMBEDDING_INFERENCE_REJECTED = Counter(
+    "embedding_inference_rejected_total", "Encodes rejected because the inference queue was full"
+)
+
+# Vector indexes
+VECTOR_INDEX_SIZE = Gauge(
+    "vector_index_size", "Vectors held by an in-memory index", ["index"], multiprocess_mode="max"
+)
+
+
+class PrometheusMiddleware(BaseHTTPMiddleware):
+    """Record latency and in-flight count for every HTTP request."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path == "/metrics":
+            return await call_next(request)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start_time = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            # Label by route template (e.g. /api/jobs/{job_id}) to bound cardinality
+            route = request.scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=request.method,
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            ).observe(time.perf_counter() - start_time)
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start_time)
+
+
+def instrument_engine(engine):
+    """Track checkouts, checked-out connections and overflow of an engine's pool."""
+    pool = engine.pool
+
+    def update_gauges(returning: int = 0):
+        # On checkin the returning connection is still counted by the pool
+        checked_out = pool.checkedout() - returning
+        DB_POOL_CHECKED_OUT.set(checked_out)
+        DB_POOL_OVERFLOW.set(max(0, checked_out - pool.size()))
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc()
+        update_gauges()
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        update_gauges(returning=1)
+
+
+def render_metrics():
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        Tuple of the payload bytes and its content type
+    """
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead():
+    """Drop this worker's live gauges from the shared directory on shutdown."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
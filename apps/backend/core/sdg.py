@@ -0,0 +1,74 @@
+"""
+Green Matchers - SDG Goals
+SDG goal names and the sdg_mask bit encoding of SDG tags.
+
+Goal n (1-17) is bit n - 1 of the integer sdg_mask column on jobs and
+careers, so goal filters are a bitwise AND and the goal distribution is one
+aggregate over the bits.
+"""
+import json
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import case, func
+
+SDG_GOALS = {
+    1: "No Poverty",
+    2: "Zero Hunger",
+    3: "Good Health and Well-being",
+    4: "Quality Education",
+    5: "Gender Equality",
+    6: "Clean Water and Sanitation",
+    7: "Affordable and Clean Energy",
+    8: "Decent Work and Economic Growth",
+    9: "Industry, Innovation and Infrastructure",
+    10: "Reduced Inequalities",
+    11: "Sustainable Cities and Communities",
+    12: "Responsible Consumption and Production",
+    13: "Climate Action",
+    14: "Life Below Water",
+    15: "Life on Land",
+    16: "Peace, Justice and Strong Institutions",
+    17: "Partnerships for the Goals"
+}
+
+
+def sdg_bit(goal: int) -> int:
+    """Mask bit of one SDG goal (0 for numbers outside 1-17)."""
+    return 1 << (goal - 1) if goal in SDG_GOALS else 0
+
+
+def sdg_mask(tags: Optional[Iterable]) -> int:
+    """Bitmask of a list of SDG goal numbers; unknown tags are ignored."""
+    if isinstance(tags, str):
+        tags = json.loads(tags)
+    mask = 0
+    for tag in tags or []:
+        try:
+            mask |= sdg_bit(int(tag))
+        except (TypeError, ValueError):
+            continue
+    return mask
+
+
+def sdg_goals(mask: int) -> List[int]:
+    """SDG goal numbers set in a mask."""
+    return [goal for goal in SDG_GOALS if mask & sdg_bit(goal)]
+
+
+def has_sdg(column, goal: int):
+    """Filter criterion: the mask column includes an SDG goal."""
+    return column.op("&")(sdg_bit(goal)) != 0
+
+
+def has_all_sdgs(column, goals: Iterable[int]):
+    """Filter criterion: the mask column includes every given SDG goal."""
+    mask = sdg_mask(goals)
+    return column.op("&")(mask) == mask
+
+
+def sdg_count_columns(column) -> Dict[int, object]:
+    """Per-goal SUM expressions for counting rows by SDG goal in one query."""
+    return {
+        goal: func.sum(case((has_sdg(column, goal), 1), else_=0))
+        for goal in SDG_GOALS
+    }
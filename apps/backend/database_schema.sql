@@ -43,6 +43,78 @@ CREATE TABLE IF NOT EXISTS user_skills (
 CREATE INDEX idx_users_language ON users(preferred_language);
 CREATE INDEX idx_users_location ON users(location);
 
+-- Canonical skill dictionary (skill lists store canonical names)
+CREATE TABLE IF NOT EXISTS skills (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE INDEX ix_skills_name (name)
+);
+
+CREATE TABLE IF NOT EXISTS skill_aliases (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    alias VARCHAR(255) NOT NULL,
+    skill_id INT NOT NULL,
+    UNIQUE INDEX ix_skill_aliases_alias (alias),
+    INDEX ix_skill_aliases_skill_id (skill_id),
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+);
+
+-- Inverted skill indexes mirroring jobs/careers.required_skills (skill filters)
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id INT NOT NULL,
+    skill_id INT NOT NULL,
+    PRIMARY KEY (job_id, skill_id),
+    INDEX idx_job_skills_skill_job (skill_id, job_id),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS career_skills (
+    career_id INT NOT NULL,
+    skill_id INT NOT NULL,
+    PRIMARY KEY (career_id, skill_id),
+    INDEX idx_career_skills_skill_career (skill_id, career_id),
+    FOREIGN KEY (career_id) REFERENCES careers(id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+);
+
+-- Skill vocabulary vectors (user/job skill vectors are composed from these)
+CREATE TABLE IF NOT EXISTS skill_embeddings (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    embedding BLOB NOT NULL,  -- Packed float32 vector (768 * 4 bytes)
+    embedding_version VARCHAR(100) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE INDEX ix_skill_embeddings_name (name)
+);
+
+-- Precomputed recommendations (scripts/compute_recommendations.py)
+CREATE TABLE IF NOT EXISTS user_recommendations (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    item_type ENUM('CAREER', 'JOB') NOT NULL,
+    item_id INT NOT NULL,
+    `rank` INT NOT NULL,
+    score FLOAT NOT NULL,
+    matched_skills JSON,
+    missing_skills JSON,
+    computed_at DATETIME NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_user_recommendations_lookup (user_id, item_type, `rank`),
+    UNIQUE KEY uq_user_recommendations_item (user_id, item_type, item_id)
+);
+
+-- When each user's recommendations of a type were last computed (also for empty results)
+CREATE TABLE IF NOT EXISTS user_recommendation_runs (
+    user_id INT NOT NULL,
+    item_type ENUM('CAREER', 'JOB') NOT NULL,
+    computed_at DATETIME NOT NULL,
+    PRIMARY KEY (user_id, item_type),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
 -- Careers table (green career paths)
 CREATE TABLE IF NOT EXISTS careers (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -50,18 +122,22 @@ CREATE TABLE IF NOT EXISTS careers (
     description TEXT NOT NULL,
     required_skills JSON NOT NULL,
     sdg_tags JSON NOT NULL DEFAULT '[]',
+    sdg_mask INT NOT NULL DEFAULT 0,  -- Bit n-1 set for SDG goal n (mirrors sdg_tags)
     avg_salary_min INT,
     avg_salary_max INT,
     avg_salary INT,
     growth_potential VARCHAR(50) DEFAULT 'Medium',
     demand_score FLOAT DEFAULT 0.0,
-    embedding VARCHAR(5000),
+    embedding BLOB,  -- Packed float32 vector (768 * 4 bytes)
+    embedding_version VARCHAR(100),  -- Model that produced the vector (backfill re-embeds on mismatch)
     is_active BOOLEAN NOT NULL DEFAULT TRUE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_careers_id (id),
     INDEX idx_careers_title (title),
-    INDEX idx_careers_is_active (is_active)
+    INDEX idx_careers_is_active (is_active),
+    INDEX ix_careers_sdg_mask (sdg_mask),
+    FULLTEXT INDEX ft_careers_text (title, description)
 );
 
 -- Jobs table
@@ -78,6 +154,7 @@ CREATE TABLE IF NOT EXISTS jobs (
     is_active BOOLEAN DEFAULT TRUE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX ix_jobs_updated_at (updated_at),
     FOREIGN KEY (employer_id) REFERENCES users(id),
     FOREIGN KEY (career_id) REFERENCES careers(id)
 );
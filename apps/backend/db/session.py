@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from apps.backend.core.config import get_settings
+from apps.backend.core.metrics import InstrumentedQueuePool, instrument_engine
 
 settings = get_settings()
 
@@ -14,8 +15,10 @@ engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_recycle=3600,
+    poolclass=InstrumentedQueuePool,  # Records pool wait time for /metrics
     echo=False  # Set to True for SQL query logging
 )
+instrument_engine(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,13 +1,20 @@
 """
 Green Matchers - Main FastAPI Application
 """
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import text
 
 from apps.backend.core.config import get_settings
 from apps.backend.core.logging import setup_logging
 from apps.backend.core.exceptions import register_exception_handlers
 from apps.backend.core.security_headers import SecurityHeadersMiddleware
+from apps.backend.core.metrics import PrometheusMiddleware, render_metrics, mark_process_dead
 
 from apps.backend.routes import (
     auth_router,
@@ -25,14 +32,110 @@ from apps.backend.routes import (
 # Setup logging
 setup_logging()
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
+# Readiness of each dependency, filled in by the startup warm-up
+readiness = {
+    "database": False,
+    "model": False,
+    "vector_indexes": False,
+}
+
+
+def warm_up(preload: bool = True):
+    """
+    Warm the DB pool, the embedding model and the vector indexes.
+    
+    Runs in a worker thread at startup. Each step is independent, so a
+    failure is logged and leaves only that check red on /ready. The DB pool
+    is always checked; without `preload` the model and indexes load lazily
+    on first use, so their checks are marked ready without loading them.
+    
+    Args:
+        preload: Load the model and the indexes now (PRELOAD_MODEL)
+    """
+    from apps.backend.db.session import engine, SessionLocal
+    from apps.backend.models.job import Job
+    from apps.backend.models.career import Career
+    from apps.backend.services.ai.embeddings import EmbeddingService
+    from apps.backend.services.ai.vector_index import job_index, career_index
+    from apps.backend.services.ai.keyword_index import job_keyword_index, career_keyword_index
+    
+    # Open a full pool's worth of connections once
+    try:
+        connections = [engine.connect() for _ in range(engine.pool.size())]
+        for conn in connections:
+            conn.execute(text("SELECT 1"))
+            conn.close()
+        readiness["database"] = True
+    except Exception as e:
+        logger.error(f"Database warm-up failed: {str(e)}")
+    
+    if not preload:
+        readiness["model"] = True
+        readiness["vector_indexes"] = True
+        return
+    
+    try:
+        EmbeddingService.warm_up()
+        readiness["model"] = True
+    except Exception as e:
+        logger.error(f"Model warm-up failed: {str(e)}")
+    
+    try:
+        db = SessionLocal()
+        try:
+            # With shared snapshots, only one worker reads the database; the rest attach
+            job_index.ensure_loaded(db, Job)
+            career_index.ensure_loaded(db, Career)
+        finally:
+            db.close()
+        readiness["vector_indexes"] = True
+    except Exception as e:
+        logger.error(f"Vector index warm-up failed: {str(e)}")
+    
+    if settings.KEYWORD_SEARCH_BACKEND == "index":
+        try:
+            db = SessionLocal()
+            try:
+                job_keyword_index.ensure_loaded(db, Job)
+                career_keyword_index.ensure_loaded(db, Career)
+            finally:
+                db.close()
+        except Exception as e:
+            # Keyword search falls back to building the index on first use
+            logger.error(f"Keyword index warm-up failed: {str(e)}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the warm-up and job index sync in the background so /health answers immediately."""
+    from apps.backend.services.ai.index_sync import job_index_sync
+    from apps.backend.services.ai.backfill import embedding_backfill
+    
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up, settings.PRELOAD_MODEL))
+    # Apply job changes (from this and other workers) to the job index
+    job_index_sync.start()
+    # Embed rows with missing or outdated vectors (one worker at a time, via a file lock)
+    if settings.EMBEDDING_BACKFILL_INTERVAL_SECONDS > 0:
+        embedding_backfill.start_background(settings.EMBEDDING_BACKFILL_INTERVAL_SECONDS)
+    yield
+    if not warm_up_task.done():
+        warm_up_task.cancel()
+    job_index_sync.stop()
+    embedding_backfill.stop()
+    mark_process_dead()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Register exception handlers
@@ -50,6 +153,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency / in-flight metrics (outermost, so it times the whole stack)
+app.add_middleware(PrometheusMiddleware)
+
 # Include routers
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(users_router, prefix="/api/users", tags=["Users"])
@@ -75,7 +181,7 @@ def root():
 
 @app.get("/health")
 def health_check():
-    """Health check endpoint for monitoring."""
+    """Health check endpoint for monitoring (liveness only)."""
     return {
         "status": "healthy",
         "service": "green-matchers-api",
@@ -83,6 +189,31 @@ def health_check():
     }
 
 
+@app.get("/ready")
+def readiness_check():
+    """
+    Readiness endpoint for the load balancer.
+    Returns 503 until the DB pool, the model and the vector indexes are warm.
+    """
+    ready = all(readiness.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "warming_up",
+            "checks": readiness,
+            "service": "green-matchers-api",
+            "version": settings.APP_VERSION
+        }
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus metrics, aggregated across workers in multiprocess mode."""
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
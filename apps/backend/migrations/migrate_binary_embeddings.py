@@ -0,0 +1,114 @@
+"""
+Database Migration Script for Green Matchers
+Converts job and career embeddings from JSON text to packed float32 binary
+
+Run from the repository root:
+    python -m apps.backend.migrations.migrate_binary_embeddings
+
+The column type change keeps the existing JSON text as bytes, and
+EmbeddingService.bytes_to_vector reads both formats, so the API keeps
+serving while rows are converted in small keyset-paginated batches.
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+
+from apps.backend.db.session import engine
+from apps.backend.services.ai.embeddings import EmbeddingService
+
+TABLES = ("jobs", "careers")
+BINARY_LENGTH = EmbeddingService._embedding_dim * EmbeddingService._vector_dtype.itemsize
+
+
+def alter_column(table: str):
+    """Change the embedding column to BLOB (MariaDB/MySQL only)."""
+    if engine.dialect.name not in ("mysql", "mariadb"):
+        print(f"  ○ {engine.dialect.name} does not need a column type change for {table}")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table} MODIFY COLUMN embedding BLOB NULL"))
+    print(f"  ✓ {table}.embedding is now BLOB")
+
+
+def convert_rows(table: str, batch_size: int, pause: float):
+    """
+    Convert JSON embeddings to binary in keyset-paginated batches.
+
+    Each batch commits on its own so locks are held only briefly. Rows that
+    are already binary are skipped; rows whose JSON cannot be parsed (e.g.
+    truncated by the old 5000-char limit) are set to NULL for re-embedding.
+    """
+    last_id = 0
+    converted = 0
+    cleared = 0
+
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    f"SELECT id, embedding FROM {table} "
+                    f"WHERE id > :last_id AND embedding IS NOT NULL "
+                    f"ORDER BY id LIMIT :limit"
+                ),
+                {"last_id": last_id, "limit": batch_size}
+            ).fetchall()
+
+        if not rows:
+            break
+
+        updates = []
+        for row_id, raw in rows:
+            if isinstance(raw, str):
+                raw = raw.encode("utf-8")
+            if len(raw) == BINARY_LENGTH:
+                continue
+
+            try:
+                vector = EmbeddingService.bytes_to_vector(raw)
+                updates.append({"id": row_id, "embedding": EmbeddingService.vector_to_bytes(vector)})
+                converted += 1
+            except ValueError as e:
+                print(f"  ✗ {table} {row_id}: {e}; clearing embedding")
+                updates.append({"id": row_id, "embedding": None})
+                cleared += 1
+
+        if updates:
+            with engine.begin() as conn:
+                # Keep updated_at unchanged: this is a storage-format change only
+                conn.execute(
+                    text(
+                        f"UPDATE {table} SET embedding = :embedding, updated_at = updated_at "
+                        f"WHERE id = :id"
+                    ),
+                    updates
+                )
+
+        last_id = rows[-1][0]
+        print(f"  … {table}: up to id {last_id} ({converted} converted, {cleared} cleared)")
+
+        if pause:
+            time.sleep(pause)
+
+    print(f"  ✓ {table}: {converted} converted, {cleared} cleared")
+
+
+def migrate(batch_size: int = 500, pause: float = 0.1):
+    print("Starting binary embedding migration...")
+
+    for step, table in enumerate(TABLES, start=1):
+        print(f"\n{step}. Migrating {table}.embedding...")
+        alter_column(table)
+        convert_rows(table, batch_size, pause)
+
+    print("\n✓ Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert JSON embeddings to binary float32")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per batch")
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+
+    migrate(batch_size=args.batch_size, pause=args.pause)
@@ -0,0 +1,26 @@
+-- Migration: Add embedding_version to jobs and careers
+-- Date: 2026-10-16
+-- Purpose: Record which model produced each stored vector so the backfill worker can re-embed stale rows
+-- =====================================================
+-- STEP 1: Add embedding_version columns
+-- =====================================================
+ALTER TABLE jobs
+ADD COLUMN embedding_version VARCHAR(100) NULL;
+ALTER TABLE careers
+ADD COLUMN embedding_version VARCHAR(100) NULL;
+-- =====================================================
+-- STEP 2: Tag existing vectors with the current model version
+-- (EmbeddingService.get_embedding_version(); keeps updated_at unchanged)
+-- =====================================================
+UPDATE jobs
+SET embedding_version = 'all-mpnet-base-v2:2.3.1', updated_at = updated_at
+WHERE embedding IS NOT NULL;
+UPDATE careers
+SET embedding_version = 'all-mpnet-base-v2:2.3.1', updated_at = updated_at
+WHERE embedding IS NOT NULL;
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Rows the backfill will pick up
+-- SELECT COUNT(*) FROM jobs WHERE embedding IS NULL OR embedding_version IS NULL;
+-- SELECT COUNT(*) FROM careers WHERE embedding IS NULL OR embedding_version IS NULL;
@@ -0,0 +1,21 @@
+-- Migration: Add FULLTEXT indexes for keyword search
+-- Date: 2026-10-16
+-- Purpose: Let KEYWORD_SEARCH_BACKEND=fulltext rank job/career search with MATCH ... AGAINST instead of '%q%' scans
+-- =====================================================
+-- STEP 1: FULLTEXT indexes (column lists must match the MATCH() calls in keyword_index.py)
+-- =====================================================
+ALTER TABLE jobs
+ADD FULLTEXT INDEX ft_jobs_text (title, description, requirements);
+ALTER TABLE careers
+ADD FULLTEXT INDEX ft_careers_text (title, description);
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Ranked natural-language matches
+-- SELECT id, title, MATCH (title, description, requirements) AGAINST ('solar technician' IN NATURAL LANGUAGE MODE) AS score
+-- FROM jobs
+-- WHERE MATCH (title, description, requirements) AGAINST ('solar technician' IN NATURAL LANGUAGE MODE) > 0
+-- ORDER BY score DESC LIMIT 10;
+--
+-- The plan should use ft_jobs_text (type: fulltext) rather than a full scan
+-- EXPLAIN SELECT id FROM jobs WHERE MATCH (title, description, requirements) AGAINST ('+solar* +technician*' IN BOOLEAN MODE) > 0;
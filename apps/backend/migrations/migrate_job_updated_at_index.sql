@@ -0,0 +1,14 @@
+-- Migration: Index jobs.updated_at
+-- Date: 2026-10-16
+-- Purpose: Each API worker polls recently updated jobs every few seconds to keep its in-memory job index in sync
+-- =====================================================
+-- STEP 1: Add index on updated_at
+-- =====================================================
+CREATE INDEX ix_jobs_updated_at ON jobs(updated_at);
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Check index was created
+-- SHOW INDEX FROM jobs WHERE Key_name = 'ix_jobs_updated_at';
+-- Check the poll query uses it
+-- EXPLAIN SELECT id FROM jobs WHERE updated_at >= NOW() - INTERVAL 1 MINUTE;
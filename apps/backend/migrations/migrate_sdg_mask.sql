@@ -0,0 +1,70 @@
+-- Migration: Add sdg_mask to jobs and careers
+-- Date: 2026-10-16
+-- Purpose: Filter and count SDG goals with bitwise operations instead of scanning JSON sdg_tags
+-- =====================================================
+-- STEP 1: Add mask columns (bit n-1 set for SDG goal n)
+-- =====================================================
+ALTER TABLE jobs
+ADD COLUMN sdg_mask INT NOT NULL DEFAULT 0;
+ALTER TABLE careers
+ADD COLUMN sdg_mask INT NOT NULL DEFAULT 0;
+-- =====================================================
+-- STEP 2: Backfill from sdg_tags (the application keeps them in sync afterwards)
+-- =====================================================
+UPDATE jobs
+SET updated_at = updated_at,
+    sdg_mask = COALESCE(
+    (JSON_CONTAINS(sdg_tags, '1') << 0) |
+    (JSON_CONTAINS(sdg_tags, '2') << 1) |
+    (JSON_CONTAINS(sdg_tags, '3') << 2) |
+    (JSON_CONTAINS(sdg_tags, '4') << 3) |
+    (JSON_CONTAINS(sdg_tags, '5') << 4) |
+    (JSON_CONTAINS(sdg_tags, '6') << 5) |
+    (JSON_CONTAINS(sdg_tags, '7') << 6) |
+    (JSON_CONTAINS(sdg_tags, '8') << 7) |
+    (JSON_CONTAINS(sdg_tags, '9') << 8) |
+    (JSON_CONTAINS(sdg_tags, '10') << 9) |
+    (JSON_CONTAINS(sdg_tags, '11') << 10) |
+    (JSON_CONTAINS(sdg_tags, '12') << 11) |
+    (JSON_CONTAINS(sdg_tags, '13') << 12) |
+    (JSON_CONTAINS(sdg_tags, '14') << 13) |
+    (JSON_CONTAINS(sdg_tags, '15') << 14) |
+    (JSON_CONTAINS(sdg_tags, '16') << 15) |
+    (JSON_CONTAINS(sdg_tags, '17') << 16), 0)
+WHERE sdg_tags IS NOT NULL;
+UPDATE careers
+SET updated_at = updated_at,
+    sdg_mask = COALESCE(
+    (JSON_CONTAINS(sdg_tags, '1') << 0) |
+    (JSON_CONTAINS(sdg_tags, '2') << 1) |
+    (JSON_CONTAINS(sdg_tags, '3') << 2) |
+    (JSON_CONTAINS(sdg_tags, '4') << 3) |
+    (JSON_CONTAINS(sdg_tags, '5') << 4) |
+    (JSON_CONTAINS(sdg_tags, '6') << 5) |
+    (JSON_CONTAINS(sdg_tags, '7') << 6) |
+    (JSON_CONTAINS(sdg_tags, '8') << 7) |
+    (JSON_CONTAINS(sdg_tags, '9') << 8) |
+    (JSON_CONTAINS(sdg_tags, '10') << 9) |
+    (JSON_CONTAINS(sdg_tags, '11') << 10) |
+    (JSON_CONTAINS(sdg_tags, '12') << 11) |
+    (JSON_CONTAINS(sdg_tags, '13') << 12) |
+    (JSON_CONTAINS(sdg_tags, '14') << 13) |
+    (JSON_CONTAINS(sdg_tags, '15') << 14) |
+    (JSON_CONTAINS(sdg_tags, '16') << 15) |
+    (JSON_CONTAINS(sdg_tags, '17') << 16), 0)
+WHERE sdg_tags IS NOT NULL;
+-- =====================================================
+-- STEP 3: Indexes
+-- =====================================================
+-- Public job listings filter on is_verified + status; the SDG bit test is checked in the index
+CREATE INDEX idx_jobs_public_sdg ON jobs (is_verified, status, sdg_mask);
+CREATE INDEX ix_careers_sdg_mask ON careers (sdg_mask);
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Jobs tagged with SDG 13 (Climate Action), both ways; the counts should match
+-- SELECT COUNT(*) FROM jobs WHERE sdg_mask & (1 << 12) <> 0;
+-- SELECT COUNT(*) FROM jobs WHERE JSON_CONTAINS(sdg_tags, '13');
+--
+-- Plan for a public single-goal listing
+-- EXPLAIN SELECT id FROM jobs WHERE is_verified = 1 AND status = 'OPEN' AND sdg_mask & 64 <> 0;
@@ -0,0 +1,138 @@
+"""
+Database Migration Script for Green Matchers
+Creates the skill dictionary and canonicalizes stored skill lists
+
+Run from the repository root:
+    python -m apps.backend.migrations.migrate_skill_dictionary
+
+Creates the skills and skill_aliases tables, seeds the built-in aliases,
+then rewrites users.skills, jobs.required_skills, jobs.preferred_skills and
+careers.required_skills to canonical names (interning every name) in small
+keyset-paginated batches. Users whose skills changed get their stored skill
+embedding cleared so it is recomposed from the canonical names.
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy import text
+
+from apps.backend.db.base import Base
+from apps.backend.db.session import engine
+from apps.backend.models.skill import Skill, SkillAlias
+from apps.backend.services.skill_dictionary import DEFAULT_ALIASES, skill_dictionary
+
+# (table, skill columns, extra SET clause for changed rows)
+TARGETS = (
+    ("users", ("skills",), "skill_embedding = NULL, skill_embedding_version = NULL"),
+    ("jobs", ("required_skills", "preferred_skills"), "updated_at = updated_at"),
+    ("careers", ("required_skills",), "updated_at = updated_at"),
+)
+
+
+def create_tables():
+    """Create skills and skill_aliases if they do not exist."""
+    Base.metadata.create_all(bind=engine, tables=[Skill.__table__, SkillAlias.__table__])
+    print("  ✓ skills and skill_aliases tables ready")
+
+
+def seed_aliases():
+    """Intern the built-in alias targets and store the aliases themselves."""
+    skill_dictionary.load()
+    skill_dictionary.intern(DEFAULT_ALIASES.values())
+
+    with engine.begin() as conn:
+        existing = {row[0] for row in conn.execute(text("SELECT alias FROM skill_aliases"))}
+        ids = dict(conn.execute(text("SELECT name, id FROM skills")).fetchall())
+        rows = [
+            {"alias": alias, "skill_id": ids[name]}
+            for alias, name in DEFAULT_ALIASES.items()
+            if alias not in existing and name in ids
+        ]
+        if rows:
+            conn.execute(text("INSERT INTO skill_aliases (alias, skill_id) VALUES (:alias, :skill_id)"), rows)
+
+    if rows:
+        print(f"  ✓ Added {len(rows)} aliases")
+    else:
+        print("  ○ Aliases already seeded")
+
+
+def _as_list(value):
+    """JSON column value as a list (drivers may return the raw JSON text)."""
+    if isinstance(value, (bytes, str)):
+        value = json.loads(value)
+    return value if isinstance(value, list) else None
+
+
+def canonicalize_table(table: str, columns, extra_set: str, batch_size: int, pause: float):
+    """Rewrite one table's skill lists to canonical names in keyset-paginated batches."""
+    last_id = 0
+    changed = 0
+    select_columns = ", ".join(columns)
+    set_columns = ", ".join(f"{column} = :{column}" for column in columns)
+
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(f"SELECT id, {select_columns} FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit"),
+                {"last_id": last_id, "limit": batch_size}
+            ).fetchall()
+
+        if not rows:
+            break
+
+        updates = []
+        for row in rows:
+            values = {}
+            for column, raw in zip(columns, row[1:]):
+                skills = _as_list(raw)
+                values[column] = skills if skills is None else skill_dictionary.intern(skills)
+                if values[column] != skills:
+                    values["changed"] = True
+            if values.pop("changed", False):
+                updates.append({
+                    "id": row[0],
+                    **{column: None if value is None else json.dumps(value) for column, value in values.items()}
+                })
+
+        if updates:
+            with engine.begin() as conn:
+                conn.execute(
+                    text(f"UPDATE {table} SET {set_columns}, {extra_set} WHERE id = :id"),
+                    updates
+                )
+            changed += len(updates)
+
+        last_id = rows[-1][0]
+        print(f"  … {table}: up to id {last_id} ({changed} changed)")
+
+        if pause:
+            time.sleep(pause)
+
+    print(f"  ✓ {table}: {changed} rows canonicalized")
+
+
+def migrate(batch_size: int = 500, pause: float = 0.1):
+    print("Starting skill dictionary migration...")
+
+    print("\n1. Creating tables...")
+    create_tables()
+
+    print("\n2. Seeding aliases...")
+    seed_aliases()
+
+    for step, (table, columns, extra_set) in enumerate(TARGETS, start=3):
+        print(f"\n{step}. Canonicalizing {table}...")
+        canonicalize_table(table, columns, extra_set, batch_size, pause)
+
+    print(f"\n✓ Migration completed successfully! ({len(skill_dictionary)} skills)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create the skill dictionary and canonicalize skill lists")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per batch")
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+
+    migrate(batch_size=args.batch_size, pause=args.pause)
@@ -0,0 +1,20 @@
+-- Migration: Create skill_embeddings table
+-- Date: 2026-10-16
+-- Purpose: Store one vector per normalized skill so user/job skill vectors are composed without model calls
+-- =====================================================
+-- STEP 1: Create skill vocabulary table
+-- =====================================================
+CREATE TABLE IF NOT EXISTS skill_embeddings (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,  -- Lower case, single-spaced skill name
+    embedding BLOB NOT NULL,  -- Packed float32 vector (768 * 4 bytes)
+    embedding_version VARCHAR(100) NOT NULL,  -- Model that produced the vector
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE INDEX ix_skill_embeddings_name (name)
+);
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Vocabulary size per model version
+-- SELECT embedding_version, COUNT(*) FROM skill_embeddings GROUP BY embedding_version;
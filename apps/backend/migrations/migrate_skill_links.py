@@ -0,0 +1,98 @@
+"""
+Database Migration Script for Green Matchers
+Creates and fills the job_skills and career_skills skill indexes
+
+Run from the repository root, after migrate_skill_dictionary:
+    python -m apps.backend.migrations.migrate_skill_links
+
+Rebuilds each item's (item, skill id) rows from its required_skills in
+keyset-paginated batches. Safe to re-run: rows are replaced per item.
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy import text
+
+from apps.backend.db.base import Base
+from apps.backend.db.session import engine
+from apps.backend.models.skill import CareerSkill, JobSkill
+from apps.backend.services.skill_dictionary import skill_dictionary
+
+# (source table, link table, link item column)
+TARGETS = (
+    ("jobs", "job_skills", "job_id"),
+    ("careers", "career_skills", "career_id"),
+)
+
+
+def create_tables():
+    """Create job_skills and career_skills if they do not exist."""
+    Base.metadata.create_all(bind=engine, tables=[JobSkill.__table__, CareerSkill.__table__])
+    print("  ✓ job_skills and career_skills tables ready")
+
+
+def fill_links(table: str, link_table: str, item_column: str, batch_size: int, pause: float):
+    """Rebuild one link table from the source table's required_skills."""
+    last_id = 0
+    links = 0
+
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(f"SELECT id, required_skills FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit"),
+                {"last_id": last_id, "limit": batch_size}
+            ).fetchall()
+
+        if not rows:
+            break
+
+        mappings = []
+        for item_id, raw in rows:
+            skills = json.loads(raw) if isinstance(raw, (bytes, str)) else raw
+            if not isinstance(skills, list):
+                continue
+            ids = skill_dictionary.stored_ids(skill_dictionary.intern(skills))
+            mappings.extend({"item_id": item_id, "skill_id": skill_id} for skill_id in set(ids.values()))
+
+        with engine.begin() as conn:
+            conn.execute(
+                text(f"DELETE FROM {link_table} WHERE {item_column} > :first AND {item_column} <= :last"),
+                {"first": last_id, "last": rows[-1][0]}
+            )
+            if mappings:
+                conn.execute(
+                    text(f"INSERT INTO {link_table} ({item_column}, skill_id) VALUES (:item_id, :skill_id)"),
+                    mappings
+                )
+        links += len(mappings)
+
+        last_id = rows[-1][0]
+        print(f"  … {link_table}: up to {table} id {last_id} ({links} rows)")
+
+        if pause:
+            time.sleep(pause)
+
+    print(f"  ✓ {link_table}: {links} rows")
+
+
+def migrate(batch_size: int = 500, pause: float = 0.1):
+    print("Starting skill index migration...")
+
+    print("\n1. Creating tables...")
+    create_tables()
+
+    for step, (table, link_table, item_column) in enumerate(TARGETS, start=2):
+        print(f"\n{step}. Filling {link_table}...")
+        fill_links(table, link_table, item_column, batch_size, pause)
+
+    print("\n✓ Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create and fill the job_skills and career_skills tables")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per batch")
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+
+    migrate(batch_size=args.batch_size, pause=args.pause)
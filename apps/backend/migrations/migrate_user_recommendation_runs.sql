@@ -0,0 +1,41 @@
+-- Migration: Add recommendation run markers and one row per recommended item
+-- Date: 2026-10-16
+-- Purpose: Cache empty recommendation results and stop concurrent recomputes from storing duplicate items
+-- =====================================================
+-- STEP 1: Run markers (one per user and item type, written by every recompute)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS user_recommendation_runs (
+    user_id INT NOT NULL,
+    item_type ENUM('CAREER', 'JOB') NOT NULL,
+    computed_at DATETIME NOT NULL,
+    PRIMARY KEY (user_id, item_type),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+-- =====================================================
+-- STEP 2: Drop duplicate items left by concurrent recomputes (keep the first row)
+-- =====================================================
+DELETE duplicate FROM user_recommendations duplicate
+JOIN user_recommendations kept
+  ON kept.user_id = duplicate.user_id
+ AND kept.item_type = duplicate.item_type
+ AND kept.item_id = duplicate.item_id
+ AND kept.id < duplicate.id;
+ALTER TABLE user_recommendations
+ADD CONSTRAINT uq_user_recommendations_item UNIQUE (user_id, item_type, item_id);
+-- =====================================================
+-- STEP 3: Markers for recommendations already stored
+-- =====================================================
+INSERT IGNORE INTO user_recommendation_runs (user_id, item_type, computed_at)
+SELECT user_id, item_type, MIN(computed_at)
+FROM user_recommendations
+GROUP BY user_id, item_type;
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Should return no rows
+-- SELECT user_id, item_type, item_id, COUNT(*) FROM user_recommendations GROUP BY user_id, item_type, item_id HAVING COUNT(*) > 1;
+--
+-- Users with a cached empty result
+-- SELECT r.item_type, COUNT(*) FROM user_recommendation_runs r
+-- LEFT JOIN user_recommendations u ON u.user_id = r.user_id AND u.item_type = r.item_type
+-- WHERE u.id IS NULL GROUP BY r.item_type;
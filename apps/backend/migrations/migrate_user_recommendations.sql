@@ -0,0 +1,24 @@
+-- Migration: Create user_recommendations table
+-- Date: 2026-10-16
+-- Purpose: Store precomputed top-k career and job recommendations per job seeker (scripts/compute_recommendations.py)
+-- =====================================================
+-- STEP 1: Create recommendations table
+-- =====================================================
+CREATE TABLE IF NOT EXISTS user_recommendations (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    item_type ENUM('CAREER', 'JOB') NOT NULL,
+    item_id INT NOT NULL,  -- careers.id or jobs.id
+    `rank` INT NOT NULL,  -- 1 = best
+    score FLOAT NOT NULL,
+    matched_skills JSON,
+    missing_skills JSON,
+    computed_at DATETIME NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_user_recommendations_lookup (user_id, item_type, `rank`)
+);
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Rows per type and the age of the last batch run
+-- SELECT item_type, COUNT(*), MIN(computed_at), MAX(computed_at) FROM user_recommendations GROUP BY item_type;
@@ -0,0 +1,16 @@
+-- Migration: Add skill_embedding to users
+-- Date: 2026-10-16
+-- Purpose: Store each user's composed skill vector so matching does not re-encode skills on every request
+-- =====================================================
+-- STEP 1: Add skill vector columns
+-- =====================================================
+ALTER TABLE users
+ADD COLUMN skill_embedding BLOB NULL;
+ALTER TABLE users
+ADD COLUMN skill_embedding_version VARCHAR(100) NULL;
+-- Existing users get their vector on the next profile update or recommendation request
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+-- Users with skills but no stored vector yet
+-- SELECT COUNT(*) FROM users WHERE skills IS NOT NULL AND skill_embedding IS NULL;
@@ -12,6 +12,9 @@ from .notification import Notification
 from .browse_history import BrowseHistory
 from .resume import Resume
 from .user_skill import UserSkill
+from .skill import Skill, SkillAlias, JobSkill, CareerSkill
+from .skill_embedding import SkillEmbedding
+from .user_recommendation import UserRecommendation, UserRecommendationRun, RecommendationType
 
 __all__ = [
     "User",
@@ -27,4 +30,12 @@ __all__ = [
     "BrowseHistory",
     "Resume",
     "UserSkill",
+    "Skill",
+    "SkillAlias",
+    "JobSkill",
+    "CareerSkill",
+    "SkillEmbedding",
+    "UserRecommendation",
+    "UserRecommendationRun",
+    "RecommendationType",
 ]
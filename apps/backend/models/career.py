@@ -1,10 +1,11 @@
 """
 Green Matchers - Career Model
 """
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, JSON, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, JSON, Boolean, LargeBinary, Index
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime, timezone
 from apps.backend.db.base import Base
+from apps.backend.core.sdg import sdg_mask
 
 
 class Career(Base):
@@ -21,6 +22,7 @@ class Career(Base):
     
     # SDG (Sustainable Development Goals) tags
     sdg_tags = Column(JSON, nullable=False, default=[])  # Array of SDG goal numbers [7, 8, 13]
+    sdg_mask = Column(Integer, nullable=False, default=0, index=True)  # Bit n-1 set for SDG n; kept in sync with sdg_tags
     
     # Salary information
     avg_salary_min = Column(Integer, nullable=True)
@@ -35,8 +37,9 @@ class Career(Base):
     
     # Vector embedding for semantic search (768-dim from all-mpnet-base-v2)
     # Note: MariaDB 10.11+ supports VECTOR type
-    # TODO: migrate to VECTOR / JSONB when DB supports native embeddings
-    embedding = Column(String(5000), nullable=True)  # Store as JSON string for compatibility
+    # Packed little-endian float32 (3072 bytes); see EmbeddingService.vector_to_bytes
+    embedding = Column(LargeBinary, nullable=True)  # Binary storage for vector
+    embedding_version = Column(String(100), nullable=True)  # EmbeddingService.get_embedding_version()
     
     # Active status - allows soft deletion and enabling/disabling careers
     is_active = Column(Boolean, default=True, nullable=False)
@@ -52,6 +55,19 @@ class Career(Base):
     # Relationships
     jobs = relationship("Job", back_populates="career", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyword search with KEYWORD_SEARCH_BACKEND=fulltext (MATCH ... AGAINST)
+        Index(
+            "ft_careers_text", "title", "description",
+            mysql_prefix="FULLTEXT", mariadb_prefix="FULLTEXT"
+        ).ddl_if(dialect=("mysql", "mariadb")),
+    )
+
+    @validates("sdg_tags")
+    def _sync_sdg_mask(self, key, tags):
+        self.sdg_mask = sdg_mask(tags)
+        return tags
+
     def __repr__(self):
         return f"<Career(id={self.id}, title={self.title})>"
 
@@ -1,10 +1,11 @@
 """
 Green Matchers - Job Model
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, LargeBinary, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime, timezone
 from apps.backend.db.base import Base
+from apps.backend.core.sdg import sdg_mask
 import enum
 
 
@@ -50,6 +51,7 @@ class Job(Base):
     
     # SDG (Sustainable Development Goals) tags
     sdg_tags = Column(JSON, nullable=False, default=[])  # Array of SDG goal numbers
+    sdg_mask = Column(Integer, nullable=False, default=0)  # Bit n-1 set for SDG n; kept in sync with sdg_tags
     
     # Active status
     is_active = Column(Boolean, default=True)
@@ -61,15 +63,17 @@ class Job(Base):
     is_verified = Column(Boolean, default=False)
     
     # Vector embedding for semantic search (768-dim from all-mpnet-base-v2)
-    # TODO: migrate to VECTOR / JSONB when DB supports native embeddings
-    embedding = Column(String(5000), nullable=True)  # Store as JSON string for compatibility
+    # Packed little-endian float32 (3072 bytes); see EmbeddingService.vector_to_bytes
+    embedding = Column(LargeBinary, nullable=True)  # Binary storage for vector
+    embedding_version = Column(String(100), nullable=True)  # EmbeddingService.get_embedding_version()
     
     # Timestamps
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
         default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc)
+        onupdate=lambda: datetime.now(timezone.utc),
+        index=True  # Polled by the job index sync
     )
 
     # Relationships
@@ -79,5 +83,20 @@ class Job(Base):
     saved_by = relationship("SavedJob", back_populates="job", cascade="all, delete-orphan")
     viewers = relationship("BrowseHistory", back_populates="job", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Public listings filter on verified + status; the SDG bit test is evaluated in the index
+        Index("idx_jobs_public_sdg", "is_verified", "status", "sdg_mask"),
+        # Keyword search with KEYWORD_SEARCH_BACKEND=fulltext (MATCH ... AGAINST)
+        Index(
+            "ft_jobs_text", "title", "description", "requirements",
+            mysql_prefix="FULLTEXT", mariadb_prefix="FULLTEXT"
+        ).ddl_if(dialect=("mysql", "mariadb")),
+    )
+
+    @validates("sdg_tags")
+    def _sync_sdg_mask(self, key, tags):
+        self.sdg_mask = sdg_mask(tags)
+        return tags
+
     def __repr__(self):
         return f"<Job(id={self.id}, title={self.title}, employer_id={self.employer_id})>"
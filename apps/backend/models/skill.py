@@ -0,0 +1,69 @@
+"""
+Green Matchers - Skill Dictionary Models
+Canonical skill names with integer ids, plus aliases that resolve to them
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from apps.backend.db.base import Base
+
+
+class Skill(Base):
+    """
+    Canonical skill.
+    Skill lists on users, jobs and careers store these names; overlap is computed on the ids.
+    """
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False, unique=True, index=True)  # Lower case, single-spaced
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    aliases = relationship("SkillAlias", back_populates="skill", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<Skill(id={self.id}, name={self.name})>"
+
+
+class SkillAlias(Base):
+    """Alternative spelling of a skill (e.g. "js" for "javascript")."""
+    __tablename__ = "skill_aliases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    alias = Column(String(255), nullable=False, unique=True, index=True)  # Normalized like Skill.name
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    skill = relationship("Skill", back_populates="aliases")
+
+    def __repr__(self):
+        return f"<SkillAlias(alias={self.alias}, skill_id={self.skill_id})>"
+
+
+class JobSkill(Base):
+    """Required skill of a job; mirrors Job.required_skills for indexed skill filters."""
+    __tablename__ = "job_skills"
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("idx_job_skills_skill_job", "skill_id", "job_id"),
+    )
+
+    def __repr__(self):
+        return f"<JobSkill(job_id={self.job_id}, skill_id={self.skill_id})>"
+
+
+class CareerSkill(Base):
+    """Required skill of a career; mirrors Career.required_skills for indexed skill filters."""
+    __tablename__ = "career_skills"
+
+    career_id = Column(Integer, ForeignKey("careers.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("idx_career_skills_skill_career", "skill_id", "career_id"),
+    )
+
+    def __repr__(self):
+        return f"<CareerSkill(career_id={self.career_id}, skill_id={self.skill_id})>"
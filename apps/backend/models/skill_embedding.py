@@ -0,0 +1,25 @@
+"""
+Green Matchers - Skill Embedding Model
+Stores one embedding per normalized skill name
+"""
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary
+from datetime import datetime
+from apps.backend.db.base import Base
+
+
+class SkillEmbedding(Base):
+    """
+    Skill vocabulary vectors.
+    Each skill is encoded once; user and job skill vectors are composed from these rows.
+    """
+    __tablename__ = "skill_embeddings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False, unique=True, index=True)  # normalize_skill() output
+    embedding = Column(LargeBinary, nullable=False)  # Packed float32 vector
+    embedding_version = Column(String(100), nullable=False)  # EmbeddingService.get_embedding_version()
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SkillEmbedding(id={self.id}, name={self.name})>"
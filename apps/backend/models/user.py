@@ -1,7 +1,7 @@
 """
 Green Matchers - User Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, JSON, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from apps.backend.db.base import Base
@@ -29,6 +29,8 @@ class User(Base):
     
     # Job seeker specific fields
     skills = Column(JSON, nullable=True)  # Array of skill strings
+    skill_embedding = Column(LargeBinary, nullable=True)  # Composed skill vector, refreshed when skills change
+    skill_embedding_version = Column(String(100), nullable=True)  # EmbeddingService.get_embedding_version()
     resume_url = Column(String(500), nullable=True)
     language = Column(String(10), default="en")  # Preferred language
     
@@ -0,0 +1,58 @@
+"""
+Green Matchers - User Recommendation Model
+Precomputed career and job recommendations per job seeker
+"""
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, JSON, Index, UniqueConstraint, Enum as SQLEnum
+from datetime import datetime
+from apps.backend.db.base import Base
+import enum
+
+
+class RecommendationType(str, enum.Enum):
+    """Kind of recommended item."""
+    CAREER = "career"
+    JOB = "job"
+
+
+class UserRecommendation(Base):
+    """
+    One ranked recommendation for a user.
+    Rows for a (user, item_type) pair are replaced together by the batch scorer.
+    """
+    __tablename__ = "user_recommendations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    item_type = Column(SQLEnum(RecommendationType), nullable=False)
+    item_id = Column(Integer, nullable=False)  # careers.id or jobs.id
+    rank = Column(Integer, nullable=False)  # 1 = best
+    score = Column(Float, nullable=False)  # Cosine similarity
+    matched_skills = Column(JSON, nullable=True)
+    missing_skills = Column(JSON, nullable=True)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Dashboard reads: WHERE user_id = ? AND item_type = ? ORDER BY rank
+    __table_args__ = (
+        Index('idx_user_recommendations_lookup', 'user_id', 'item_type', 'rank'),
+        # Concurrent recomputes for one user cannot both store their rows
+        UniqueConstraint('user_id', 'item_type', 'item_id', name='uq_user_recommendations_item'),
+    )
+
+    def __repr__(self):
+        return f"<UserRecommendation(user_id={self.user_id}, {self.item_type.value}={self.item_id}, rank={self.rank})>"
+
+
+class UserRecommendationRun(Base):
+    """
+    When a user's recommendations of one type were last computed.
+    Written with every recompute, even one that stored no rows, so an empty
+    result is served from the store until it goes stale.
+    """
+    __tablename__ = "user_recommendation_runs"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    item_type = Column(SQLEnum(RecommendationType), primary_key=True)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<UserRecommendationRun(user_id={self.user_id}, {self.item_type.value}, at={self.computed_at})>"
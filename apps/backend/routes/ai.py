@@ -10,6 +10,8 @@ from apps.backend.core.deps import DatabaseSession, get_current_user
 from apps.backend.models.job import Job
 from apps.backend.models.career import Career
 from apps.backend.models.user import User
+from apps.backend.services.ai.skill_overlap import SkillIncidence, compare_skills
+from apps.backend.services.skill_dictionary import skill_dictionary
 
 router = APIRouter(prefix="/ai", tags=["AI"])
 
@@ -24,21 +26,21 @@ def get_job_recommendations(
     Get personalized job recommendations based on user profile.
     """
     recommendations = []
-    user_skills = [s.lower() for s in (current_user.skills or [])]
     jobs = (
         db.query(Job)
         .options(joinedload(Job.employer))
         .filter(Job.is_verified == True)
         .limit(limit * 2)
         .all()
-    )
+    )[:limit]
+    
+    incidence = SkillIncidence([job.required_skills for job in jobs])
+    covered = incidence.coverage(current_user.skills)
+    match_scores = incidence.matched_counts(covered) / incidence.row_sizes.clip(min=1) * 100
     
-    for job in jobs[:limit]:
-        job_skills = [s.lower() for s in (job.required_skills or [])]
-        if job_skills:
-            match_score = len(set(user_skills) & set(job_skills)) / len(job_skills) * 100
-        else:
-            match_score = 0.0
+    for row, job in enumerate(jobs):
+        matched_skills, _ = incidence.overlap(covered, row)
+        match_score = float(match_scores[row])
         
         recommendations.append({
             "job_id": job.id,
@@ -47,7 +49,7 @@ def get_job_recommendations(
             "company_name": job.employer.company_name if job.employer else None,
             "location": job.location,
             "salary_range": f"{job.salary_min}-{job.salary_max}" if job.salary_min and job.salary_max else None,
-            "matched_skills": list(set(user_skills) & set(job_skills)),
+            "matched_skills": matched_skills,
             "reason": "Based on your skills and experience"
         })
     
@@ -65,19 +67,19 @@ def get_career_recommendations(
     """
     Get career path recommendations based on user skills.
     """
-    user_skills = [s.lower() for s in (current_user.skills or [])]
+    user_skills = current_user.skills or []
     if skills:
-        user_skills = [s.strip().lower() for s in skills.split(",")]
+        user_skills = skills.split(",")
+    
+    careers = db.query(Career).limit(limit * 2).all()[:limit]
     
-    all_careers = db.query(Career).limit(limit * 2).all()
+    incidence = SkillIncidence([career.required_skills for career in careers])
+    matched_counts = incidence.matched_counts(incidence.coverage(user_skills))
+    match_scores = matched_counts / incidence.row_sizes.clip(min=1) * 100
     
     recommendations = []
-    for career in all_careers[:limit]:
-        career_skills = [s.lower() for s in (career.required_skills or [])]
-        if career_skills:
-            match_score = len(set(user_skills) & set(career_skills)) / len(career_skills) * 100
-        else:
-            match_score = 0.0
+    for row, career in enumerate(careers):
+        match_score = float(match_scores[row])
         
         recommendations.append({
             "career_id": career.id,
@@ -86,7 +88,7 @@ def get_career_recommendations(
             "growth_potential": career.growth_potential,
             "demand_score": career.demand_score,
             "avg_salary": career.avg_salary or career.avg_salary_min,
-            "reason": f"Matches {len(set(user_skills) & set(career_skills))} of your skills"
+            "reason": f"Matches {int(matched_counts[row])} of your skills"
         })
     
     recommendations.sort(key=lambda x: x['match_score'], reverse=True)
@@ -111,13 +113,10 @@ def match_skills_to_job(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    user_skills = [s.lower() for s in (current_user.skills or [])]
-    job_skills = [s.lower() for s in (job.required_skills or [])]
-    matched_skills = list(set(user_skills) & set(job_skills))
-    missing_skills = list(set(job_skills) - set(user_skills))
+    matched_skills, missing_skills = compare_skills(current_user.skills, job.required_skills)
     
-    if job_skills:
-        match_percentage = len(matched_skills) / len(job_skills) * 100
+    if matched_skills or missing_skills:
+        match_percentage = len(matched_skills) / (len(matched_skills) + len(missing_skills)) * 100
     else:
         match_percentage = 0.0
     
@@ -149,9 +148,7 @@ def analyze_skill_gap(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    user_skills = set([s.lower() for s in (current_user.skills or [])])
-    job_skills = set([s.lower() for s in (job.required_skills or [])])
-    missing_skills = list(job_skills - user_skills)
+    _, missing_skills = compare_skills(current_user.skills, job.required_skills)
     
     learning_suggestions = []
     for skill in missing_skills:
@@ -181,9 +178,7 @@ def get_learning_path(
     if not career:
         raise HTTPException(status_code=404, detail="Career not found")
     
-    user_skills = set([s.lower() for s in (current_user.skills or [])])
-    required_skills = set([s.lower() for s in (career.required_skills or [])])
-    missing_skills = list(required_skills - user_skills)
+    _, missing_skills = compare_skills(current_user.skills, career.required_skills)
     
     path = []
     for i, skill in enumerate(missing_skills):
@@ -410,13 +405,17 @@ def update_skills_from_resume(
         Dict: Updated skills and confirmation
     """
     from apps.backend.services.ai.resume import resume_service
+    from apps.backend.services.ai.recommendations import recommendation_service
+    from apps.backend.services.ai.skill_vectors import refresh_user_skill_embedding
     
     # Extract skills from resume text
     extracted = resume_service.extract_skills_from_text(resume_text)
     
     # Update user's skills
     if extracted.all_skills:
-        current_user.skills = extracted.all_skills
+        current_user.skills = skill_dictionary.intern(extracted.all_skills)
+        refresh_user_skill_embedding(current_user)
+        recommendation_service.invalidate(db, current_user.id)
         db.commit()
         db.refresh(current_user)
     
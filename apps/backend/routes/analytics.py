@@ -21,32 +21,12 @@ from apps.backend.schemas.analytics import (
     AnalyticsOverview,
     AnalyticsResponse
 )
+from apps.backend.services.skill_dictionary import skill_dictionary
+from apps.backend.core.sdg import SDG_GOALS, sdg_count_columns
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
 
-# SDG Goals mapping
-SDG_GOALS = {
-    1: "No Poverty",
-    2: "Zero Hunger",
-    3: "Good Health and Well-being",
-    4: "Quality Education",
-    5: "Gender Equality",
-    6: "Clean Water and Sanitation",
-    7: "Affordable and Clean Energy",
-    8: "Decent Work and Economic Growth",
-    9: "Industry, Innovation and Infrastructure",
-    10: "Reduced Inequalities",
-    11: "Sustainable Cities and Communities",
-    12: "Responsible Consumption and Production",
-    13: "Climate Action",
-    14: "Life Below Water",
-    15: "Life on Land",
-    16: "Peace, Justice and Strong Institutions",
-    17: "Partnerships for the Goals"
-}
-
-
 @router.get("/overview", response_model=AnalyticsOverview)
 def get_analytics_overview(
     db: Session = Depends(get_db),
@@ -141,10 +121,8 @@ def get_skill_popularity(
     for user in users:
         if user.skills:
             skills = user.skills if isinstance(user.skills, list) else user.skills.split(",")
-            for skill in skills:
-                skill = skill.strip().lower()
-                if skill:
-                    skill_counts[skill] = skill_counts.get(skill, 0) + 1
+            for skill in skill_dictionary.canonicalize(skills):
+                skill_counts[skill] = skill_counts.get(skill, 0) + 1
     
     # Convert to list and determine trends
     results = []
@@ -229,17 +207,12 @@ def get_sdg_distribution(
     """
     Get SDG goal distribution across all verified jobs.
     """
-    jobs = db.query(Job).filter(
+    count_columns = sdg_count_columns(Job.sdg_mask)
+    row = db.query(*count_columns.values()).filter(
         Job.is_verified == True,
-        Job.sdg_tags.isnot(None)
-    ).all()
-    sdg_counts = {}
-    
-    for job in jobs:
-        if job.sdg_tags:
-            tags = job.sdg_tags if isinstance(job.sdg_tags, list) else []
-            for tag in tags:
-                sdg_counts[tag] = sdg_counts.get(tag, 0) + 1
+        Job.sdg_mask != 0
+    ).one()
+    sdg_counts = {goal: int(count) for goal, count in zip(count_columns, row) if count}
     
     total = sum(sdg_counts.values()) or 1
     results = []
@@ -8,6 +8,10 @@ from apps.backend.core.deps import DatabaseSession, get_current_user
 from apps.backend.models.career import Career
 from apps.backend.models.user import User
 from apps.backend.schemas.career import CareerCreate, CareerUpdate, CareerResponse, CareerDetailResponse
+from apps.backend.services.skill_dictionary import skill_dictionary
+from apps.backend.services.skill_index import filter_careers_by_skills, set_career_skills
+from apps.backend.core.sdg import has_sdg
+from apps.backend.services.ai.keyword_index import career_keyword_index, keyword_search
 
 router = APIRouter()
 
@@ -27,17 +31,19 @@ def list_careers(
     query = db.query(Career)
     
     # Apply filters
-    if search:
-        query = query.filter(Career.title.contains(search) | Career.description.contains(search))
     if sdg_tag:
-        # Filter by SDG tag (stored as JSON)
-        query = query.filter(Career.sdg_tags.contains([sdg_tag]))
+        # Filter by SDG goal bit
+        query = query.filter(has_sdg(Career.sdg_mask, sdg_tag))
     if skill:
         # Filter by skill (stored as JSON)
-        query = query.filter(Career.required_skills.contains([skill]))
+        query = filter_careers_by_skills(db, query, [skill])
+    relevance = None
+    if search:
+        # Last, so only careers passing every other filter are ranked
+        query, relevance, _ = keyword_search(db, query, career_keyword_index, Career, search, window=skip + limit)
     
-    # Order by demand score (highest first)
-    query = query.order_by(Career.demand_score.desc())
+    # Order by keyword relevance, or by demand score (highest first)
+    query = query.order_by(relevance if relevance is not None else Career.demand_score.desc())
     
     # Apply pagination
     careers = query.offset(skip).limit(limit).all()
@@ -95,7 +101,7 @@ def create_career(
     new_career = Career(
         title=career_data.title,
         description=career_data.description,
-        required_skills=career_data.required_skills,
+        required_skills=skill_dictionary.intern(career_data.required_skills),
         sdg_tags=career_data.sdg_tags,
         avg_salary_min=career_data.avg_salary_min,
         avg_salary_max=career_data.avg_salary_max,
@@ -103,8 +109,10 @@ def create_career(
     )
     
     db.add(new_career)
+    set_career_skills(db, new_career)
     db.commit()
     db.refresh(new_career)
+    career_keyword_index.upsert_item(new_career)
     
     return new_career
 
@@ -139,7 +147,8 @@ def update_career(
     if career_update.description is not None:
         career.description = career_update.description
     if career_update.required_skills is not None:
-        career.required_skills = career_update.required_skills
+        career.required_skills = skill_dictionary.intern(career_update.required_skills)
+        set_career_skills(db, career)
     if career_update.sdg_tags is not None:
         career.sdg_tags = career_update.sdg_tags
     if career_update.avg_salary_min is not None:
@@ -151,6 +160,7 @@ def update_career(
     
     db.commit()
     db.refresh(career)
+    career_keyword_index.upsert_item(career)
     
     return career
 
@@ -180,5 +190,6 @@ def delete_career(
     
     db.delete(career)
     db.commit()
+    career_keyword_index.remove(career_id)
     
     return None
@@ -9,6 +9,11 @@ from apps.backend.models.job import Job, JobStatus
 from apps.backend.models.user import User, UserRole
 from apps.backend.models.application import Application
 from apps.backend.schemas.job import JobCreate, JobUpdate, JobResponse, JobDetailResponse
+from apps.backend.services.ai.index_sync import job_index_sync
+from apps.backend.services.ai.keyword_index import job_keyword_index, keyword_search
+from apps.backend.services.skill_dictionary import skill_dictionary
+from apps.backend.services.skill_index import set_job_skills
+from apps.backend.core.sdg import has_sdg
 router = APIRouter()
 
 
@@ -34,8 +39,6 @@ def list_jobs(
     query = query.filter(Job.is_verified == True, Job.status == JobStatus.OPEN)
     
     # Apply filters
-    if search:
-        query = query.filter(Job.title.ilike(f"%{search}%") | Job.description.ilike(f"%{search}%"))
     if career_id:
         query = query.filter(Job.career_id == career_id)
     if location:
@@ -45,11 +48,15 @@ def list_jobs(
     if salary_max:
         query = query.filter(Job.salary_max <= salary_max)
     if sdg_tag:
-        # Filter by SDG tag (stored as ARRAY)
-        query = query.filter(Job.sdg_tags.any(sdg_tag))
+        # Filter by SDG goal bit
+        query = query.filter(has_sdg(Job.sdg_mask, sdg_tag))
+    relevance = None
+    if search:
+        # Last, so only jobs passing every other filter are ranked
+        query, relevance, _ = keyword_search(db, query, job_keyword_index, Job, search, window=skip + limit)
     
-    # Order by creation date (newest first)
-    query = query.order_by(Job.created_at.desc())
+    # Order by keyword relevance, or by creation date (newest first)
+    query = query.order_by(relevance if relevance is not None else Job.created_at.desc())
     
     # Apply pagination
     jobs = query.offset(skip).limit(limit).all()
@@ -143,13 +150,19 @@ def create_job(
             salary_max=job_data.salary_max,
             location=job_data.location,
             sdg_tags=job_data.sdg_tags,
+            required_skills=skill_dictionary.intern(job_data.required_skills),
+            preferred_skills=skill_dictionary.intern(job_data.preferred_skills),
             is_verified=False
         )
 
         db.add(new_job)
+        set_job_skills(db, new_job)
         db.commit()
         db.refresh(new_job)
 
+        # Embed in the background so the job is searchable as soon as it is verified and open
+        job_index_sync.notify(new_job.id, reembed=True)
+
         return new_job
 
     except Exception as e:
@@ -199,11 +212,19 @@ def update_job(
         )
 
     # Update fields dynamically
-    for field, value in job_data.dict(exclude_unset=True).items():
+    updates = job_data.dict(exclude_unset=True)
+    for field in ("required_skills", "preferred_skills"):
+        if updates.get(field) is not None:
+            updates[field] = skill_dictionary.intern(updates[field])
+    for field, value in updates.items():
         setattr(job, field, value)
+    if "required_skills" in updates:
+        set_job_skills(db, job)
 
     db.commit()
     db.refresh(job)
+
+    job_index_sync.notify(job.id, reembed=True)
     return job
 
 
@@ -233,6 +254,8 @@ def delete_job(
     db.delete(job)
     db.commit()
 
+    job_index_sync.notify(job_id)
+
 
 @router.put("/{job_id}/verify", response_model=JobResponse)
 def verify_job(
@@ -262,6 +285,8 @@ def verify_job(
     db.commit()
     db.refresh(job)
 
+    job_index_sync.notify(job.id)
+
     return job
 
 
@@ -316,6 +341,8 @@ def publish_job(
     db.commit()
     db.refresh(job)
 
+    job_index_sync.notify(job.id)
+
     return job
 
 
@@ -353,6 +380,8 @@ def close_job(
     db.commit()
     db.refresh(job)
 
+    job_index_sync.notify(job.id)
+
     return job
 
 
@@ -390,4 +419,6 @@ def archive_job(
     db.commit()
     db.refresh(job)
 
+    job_index_sync.notify(job.id)
+
     return job
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/preferences", tags=["Preferences"])
 
 
 @router.post("/saved-jobs/{job_id}")
-async def save_job(
+def save_job(
     job_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -42,7 +42,7 @@ async def save_job(
 
 
 @router.delete("/saved-jobs/{job_id}")
-async def unsave_job(
+def unsave_job(
     job_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -61,7 +61,7 @@ async def unsave_job(
 
 
 @router.post("/saved-jobs/check/{job_id}")
-async def check_job_saved(
+def check_job_saved(
     job_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -74,7 +74,7 @@ async def check_job_saved(
 
 
 @router.get("/saved-jobs")
-async def get_saved_jobs(
+def get_saved_jobs(
     db: DatabaseSession,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -98,7 +98,7 @@ async def get_saved_jobs(
 
 
 @router.post("/job-alerts")
-async def create_job_alert(
+def create_job_alert(
     alert_data: dict,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -127,7 +127,7 @@ async def create_job_alert(
 
 
 @router.get("/job-alerts")
-async def get_job_alerts(
+def get_job_alerts(
     db: DatabaseSession,
     is_active: Optional[bool] = None,
     current_user: User = Depends(get_current_user)
@@ -143,7 +143,7 @@ async def get_job_alerts(
 
 
 @router.delete("/job-alerts/{alert_id}")
-async def delete_job_alert(
+def delete_job_alert(
     alert_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -162,7 +162,7 @@ async def delete_job_alert(
 
 
 @router.post("/browse-history/{job_id}")
-async def add_to_browse_history(
+def add_to_browse_history(
     job_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -186,7 +186,7 @@ async def add_to_browse_history(
 
 
 @router.get("/browse-history")
-async def get_browse_history(
+def get_browse_history(
     db: DatabaseSession,
     limit: int = 20,
     current_user: User = Depends(get_current_user)
@@ -206,7 +206,7 @@ async def get_browse_history(
 
 
 @router.delete("/browse-history")
-async def clear_browse_history(
+def clear_browse_history(
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
 ):
@@ -217,7 +217,7 @@ async def clear_browse_history(
 
 
 @router.get("/notifications")
-async def get_notifications(
+def get_notifications(
     db: DatabaseSession,
     unread_only: bool = False,
     page: int = 1,
@@ -242,7 +242,7 @@ async def get_notifications(
 
 
 @router.post("/notifications/{notification_id}/read")
-async def mark_notification_read(
+def mark_notification_read(
     notification_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -261,7 +261,7 @@ async def mark_notification_read(
 
 
 @router.delete("/notifications/{notification_id}")
-async def delete_notification(
+def delete_notification(
     notification_id: int,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
@@ -280,7 +280,7 @@ async def delete_notification(
 
 
 @router.get("/settings")
-async def get_user_settings(current_user: User = Depends(get_current_user)):
+def get_user_settings(current_user: User = Depends(get_current_user)):
     """Get user preferences and settings."""
     return {
         "email_notifications": current_user.email_notifications,
@@ -294,7 +294,7 @@ async def get_user_settings(current_user: User = Depends(get_current_user)):
 
 
 @router.put("/settings")
-async def update_user_settings(
+def update_user_settings(
     settings: dict,
     db: DatabaseSession,
     current_user: User = Depends(get_current_user)
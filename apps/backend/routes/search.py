@@ -4,12 +4,13 @@ Advanced search functionality with filters, autocomplete, and full-text search
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
-from sqlalchemy import or_
 
 from apps.backend.core.deps import DatabaseSession, get_current_user
 from apps.backend.models.job import Job
 from apps.backend.models.career import Career
 from apps.backend.models.user import User
+from apps.backend.services.ai.keyword_index import career_keyword_index, job_keyword_index, keyword_search
+from apps.backend.services.skill_index import filter_careers_by_skills, filter_jobs_by_skills
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
@@ -25,7 +26,7 @@ def search_jobs(
     skills: Optional[str] = None,
     experience_level: Optional[str] = None,
     remote: Optional[bool] = None,
-    sort_by: Optional[str] = "created_at",
+    sort_by: Optional[str] = None,
     sort_order: Optional[str] = "desc",
     page: int = 1,
     limit: int = 20,
@@ -33,15 +34,12 @@ def search_jobs(
 ):
     """
     Advanced job search with multiple filters.
+    
+    With `q`, results are ranked by keyword relevance unless `sort_by` is
+    "created_at" or "salary".
     """
     query = db.query(Job).filter(Job.is_verified == True)
     
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            or_(Job.title.ilike(search_term), Job.description.ilike(search_term))
-        )
-    
     if location:
         query = query.filter(Job.location.ilike(f"%{location}%"))
     
@@ -54,8 +52,7 @@ def search_jobs(
         query = query.filter(Job.salary_max <= salary_max)
     
     if skills:
-        for skill in skills.split(","):
-            query = query.filter(Job.required_skills.contains([skill.strip()]))
+        query = filter_jobs_by_skills(db, query, skills.split(","))
     
     if experience_level:
         query = query.filter(Job.experience_level == experience_level)
@@ -63,14 +60,24 @@ def search_jobs(
     if remote is not None:
         query = query.filter(Job.is_remote == remote)
     
-    total = query.count()
+    # Last, so only jobs passing every other filter are ranked
+    relevance = total = None
+    if q:
+        # A relevance-ordered page only needs the matches up to its end
+        window = page * limit if sort_by in (None, "relevance") else None
+        query, relevance, total = keyword_search(db, query, job_keyword_index, Job, q, window=window)
+    
+    if total is None:
+        total = query.count()
     
     if sort_by == "salary":
         order_column = Job.salary_max
     else:
         order_column = Job.created_at
     
-    if sort_order == "asc":
+    if relevance is not None and sort_by in (None, "relevance"):
+        query = query.order_by(relevance)
+    elif sort_order == "asc":
         query = query.order_by(order_column.asc())
     else:
         query = query.order_by(order_column.desc())
@@ -90,7 +97,7 @@ def search_careers(
     db: DatabaseSession,
     q: Optional[str] = None,
     skills: Optional[str] = None,
-    sort_by: Optional[str] = "demand_score",
+    sort_by: Optional[str] = None,
     sort_order: Optional[str] = "desc",
     page: int = 1,
     limit: int = 20,
@@ -98,25 +105,33 @@ def search_careers(
 ):
     """
     Search careers with filters.
+    
+    With `q`, results are ranked by keyword relevance unless `sort_by` is
+    "demand_score".
     """
     query = db.query(Career)
     
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(or_(Career.title.ilike(search_term), Career.description.ilike(search_term)))
-    
     if skills:
-        for skill in skills.split(","):
-            query = query.filter(Career.required_skills.contains([skill.strip()]))
+        query = filter_careers_by_skills(db, query, skills.split(","))
+    
+    # Last, so only careers passing every other filter are ranked
+    relevance = total = None
+    if q:
+        # A relevance-ordered page only needs the matches up to its end
+        window = page * limit if sort_by in (None, "relevance") else None
+        query, relevance, total = keyword_search(db, query, career_keyword_index, Career, q, window=window)
     
-    total = query.count()
+    if total is None:
+        total = query.count()
     
     if sort_by == "demand_score":
         order_column = Career.demand_score
     else:
         order_column = Career.demand_score
     
-    if sort_order == "asc":
+    if relevance is not None and sort_by in (None, "relevance"):
+        query = query.order_by(relevance)
+    elif sort_order == "asc":
         query = query.order_by(order_column.asc())
     else:
         query = query.order_by(order_column.desc())
@@ -8,6 +8,10 @@ from apps.backend.core.deps import DatabaseSession, get_current_user
 from apps.backend.models.user import User
 from apps.backend.models.saved_job import SavedJob
 from apps.backend.schemas.user import UserResponse, UserUpdate, EmployerProfileUpdate, SkillsUpdate, UserPublicProfile
+from apps.backend.models.user_recommendation import RecommendationType
+from apps.backend.services.ai.recommendations import recommendation_service
+from apps.backend.services.ai.skill_vectors import refresh_user_skill_embedding
+from apps.backend.services.skill_dictionary import skill_dictionary
 
 router = APIRouter()
 
@@ -41,7 +45,9 @@ def update_current_user(
     if user_update.language is not None:
         current_user.language = user_update.language
     if user_update.skills is not None:
-        current_user.skills = user_update.skills
+        current_user.skills = skill_dictionary.intern(user_update.skills)
+        refresh_user_skill_embedding(current_user)
+        recommendation_service.invalidate(db, current_user.id)
     if user_update.resume_url is not None:
         current_user.resume_url = user_update.resume_url
     
@@ -92,7 +98,9 @@ def update_user_skills(
     """
     Update user skills.
     """
-    current_user.skills = skills_update.skills
+    current_user.skills = skill_dictionary.intern(skills_update.skills)
+    refresh_user_skill_embedding(current_user)
+    recommendation_service.invalidate(db, current_user.id)
     db.commit()
     db.refresh(current_user)
     
@@ -194,33 +202,31 @@ def get_career_recommendations(
 ):
     """
     Get career recommendations for the current user based on their skills.
-    """
-    from apps.backend.services.ai.matching import matching_service
-    from apps.backend.models.career import Career
     
-    # Get career recommendations
-    recommendations = matching_service.get_career_recommendations(db, current_user, limit=limit)
+    Served from precomputed recommendations; recomputed only when stale.
+    """
+    recommendations = recommendation_service.get_recommendations(
+        db, current_user, RecommendationType.CAREER, limit=limit
+    )
     
     # Format response to match frontend expectations
     formatted_recommendations = []
-    for rec in recommendations:
-        career = db.query(Career).filter(Career.id == rec["career_id"]).first()
-        if career:
-            formatted_recommendations.append({
-                "career": {
-                    "id": career.id,
-                    "title": career.title,
-                    "description": career.description,
-                    "required_skills": career.required_skills,
-                    "avg_salary_min": career.avg_salary_min,
-                    "avg_salary_max": career.avg_salary_max,
-                    "demand_score": career.demand_score,
-                    "sdg_tags": career.sdg_tags
-                },
-                "similarity_score": rec["similarity_score"],
-                "matched_skills": rec["matched_skills"],
-                "missing_skills": rec["missing_skills"]
-            })
+    for rec, career in recommendations:
+        formatted_recommendations.append({
+            "career": {
+                "id": career.id,
+                "title": career.title,
+                "description": career.description,
+                "required_skills": career.required_skills,
+                "avg_salary_min": career.avg_salary_min,
+                "avg_salary_max": career.avg_salary_max,
+                "demand_score": career.demand_score,
+                "sdg_tags": career.sdg_tags
+            },
+            "similarity_score": round(rec.score, 3),
+            "matched_skills": rec.matched_skills,
+            "missing_skills": rec.missing_skills
+        })
     
     return {"recommendations": formatted_recommendations}
 
@@ -233,33 +239,31 @@ def get_job_recommendations(
 ):
     """
     Get job recommendations for the current user based on their skills.
-    """
-    from apps.backend.services.ai.matching import matching_service
-    from apps.backend.models.job import Job
     
-    # Get job recommendations
-    recommendations = matching_service.get_job_recommendations(db, current_user, limit=limit)
+    Served from precomputed recommendations; recomputed only when stale.
+    """
+    recommendations = recommendation_service.get_recommendations(
+        db, current_user, RecommendationType.JOB, limit=limit
+    )
     
     # Format response to match frontend expectations
     formatted_recommendations = []
-    for rec in recommendations:
-        job = db.query(Job).filter(Job.id == rec["job_id"]).first()
-        if job:
-            formatted_recommendations.append({
-                "job": {
-                    "id": job.id,
-                    "title": job.title,
-                    "description": job.description,
-                    "company_name": job.company_name,
-                    "location": job.location,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "required_skills": job.required_skills,
-                    "sdg_tags": job.sdg_tags
-                },
-                "similarity_score": rec["similarity_score"],
-                "matched_skills": rec["matched_skills"],
-                "missing_skills": rec["missing_skills"]
-            })
+    for rec, job in recommendations:
+        formatted_recommendations.append({
+            "job": {
+                "id": job.id,
+                "title": job.title,
+                "description": job.description,
+                "company_name": job.company_name,
+                "location": job.location,
+                "salary_min": job.salary_min,
+                "salary_max": job.salary_max,
+                "required_skills": job.required_skills,
+                "sdg_tags": job.sdg_tags
+            },
+            "similarity_score": round(rec.score, 3),
+            "matched_skills": rec.matched_skills,
+            "missing_skills": rec.missing_skills
+        })
     
     return {"recommendations": formatted_recommendations}
@@ -17,6 +17,8 @@ class JobBase(BaseModel):
     salary_max: Optional[int] = Field(None, ge=0)
     location: Optional[str] = None
     sdg_tags: Optional[List[int]] = None
+    required_skills: Optional[List[str]] = None
+    preferred_skills: Optional[List[str]] = None
 
 
 # Job Create Schema
@@ -35,6 +37,8 @@ class JobUpdate(BaseModel):
     salary_max: Optional[int] = Field(None, ge=0)
     location: Optional[str] = None
     sdg_tags: Optional[List[int]] = None
+    required_skills: Optional[List[str]] = None
+    preferred_skills: Optional[List[str]] = None
     is_verified: Optional[bool] = None
 
 
@@ -51,6 +55,8 @@ class JobResponse(BaseModel):
     salary_max: Optional[int] = None
     location: Optional[str] = None
     sdg_tags: Optional[List[int]] = None
+    required_skills: Optional[List[str]] = None
+    preferred_skills: Optional[List[str]] = None
     is_verified: bool
     created_at: datetime
     updated_at: datetime
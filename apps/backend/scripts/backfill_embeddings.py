@@ -0,0 +1,70 @@
+"""
+Green Matchers - Embedding Backfill
+Embeds jobs and careers whose vectors are missing or from another model version.
+
+Usage:
+    python apps/backend/scripts/backfill_embeddings.py                  # resume from checkpoint
+    python apps/backend/scripts/backfill_embeddings.py --dry-run        # only count pending rows
+    python apps/backend/scripts/backfill_embeddings.py --tables careers --rate 0 --restart
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from apps.backend.core.config import settings
+from apps.backend.db.session import SessionLocal
+from apps.backend.services.ai.backfill import BACKFILL_TABLES, EmbeddingBackfill
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill missing or stale embeddings")
+    parser.add_argument("--tables", nargs="+", choices=list(BACKFILL_TABLES), default=list(BACKFILL_TABLES))
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BACKFILL_BATCH_SIZE)
+    parser.add_argument("--encode-batch-size", type=int, default=settings.EMBEDDING_BATCH_MAX_SIZE)
+    parser.add_argument("--rate", type=float, default=settings.EMBEDDING_BACKFILL_RATE,
+                        help="Max texts per second (0 = unlimited, for maintenance windows)")
+    parser.add_argument("--checkpoint", default=settings.EMBEDDING_BACKFILL_CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first id")
+    parser.add_argument("--dry-run", action="store_true", help="Only count rows that need embedding")
+    args = parser.parse_args()
+
+    backfill = EmbeddingBackfill(
+        batch_size=args.batch_size,
+        encode_batch_size=args.encode_batch_size,
+        rate_per_second=args.rate,
+        checkpoint_path=args.checkpoint
+    )
+
+    db = SessionLocal()
+    try:
+        pending = backfill.count_pending(db, args.tables)
+    finally:
+        db.close()
+
+    for table, count in pending.items():
+        print(f"📊 {table}: {count} rows need embedding")
+    if args.dry_run:
+        return
+
+    start = time.time()
+    try:
+        embedded = backfill.run(args.tables, resume=not args.restart)
+    except KeyboardInterrupt:
+        print("\n⏸️  Interrupted; rerun to resume from the checkpoint")
+        sys.exit(130)
+
+    if not embedded and any(pending.values()):
+        print("⚠️  Another process holds the backfill lock; try again later")
+        sys.exit(1)
+
+    for table, count in embedded.items():
+        print(f"✅ {table}: embedded {count} rows")
+    print(f"⏱️  Done in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
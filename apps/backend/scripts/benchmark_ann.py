@@ -0,0 +1,100 @@
+"""
+Green Matchers - ANN Recall Benchmark
+Measures recall@k and latency of the IVF vector index against exact search.
+
+Usage:
+    python apps/backend/scripts/benchmark_ann.py                 # job embeddings from the database
+    python apps/backend/scripts/benchmark_ann.py --synthetic 300000
+    python apps/backend/scripts/benchmark_ann.py --nprobe 4 8 16 32 --k 20
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+import numpy as np
+
+from apps.backend.core.config import settings
+from apps.backend.services.ai.vector_index import VectorIndex
+
+
+def load_job_vectors():
+    """Load (ids, matrix) of every job embedding in the database."""
+    from apps.backend.db.session import SessionLocal
+    from apps.backend.models.job import Job
+
+    db = SessionLocal()
+    try:
+        index = VectorIndex("jobs")
+        index.load(db, Job)
+        size = len(index)
+        return index._ids[:size].copy(), index._matrix[:size].copy()
+    finally:
+        db.close()
+
+
+def synthetic_vectors(n: int, dim: int, clusters: int = 500, seed: int = 0):
+    """Clustered random unit vectors, roughly shaped like real embedding catalogs."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    matrix = centers[rng.integers(0, clusters, n)] + rng.standard_normal((n, dim)).astype(np.float32)
+    return np.arange(1, n + 1, dtype=np.int64), matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IVF recall@k benchmark")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N synthetic vectors instead of the database")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=settings.VECTOR_INDEX_IVF_NLIST, help="0 picks sqrt(n)")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    if args.synthetic:
+        ids, matrix = synthetic_vectors(args.synthetic, settings.EMBEDDING_DIM)
+    else:
+        ids, matrix = load_job_vectors()
+
+    if len(ids) == 0:
+        print("❌ No vectors to index")
+        sys.exit(1)
+
+    # Queries: perturbed catalog vectors, so each has real near neighbours
+    rng = np.random.default_rng(1)
+    queries = matrix[rng.integers(0, len(matrix), args.queries)]
+    queries = queries + rng.standard_normal(queries.shape).astype(np.float32) * queries.std()
+
+    print(f"📊 {len(ids)} vectors, {args.queries} queries, k={args.k}")
+
+    settings.VECTOR_INDEX_ANN = "ivf"
+    settings.VECTOR_INDEX_ANN_MIN_SIZE = 0
+    settings.VECTOR_INDEX_IVF_NLIST = args.nlist
+
+    start = time.time()
+    index = VectorIndex("benchmark")
+    index.build(ids, matrix)
+    print(f"🔨 Built IVF index in {time.time() - start:.1f}s: {index.get_stats()['ann']}")
+
+    exact_results = []
+    start = time.perf_counter()
+    for query in queries:
+        exact_results.append({item_id for item_id, _ in index.search(query, args.k, exact=True)})
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    print(f"\n{'nprobe':>7} {'recall@' + str(args.k):>10} {'ms/query':>9} {'speedup':>8}")
+    print(f"{'exact':>7} {1.0:>10.3f} {exact_ms:>9.2f} {1.0:>7.1f}x")
+    for nprobe in args.nprobe:
+        recall = 0.0
+        start = time.perf_counter()
+        for query, expected in zip(queries, exact_results):
+            found = {item_id for item_id, _ in index.search(query, args.k, nprobe=nprobe)}
+            recall += len(found & expected) / max(1, len(expected))
+        ann_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        print(f"{nprobe:>7} {recall / len(queries):>10.3f} {ann_ms:>9.2f} {exact_ms / ann_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Green Matchers - Batch Recommendations
+Precomputes career and job recommendations for every job seeker.
+
+Usage:
+    python apps/backend/scripts/compute_recommendations.py                 # careers and jobs
+    python apps/backend/scripts/compute_recommendations.py --types job     # jobs only
+    python apps/backend/scripts/compute_recommendations.py --k 50 --memory-mb 2048
+
+Nightly cron example:
+    0 2 * * * cd /var/www/green-matchers && venv/bin/python apps/backend/scripts/compute_recommendations.py
+"""
+import argparse
+import logging
+import os
+import sys
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from apps.backend.models.user_recommendation import RecommendationType
+from apps.backend.services.ai.batch_scoring import create_batch_recommender
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute user recommendations")
+    parser.add_argument("--types", nargs="+", choices=[t.value for t in RecommendationType],
+                        default=[t.value for t in RecommendationType])
+    parser.add_argument("--k", type=int, help="Recommendations per user and type")
+    parser.add_argument("--min-score", type=float, help="Minimum similarity to store")
+    parser.add_argument("--page-size", type=int, help="Users per transaction")
+    parser.add_argument("--memory-mb", type=int, help="Budget for one score block")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    recommender = create_batch_recommender(
+        k=args.k,
+        min_score=args.min_score,
+        user_page_size=args.page_size,
+        memory_mb=args.memory_mb
+    )
+
+    print(f"🚀 Scoring users against: {', '.join(args.types)}")
+    stats = recommender.run([RecommendationType(t) for t in args.types])
+
+    print(f"✅ Scored {stats['users']} users in {stats['seconds']}s")
+    for item_type in args.types:
+        print(f"   {item_type}: {stats[f'{item_type}_rows']} recommendations written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Green Matchers - ONNX Embedding Backend Tool
+Exports the embedding model to ONNX, checks parity with PyTorch, and benchmarks both.
+
+Usage:
+    python apps/backend/scripts/onnx_embeddings.py export
+    python apps/backend/scripts/onnx_embeddings.py parity --backend onnx-int8
+    python apps/backend/scripts/onnx_embeddings.py benchmark
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+import numpy as np
+
+from apps.backend.core.config import settings
+from apps.backend.services.ai.embeddings import EmbeddingService
+from apps.backend.services.ai.onnx_backend import (
+    OnnxEmbeddingModel,
+    export_onnx_model,
+    MODEL_FILE,
+    QUANTIZED_MODEL_FILE,
+)
+
+# Parity fixtures: short queries, skill lists and full job descriptions
+FIXTURE_TEXTS = [
+    "solar energy",
+    "python sql machine learning",
+    "Wind Turbine Technician",
+    "renewable energy project manager in Bangalore",
+    "carbon accounting, ESG reporting, life cycle assessment",
+    "Install, maintain, and repair solar panel systems for residential and commercial properties.",
+    "Maintain and repair wind turbine systems for renewable energy generation.",
+    "Design water conservation programs for urban municipalities and track usage reduction.",
+    "We are hiring a data scientist to model grid demand and optimize battery storage dispatch. "
+    "Experience with time-series forecasting, pandas and scikit-learn is required.",
+    "Sustainability analyst responsible for supplier audits, greenhouse gas inventories under the "
+    "GHG protocol, and preparing annual ESG disclosures for investors and regulators.",
+    "electric vehicle charging infrastructure",
+    "waste management and recycling operations supervisor",
+]
+
+
+def load_backend(backend: str, model_dir: str):
+    """Load one backend by name."""
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(EmbeddingService._model_name)
+    return OnnxEmbeddingModel(model_dir, quantized=backend == "onnx-int8", num_threads=settings.EMBEDDING_TORCH_THREADS)
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB (Linux only, else 0)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def cmd_export(args):
+    paths = export_onnx_model(settings.EMBEDDING_MODEL, args.output, quantize=not args.no_quantize)
+    for path in paths:
+        print(f"✓ Wrote {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+
+def cmd_parity(args):
+    reference = load_backend("torch", args.model_dir).encode(FIXTURE_TEXTS, convert_to_numpy=True)
+    candidate = load_backend(args.backend, args.model_dir).encode(FIXTURE_TEXTS, convert_to_numpy=True)
+
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    cosines = (reference * candidate).sum(axis=1)
+
+    for text, cosine in zip(FIXTURE_TEXTS, cosines):
+        print(f"  {cosine:.5f}  {text[:60]}")
+
+    print(f"\nmin cosine: {cosines.min():.5f}  mean cosine: {cosines.mean():.5f}")
+    if cosines.min() < args.threshold:
+        print(f"✗ Parity check failed: {args.backend} is below {args.threshold}")
+        sys.exit(1)
+    print(f"✓ Parity check passed for {args.backend}")
+
+
+def cmd_benchmark(args):
+    backends = ["torch"]
+    if os.path.exists(os.path.join(args.model_dir, MODEL_FILE)):
+        backends.append("onnx")
+    if os.path.exists(os.path.join(args.model_dir, QUANTIZED_MODEL_FILE)):
+        backends.append("onnx-int8")
+
+    batch = (FIXTURE_TEXTS * (args.batch_size // len(FIXTURE_TEXTS) + 1))[:args.batch_size]
+
+    print(f"{'backend':<10} {'rss+MB':>8} {'single p50':>11} {'single p95':>11} {'batch p50':>10} {'texts/s':>9}")
+    for backend in backends:
+        rss_before = current_rss_mb()
+        model = load_backend(backend, args.model_dir)
+        rss_delta = current_rss_mb() - rss_before
+
+        # Warm-up
+        model.encode(batch, batch_size=len(batch), convert_to_numpy=True)
+
+        single_times = []
+        for i in range(args.runs):
+            start = time.perf_counter()
+            model.encode(FIXTURE_TEXTS[i % len(FIXTURE_TEXTS)], convert_to_numpy=True)
+            single_times.append((time.perf_counter() - start) * 1000)
+
+        batch_times = []
+        for _ in range(max(1, args.runs // 4)):
+            start = time.perf_counter()
+            model.encode(batch, batch_size=len(batch), convert_to_numpy=True)
+            batch_times.append((time.perf_counter() - start) * 1000)
+
+        single_times.sort()
+        batch_p50 = statistics.median(batch_times)
+        print(
+            f"{backend:<10} {rss_delta:>8.0f} {statistics.median(single_times):>9.1f}ms "
+            f"{single_times[int(len(single_times) * 0.95) - 1]:>9.1f}ms {batch_p50:>8.1f}ms "
+            f"{len(batch) / batch_p50 * 1000:>9.1f}"
+        )
+        del model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ONNX embedding backend tool")
+    parser.add_argument("--model-dir", default=settings.EMBEDDING_ONNX_PATH, help="ONNX model directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="Export the model to ONNX (+ int8)")
+    export.add_argument("--output", default=settings.EMBEDDING_ONNX_PATH)
+    export.add_argument("--no-quantize", action="store_true", help="Skip the int8 model")
+    export.set_defaults(func=cmd_export)
+
+    parity = subparsers.add_parser("parity", help="Compare an ONNX backend with PyTorch")
+    parity.add_argument("--backend", choices=["onnx", "onnx-int8"], default="onnx-int8")
+    parity.add_argument("--threshold", type=float, default=0.99, help="Minimum per-text cosine")
+    parity.set_defaults(func=cmd_parity)
+
+    benchmark = subparsers.add_parser("benchmark", help="Compare encode latency and memory")
+    benchmark.add_argument("--runs", type=int, default=40)
+    benchmark.add_argument("--batch-size", type=int, default=32)
+    benchmark.set_defaults(func=cmd_benchmark)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+IVF-Flat Approximate Nearest Neighbour Index
+Inverted-file partitioning of the vector matrix, implemented in NumPy
+
+Vectors are grouped around centroids found by spherical k-means. A query
+scores the centroids, visits only the `nprobe` closest lists, and the rows
+found there are scored exactly against the full vectors by VectorIndex.
+"""
+
+import logging
+import math
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class IVFIndex:
+    """
+    Inverted lists of matrix row numbers keyed by nearest centroid.
+
+    The index stores row numbers only; the vectors stay in the owning
+    VectorIndex matrix. Rows can be added, re-assigned and removed one at a
+    time, so job changes do not require retraining.
+    """
+
+    def __init__(
+        self,
+        nlist: Optional[int] = None,
+        n_iter: int = 10,
+        sample_size: int = 100000,
+        seed: int = 0
+    ):
+        self.nlist = nlist
+        self.n_iter = n_iter
+        self.sample_size = sample_size
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self._assign = np.empty(0, dtype=np.int32)
+        self._lists: List[np.ndarray] = []
+
+    @staticmethod
+    def _nearest(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """Index of the most similar centroid per row, in chunks to bound memory."""
+        nearest = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk_size):
+            scores = vectors[start:start + chunk_size] @ centroids.T
+            nearest[start:start + chunk_size] = np.argmax(scores, axis=1)
+        return nearest
+
+    def train(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Find centroids with spherical k-means on a sample of normalized rows.
+
+        Args:
+            matrix: (n, dim) L2-normalized float32 vectors
+
+        Returns:
+            np.ndarray: (nlist, dim) normalized centroids
+        """
+        rng = np.random.default_rng(self.seed)
+        n = len(matrix)
+        nlist = min(n, self.nlist or max(1, int(math.sqrt(n))))
+
+        sample = matrix
+        if n > self.sample_size:
+            sample = matrix[np.sort(rng.choice(n, self.sample_size, replace=False))]
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(self.n_iter):
+            assign = self._nearest(sample, centroids)
+            order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=nlist)
+            occupied = np.flatnonzero(counts)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[occupied]
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+
+            # Empty clusters keep their previous centroid
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids[occupied] = sums / norms
+
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        return self.centroids
+
+    def build(self, matrix: np.ndarray):
+        """Train centroids and assign every row of the matrix."""
+        if self.centroids is None:
+            self.train(matrix)
+        self._set_assignments(self._nearest(matrix, self.centroids))
+        logger.info(f"Built IVF index: {len(matrix)} vectors in {len(self.centroids)} lists")
+
+    def _set_assignments(self, assign: np.ndarray):
+        """Rebuild the inverted lists from a row → list assignment array."""
+        nlist = len(self.centroids)
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        bounds = np.searchsorted(assign[order], np.arange(nlist + 1))
+        self._assign = assign.astype(np.int32)
+        self._lists = [order[bounds[c]:bounds[c + 1]] for c in range(nlist)]
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """
+        Row numbers in the `nprobe` lists whose centroids are closest to the query.
+
+        Args:
+            query: Normalized query vector
+            nprobe: Number of lists to visit (higher = better recall, slower)
+
+        Returns:
+            np.ndarray: Candidate row numbers (unordered)
+        """
+        nprobe = max(1, min(nprobe, len(self._lists)))
+        scores = self.centroids @ query
+        if nprobe < len(scores):
+            probe = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        else:
+            probe = np.arange(len(scores))
+        lists = self._lists
+        return np.concatenate([lists[c] for c in probe])
+
+    def assign_row(self, row: int, vector: np.ndarray):
+        """Add a row, or move it to the list of its new nearest centroid."""
+        cluster = int(np.argmax(self.centroids @ vector))
+
+        if row >= len(self._assign):
+            grown = np.full(max(row + 1, 2 * len(self._assign), 1024), -1, dtype=np.int32)
+            grown[:len(self._assign)] = self._assign
+            self._assign = grown
+
+        previous = int(self._assign[row])
+        if previous == cluster:
+            return
+        if previous >= 0:
+            self._lists[previous] = self._lists[previous][self._lists[previous] != row]
+
+        # Lists are replaced, never mutated, so concurrent readers see a consistent array
+        self._lists[cluster] = np.append(self._lists[cluster], row)
+        self._assign[row] = cluster
+
+    def remove_row(self, row: int):
+        """Remove a row from its list."""
+        if row >= len(self._assign) or self._assign[row] < 0:
+            return
+        cluster = int(self._assign[row])
+        self._lists[cluster] = self._lists[cluster][self._lists[cluster] != row]
+        self._assign[row] = -1
+
+    def compacted(self, live_rows: np.ndarray) -> "IVFIndex":
+        """
+        Copy of this index for a compacted matrix where row i was `live_rows[i]`.
+
+        Centroids are shared; only the lists are rebuilt.
+        """
+        index = IVFIndex(self.nlist, self.n_iter, self.sample_size, self.seed)
+        index.centroids = self.centroids
+
+        assign = np.full(len(live_rows), -1, dtype=np.int32)
+        known = live_rows < len(self._assign)
+        assign[known] = self._assign[live_rows[known]]
+        # Unassigned rows (-1) sort before list 0 and fall outside every list
+        index._set_assignments(assign)
+        return index
+
+    def get_stats(self) -> dict:
+        """Get list count and balance information."""
+        sizes = [len(rows) for rows in self._lists]
+        return {
+            'type': 'ivf',
+            'nlist': len(sizes),
+            'indexed': int(sum(sizes)),
+            'max_list_size': max(sizes) if sizes else 0,
+            'avg_list_size': round(sum(sizes) / len(sizes), 1) if sizes else 0.0
+        }
@@ -0,0 +1,317 @@
+"""
+Embedding Backfill
+Finds job and career rows with missing or outdated vectors and re-embeds them
+
+Rows are scanned in keyset-paginated batches (id > last_id), encoded with
+`encode_batch` in small chunks paced by a texts-per-second budget, and
+written back with bulk updates. The last id of each table is checkpointed
+after every batch so an interrupted run resumes where it stopped.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import or_
+
+from apps.backend.core.config import settings
+from apps.backend.models.career import Career
+from apps.backend.models.job import Job
+from .embeddings import EmbeddingService
+from .index_sync import job_embedding_text
+from .inference import InferenceBusyError
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def career_embedding_text(career) -> str:
+    """Text a career is embedded from: title, description and required skills."""
+    parts = [career.title, career.description]
+    if career.required_skills:
+        parts.append(", ".join(str(skill) for skill in career.required_skills))
+    return ". ".join(part.strip() for part in parts if part and part.strip())
+
+
+# table -> (model, columns needed for the text, text builder)
+BACKFILL_TABLES: Dict[str, tuple] = {
+    "jobs": (
+        Job,
+        (Job.id, Job.title, Job.description, Job.requirements, Job.required_skills),
+        job_embedding_text
+    ),
+    "careers": (
+        Career,
+        (Career.id, Career.title, Career.description, Career.required_skills),
+        career_embedding_text
+    ),
+}
+
+
+class EmbeddingBackfill:
+    """
+    Rate-limited, resumable embedding backfill for jobs and careers.
+
+    Args:
+        batch_size: Rows fetched and written per database round trip
+        encode_batch_size: Texts per inference call, kept small so online
+            requests can interleave with backfill work
+        rate_per_second: Maximum texts encoded per second
+        checkpoint_path: JSON file holding the last processed id per table
+            (empty disables checkpoints)
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        encode_batch_size: int = 32,
+        rate_per_second: float = 50.0,
+        checkpoint_path: str = ""
+    ):
+        self.batch_size = max(1, batch_size)
+        self.encode_batch_size = max(1, encode_batch_size)
+        self.rate_per_second = rate_per_second
+        self.checkpoint_path = checkpoint_path
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self.runs = 0
+        self.rows_embedded = 0
+        self.busy_retries = 0
+        self.last_run_at: Optional[float] = None
+
+    @staticmethod
+    def _stale_filter(model):
+        """Rows with no vector or a vector from another model version."""
+        return or_(
+            model.embedding.is_(None),
+            model.embedding_version.is_(None),
+            model.embedding_version != EmbeddingService.get_embedding_version()
+        )
+
+    def count_pending(self, db, tables: Iterable[str] = BACKFILL_TABLES) -> Dict[str, int]:
+        """Count rows that need (re-)embedding per table."""
+        return {
+            table: db.query(BACKFILL_TABLES[table][0].id)
+            .filter(self._stale_filter(BACKFILL_TABLES[table][0]))
+            .count()
+            for table in tables
+        }
+
+    def run(self, tables: Iterable[str] = BACKFILL_TABLES, resume: bool = True) -> Dict[str, int]:
+        """
+        Backfill the given tables once.
+
+        Only one process runs a backfill at a time; others return at once.
+
+        Args:
+            tables: Table names from BACKFILL_TABLES
+            resume: Continue from the checkpoint instead of the first id
+
+        Returns:
+            Dict[str, int]: Rows embedded per table
+        """
+        lock_file = self._acquire_lock()
+        if lock_file is False:
+            logger.info("Embedding backfill already running in another process")
+            return {}
+
+        try:
+            checkpoint = self._load_checkpoint() if resume else {}
+            embedded = {}
+            for table in tables:
+                if self._stop.is_set():
+                    break
+                embedded[table] = self._backfill_table(table, checkpoint)
+
+            self.runs += 1
+            self.last_run_at = time.time()
+            return embedded
+        finally:
+            if lock_file:
+                lock_file.close()
+
+    def _backfill_table(self, table: str, checkpoint: Dict[str, int]) -> int:
+        """Walk one table by id, embedding stale rows batch by batch."""
+        from apps.backend.db.session import SessionLocal
+
+        model, columns, build_text = BACKFILL_TABLES[table]
+        last_id = checkpoint.get(table, 0)
+        embedded = 0
+        version = EmbeddingService.get_embedding_version()
+
+        if last_id:
+            logger.info(f"Resuming {table} embedding backfill after id {last_id}")
+
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                rows = (
+                    db.query(*columns)
+                    .filter(model.id > last_id, self._stale_filter(model))
+                    .order_by(model.id)
+                    .limit(self.batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+
+                vectors = self._encode([build_text(row) for row in rows])
+                if vectors is None:
+                    break
+
+                db.bulk_update_mappings(model, [
+                    {
+                        "id": row.id,
+                        "embedding": EmbeddingService.vector_to_bytes(vector),
+                        "embedding_version": version
+                    }
+                    for row, vector in zip(rows, vectors)
+                ])
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+            last_id = rows[-1].id
+            embedded += len(rows)
+            self.rows_embedded += len(rows)
+            checkpoint[table] = last_id
+            self._save_checkpoint(checkpoint)
+            logger.info(f"Backfilled {embedded} {table} embeddings (last id {last_id})")
+
+        if not self._stop.is_set():
+            # Pass complete; the next run starts from the beginning
+            checkpoint.pop(table, None)
+            self._save_checkpoint(checkpoint)
+
+        return embedded
+
+    def _encode(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """
+        Encode texts in small, paced chunks.
+
+        Waits and retries when the inference queue is full, so online
+        requests always win. Returns None if stopped midway.
+        """
+        vectors = []
+        for start in range(0, len(texts), self.encode_batch_size):
+            chunk = texts[start:start + self.encode_batch_size]
+            started = time.monotonic()
+
+            while True:
+                if self._stop.is_set():
+                    return None
+                try:
+                    vectors.extend(EmbeddingService.encode_batch(chunk))
+                    break
+                except InferenceBusyError:
+                    self.busy_retries += 1
+                    self._stop.wait(1.0)
+
+            # Pace to the texts-per-second budget
+            if self.rate_per_second > 0:
+                remaining = len(chunk) / self.rate_per_second - (time.monotonic() - started)
+                if remaining > 0:
+                    self._stop.wait(remaining)
+
+        return vectors
+
+    def _acquire_lock(self):
+        """
+        Take an exclusive, non-blocking lock next to the checkpoint file.
+
+        Returns:
+            The open lock file, None if locking is unavailable, or False if
+            another process holds the lock
+        """
+        if not self.checkpoint_path or fcntl is None:
+            return None
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+        lock_file = open(f"{self.checkpoint_path}.lock", "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        return lock_file
+
+    def _load_checkpoint(self) -> Dict[str, int]:
+        """Read the last processed id per table; checkpoints from another model version are ignored."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        try:
+            with open(self.checkpoint_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable backfill checkpoint: {str(e)}")
+            return {}
+        if data.get("version") != EmbeddingService.get_embedding_version():
+            return {}
+        return {table: int(last_id) for table, last_id in data.get("tables", {}).items()}
+
+    def _save_checkpoint(self, checkpoint: Dict[str, int]):
+        """Atomically write the checkpoint file."""
+        if not self.checkpoint_path:
+            return
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"version": EmbeddingService.get_embedding_version(), "tables": checkpoint}, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def start_background(self, interval_seconds: float, initial_delay: float = 60.0):
+        """Run the backfill periodically on a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run_periodically,
+            args=(interval_seconds, initial_delay),
+            name="embedding-backfill",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run_periodically(self, interval_seconds: float, initial_delay: float):
+        delay = min(initial_delay, interval_seconds)
+        while not self._stop.wait(delay):
+            try:
+                self.run()
+            except Exception as e:
+                logger.error(f"Embedding backfill failed: {str(e)}")
+            delay = interval_seconds
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background thread (and any run in progress) after the current chunk."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get backfill counters."""
+        return {
+            'runs': self.runs,
+            'rows_embedded': self.rows_embedded,
+            'busy_retries': self.busy_retries,
+            'last_run_at': self.last_run_at
+        }
+
+
+# Process-wide singleton used by the in-process background worker
+embedding_backfill = EmbeddingBackfill(
+    batch_size=settings.EMBEDDING_BACKFILL_BATCH_SIZE,
+    encode_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+    rate_per_second=settings.EMBEDDING_BACKFILL_RATE,
+    checkpoint_path=settings.EMBEDDING_BACKFILL_CHECKPOINT_PATH
+)
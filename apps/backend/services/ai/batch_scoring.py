@@ -0,0 +1,311 @@
+"""
+Batch Recommendation Scoring
+Scores every job seeker against every career and open job with blocked matrix products
+
+Users are read in keyset pages and stacked into a U×768 matrix; each
+catalog is held as one normalized C×768 matrix. A page is scored one
+catalog slice at a time, with slices sized to a memory budget, and every
+slice is merged into a running top-k per user, so memory stays bounded no
+matter how many users or jobs there are. Results replace the page's rows in
+user_recommendations with bulk inserts.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from apps.backend.core.config import settings
+from apps.backend.models.career import Career
+from apps.backend.models.job import Job
+from apps.backend.models.user import User, UserRole
+from apps.backend.models.user_recommendation import RecommendationType, UserRecommendation, UserRecommendationRun
+from .embeddings import EmbeddingService
+from .skill_overlap import SkillIncidence
+from .skill_vectors import normalize_skill, skill_vocabulary
+from .vector_index import VectorIndex, indexable_job_criteria
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Catalog:
+    """Normalized item vectors with the required-skill incidence of each row."""
+    item_type: RecommendationType
+    ids: np.ndarray
+    matrix: np.ndarray
+    skills: SkillIncidence
+
+
+def top_k_blocked(
+    users: np.ndarray,
+    catalog: np.ndarray,
+    k: int,
+    max_block_bytes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k catalog rows per user by dot product, scoring one column slice at a time.
+
+    Each slice is scored into one (users × slice) block and cut down to
+    its own top-k columns with `np.argpartition`; only those (users × k)
+    candidates are merged into the running top-k, so nothing larger than
+    (users × 2k) is ever concatenated. Slices are sized so the score block
+    plus the index array `np.argpartition` returns stay under
+    max_block_bytes.
+
+    Args:
+        users: (U, dim) normalized user vectors
+        catalog: (C, dim) normalized item vectors
+        k: Results per user
+        max_block_bytes: Memory budget for one slice's score and index arrays
+
+    Returns:
+        Tuple of (U, min(k, C)) catalog row numbers and scores, best first
+    """
+    n_users, n_items = len(users), len(catalog)
+    k = min(k, n_items)
+    if n_users == 0 or k <= 0:
+        return np.empty((n_users, 0), dtype=np.int64), np.empty((n_users, 0), dtype=np.float32)
+
+    # float32 score + int64 partition index per (user, column)
+    columns = max(k, max_block_bytes // (12 * n_users))
+    # Negated scores throughout, so partitions take the smallest
+    best_rows = np.empty((n_users, 0), dtype=np.int64)
+    best_scores = np.empty((n_users, 0), dtype=np.float32)
+
+    for start in range(0, n_items, columns):
+        block = users @ catalog[start:start + columns].T
+        np.negative(block, out=block)
+        if block.shape[1] > k:
+            top = np.argpartition(block, k - 1, axis=1)[:, :k]
+            block = np.take_along_axis(block, top, axis=1)
+            rows = top + start
+            # `top` is a view of the full (users × slice) index array; release it now
+            del top
+        else:
+            rows = np.broadcast_to(np.arange(start, start + block.shape[1], dtype=np.int64), block.shape)
+
+        scores = np.hstack([best_scores, block])
+        candidates = np.hstack([best_rows, rows])
+        if scores.shape[1] > k:
+            keep = np.argpartition(scores, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(scores, keep, axis=1)
+            candidates = np.take_along_axis(candidates, keep, axis=1)
+        best_rows, best_scores = candidates, scores
+
+    order = np.argsort(best_scores, axis=1, kind="stable")
+    return np.take_along_axis(best_rows, order, axis=1), -np.take_along_axis(best_scores, order, axis=1)
+
+
+class BatchRecommender:
+    """
+    Precomputes top-k career and job recommendations for every job seeker.
+
+    Args:
+        k: Recommendations kept per user and item type
+        memory_mb: Budget for scoring one users × catalog slice
+        user_page_size: Users read, scored and written per transaction
+        min_score: Recommendations below this similarity are not stored
+    """
+
+    def __init__(
+        self,
+        k: int = 20,
+        memory_mb: int = 512,
+        user_page_size: int = 5000,
+        min_score: float = 0.3
+    ):
+        self.k = k
+        self.max_block_bytes = max(1, memory_mb) * 1024 * 1024
+        self.user_page_size = max(1, user_page_size)
+        self.min_score = min_score
+
+    def load_catalog(self, db, item_type: RecommendationType) -> Catalog:
+        """Load active careers, or indexable jobs, as one normalized matrix."""
+        if item_type == RecommendationType.CAREER:
+            model, criteria = Career, [Career.is_active == True]
+        else:
+            model, criteria = Job, indexable_job_criteria()
+
+        rows = (
+            db.query(model.id, model.embedding, model.required_skills)
+            .filter(model.embedding.isnot(None), *criteria)
+            .all()
+        )
+
+        ids, vectors, skills = [], [], []
+        for item_id, raw, required_skills in rows:
+            try:
+                vectors.append(EmbeddingService.bytes_to_vector(raw))
+            except ValueError as e:
+                logger.warning(f"Skipping {item_type.value} {item_id} with invalid embedding: {str(e)}")
+                continue
+            ids.append(item_id)
+            skills.append(required_skills or [])
+
+        dim = EmbeddingService._embedding_dim
+        matrix = np.vstack(vectors) if vectors else np.empty((0, dim), dtype=np.float32)
+        return Catalog(
+            item_type, np.asarray(ids, dtype=np.int64), VectorIndex.normalize(matrix), SkillIncidence(skills)
+        )
+
+    def _user_vectors(self, db, rows) -> Tuple[List[int], List[list], np.ndarray]:
+        """
+        Stack the page's user vectors, composing (and saving) missing or outdated ones.
+
+        Returns:
+            Tuple of user ids, skill lists and a normalized (U, dim) matrix;
+            users whose skills give no vector are left out
+        """
+        version = EmbeddingService.get_embedding_version()
+        stale = [row for row in rows if row.skill_embedding is None or row.skill_embedding_version != version]
+        stale_ids = {row.id for row in stale}
+        if stale:
+            # Encode every unknown skill of the page in one batch
+            skill_vocabulary.get_vectors(
+                name for row in stale for name in map(normalize_skill, row.skills or []) if name
+            )
+
+        ids, skills, vectors, updates = [], [], [], []
+        for row in rows:
+            if row.id in stale_ids:
+                vector = skill_vocabulary.compose(row.skills or [])
+                if not vector.any():
+                    continue
+                updates.append({
+                    "id": row.id,
+                    "skill_embedding": EmbeddingService.vector_to_bytes(vector),
+                    "skill_embedding_version": version
+                })
+            else:
+                vector = EmbeddingService.bytes_to_vector(row.skill_embedding)
+            ids.append(row.id)
+            skills.append(row.skills or [])
+            vectors.append(vector)
+
+        if updates:
+            db.bulk_update_mappings(User, updates)
+
+        dim = EmbeddingService._embedding_dim
+        matrix = np.vstack(vectors) if vectors else np.empty((0, dim), dtype=np.float32)
+        return ids, skills, VectorIndex.normalize(matrix)
+
+    def _recommendation_rows(
+        self,
+        catalog: Catalog,
+        user_ids: List[int],
+        user_skills: List[list],
+        rows: np.ndarray,
+        scores: np.ndarray,
+        computed_at: datetime
+    ) -> List[dict]:
+        """Build insert mappings for the page's top-k results above min_score."""
+        mappings = []
+        for position, user_id in enumerate(user_ids):
+            covered = catalog.skills.coverage(user_skills[position])
+            for rank, (row, score) in enumerate(zip(rows[position], scores[position]), start=1):
+                if score < self.min_score:
+                    break
+                matched, missing = catalog.skills.overlap(covered, row)
+                mappings.append({
+                    "user_id": user_id,
+                    "item_type": catalog.item_type,
+                    "item_id": int(catalog.ids[row]),
+                    "rank": rank,
+                    "score": round(float(score), 4),
+                    "matched_skills": matched,
+                    "missing_skills": missing,
+                    "computed_at": computed_at
+                })
+        return mappings
+
+    def run(
+        self,
+        item_types: Iterable[RecommendationType] = (RecommendationType.CAREER, RecommendationType.JOB)
+    ) -> Dict[str, float]:
+        """
+        Recompute recommendations for every job seeker with skills.
+
+        Args:
+            item_types: Catalogs to score against
+
+        Returns:
+            Dict[str, float]: users scored, rows written per item type, seconds
+        """
+        from apps.backend.db.session import SessionLocal
+
+        start_time = time.time()
+        computed_at = datetime.utcnow()
+        item_types = list(item_types)
+
+        db = SessionLocal()
+        try:
+            catalogs = [self.load_catalog(db, item_type) for item_type in item_types]
+        finally:
+            db.close()
+        for catalog in catalogs:
+            logger.info(f"Scoring against {len(catalog.ids)} {catalog.item_type.value} vectors")
+
+        stats = {"users": 0, **{f"{item_type.value}_rows": 0 for item_type in item_types}}
+        last_id = 0
+        while True:
+            db = SessionLocal()
+            try:
+                page = (
+                    db.query(User.id, User.skills, User.skill_embedding, User.skill_embedding_version)
+                    .filter(User.id > last_id, User.role == UserRole.USER, User.skills.isnot(None))
+                    .order_by(User.id)
+                    .limit(self.user_page_size)
+                    .all()
+                )
+                if not page:
+                    break
+                last_id = page[-1].id
+
+                user_ids, user_skills, users = self._user_vectors(db, page)
+                for catalog in catalogs:
+                    rows, scores = top_k_blocked(users, catalog.matrix, self.k, self.max_block_bytes)
+                    mappings = self._recommendation_rows(
+                        catalog, user_ids, user_skills, rows, scores, computed_at
+                    )
+                    for model in (UserRecommendation, UserRecommendationRun):
+                        db.query(model).filter(
+                            model.user_id.in_(user_ids),
+                            model.item_type == catalog.item_type
+                        ).delete(synchronize_session=False)
+                    db.bulk_insert_mappings(UserRecommendation, mappings)
+                    # Run markers for every scored user, including those with no rows above min_score
+                    db.bulk_insert_mappings(UserRecommendationRun, [
+                        {"user_id": user_id, "item_type": catalog.item_type, "computed_at": computed_at}
+                        for user_id in user_ids
+                    ])
+                    stats[f"{catalog.item_type.value}_rows"] += len(mappings)
+
+                db.commit()
+                stats["users"] += len(user_ids)
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+            logger.info(f"Scored {stats['users']} users (last id {last_id})")
+
+        stats["seconds"] = round(time.time() - start_time, 1)
+        logger.info(f"Batch recommendations complete: {stats}")
+        return stats
+
+
+def create_batch_recommender(**overrides) -> BatchRecommender:
+    """BatchRecommender configured from settings, with optional overrides."""
+    options = {
+        "k": settings.RECOMMENDATION_TOP_K,
+        "memory_mb": settings.RECOMMENDATION_BATCH_MEMORY_MB,
+        "user_page_size": settings.RECOMMENDATION_BATCH_USERS,
+        "min_score": settings.RECOMMENDATION_MIN_SCORE,
+    }
+    options.update({key: value for key, value in overrides.items() if value is not None})
+    return BatchRecommender(**options)
@@ -0,0 +1,153 @@
+"""
+Micro-Batching
+Coalesces concurrent single-text encode requests into batched model calls
+
+Callers enqueue a text and block on a future. A worker thread gathers up to
+`max_batch_size` texts, or waits at most `max_wait_ms` after the first one
+arrives, runs a single batched encode, and resolves each caller's future.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from apps.backend.core.metrics import EMBEDDING_INFERENCE_REJECTED
+from .inference import InferenceBusyError
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batcher for embedding requests.
+
+    A batch is flushed as soon as it is full or the wait window since the
+    first queued item has elapsed, so an idle service adds at most
+    `max_wait_ms` of latency while a busy one runs full batches.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 0,
+        name: str = "encode"
+    ):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=max(0, max_queue_size))
+        self._thread = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.batches = 0
+        self.items = 0
+        self.max_batch_seen = 0
+        self.max_queue_depth = 0
+        self.rejected = 0
+
+    def submit(self, text: str) -> Future:
+        """
+        Enqueue a text for encoding.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            Future: Resolves to the float32 embedding for this text
+
+        Raises:
+            InferenceBusyError: If the queue is full
+        """
+        self._ensure_started()
+        future = Future()
+        try:
+            self._queue.put_nowait((text, future))
+        except queue.Full:
+            self.rejected += 1
+            EMBEDDING_INFERENCE_REJECTED.inc()
+            raise InferenceBusyError(f"Micro-batch queue is full ({self._queue.maxsize} pending texts)")
+
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+        return future
+
+    def encode(self, text: str) -> np.ndarray:
+        """Enqueue a text and wait for its embedding."""
+        return self.submit(text).result()
+
+    def _ensure_started(self):
+        """Start the worker thread on first use."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"micro-batcher-{self.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _collect_batch(self) -> List[tuple]:
+        """Block for the first item, then gather more until full or the window closes."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop: collect, encode once, resolve futures."""
+        while True:
+            batch = self._collect_batch()
+
+            # Identical texts in one batch are encoded once
+            unique_texts = list(dict.fromkeys(text for text, _ in batch))
+
+            try:
+                vectors = self.encode_fn(unique_texts)
+                by_text = dict(zip(unique_texts, vectors))
+                for text, future in batch:
+                    future.set_result(by_text[text])
+            except Exception as e:
+                logger.error(f"Micro-batch encode of {len(unique_texts)} texts failed: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+            self.batches += 1
+            self.items += len(batch)
+            if len(batch) > self.max_batch_seen:
+                self.max_batch_seen = len(batch)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get batch size and queue depth metrics."""
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': round(self.max_wait * 1000, 3),
+            'batches': self.batches,
+            'items': self.items,
+            'avg_batch_size': round(self.items / self.batches, 2) if self.batches else 0.0,
+            'max_batch_seen': self.max_batch_seen,
+            'queue_depth': self._queue.qsize(),
+            'max_queue_depth': self.max_queue_depth,
+            'rejected': self.rejected
+        }
@@ -0,0 +1,111 @@
+"""
+Long-Document Chunking
+Splits long texts into overlapping token windows and pools their embeddings
+
+The transformer only sees its first `max_seq_length` tokens, so long job
+descriptions and resumes are cut into windows that each fit the model,
+encoded together in one batch, and pooled back into a single vector.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+POOLING_MODES = ("mean", "weighted")
+
+# (start_char, end_char, token_count)
+Span = Tuple[int, int, int]
+
+
+def chunk_text(text: str, tokenizer, max_tokens: int = 256, overlap: int = 32) -> List[Span]:
+    """
+    Split text into overlapping windows of at most `max_tokens` tokens.
+
+    Windows are returned as character spans of the original text so each
+    chunk can be encoded (and shown) verbatim.
+
+    Args:
+        text: Text to split
+        tokenizer: Hugging Face tokenizer of the embedding model (None falls
+            back to whitespace words)
+        max_tokens: Tokens per window, excluding special tokens
+        overlap: Tokens shared by consecutive windows
+
+    Returns:
+        List[Span]: (start_char, end_char, token_count) per window
+    """
+    max_tokens = max(1, max_tokens)
+    stride = max(1, max_tokens - max(0, overlap))
+
+    offsets = _token_offsets(text, tokenizer)
+    if not offsets:
+        return []
+
+    spans = []
+    for start in range(0, len(offsets), stride):
+        window = offsets[start:start + max_tokens]
+        spans.append((window[0][0], window[-1][1], len(window)))
+        if start + max_tokens >= len(offsets):
+            break
+
+    return spans
+
+
+def _token_offsets(text: str, tokenizer) -> List[Tuple[int, int]]:
+    """Character offsets of each token, using whitespace words if offsets are unavailable."""
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(
+                text,
+                add_special_tokens=False,
+                return_offsets_mapping=True,
+                truncation=False,
+                verbose=False
+            )
+            return [(start, end) for start, end in encoded["offset_mapping"] if end > start]
+        except (NotImplementedError, TypeError, KeyError) as e:
+            # Slow (pure Python) tokenizers do not return offsets
+            logger.debug(f"Tokenizer offsets unavailable, chunking on words: {str(e)}")
+
+    offsets = []
+    position = 0
+    for word in text.split():
+        start = text.index(word, position)
+        position = start + len(word)
+        offsets.append((start, position))
+    return offsets
+
+
+def pool_embeddings(
+    embeddings: np.ndarray,
+    token_counts: Optional[List[int]] = None,
+    mode: str = "mean"
+) -> np.ndarray:
+    """
+    Pool chunk embeddings into one L2-normalized vector.
+
+    Args:
+        embeddings: (n_chunks, dim) chunk embeddings
+        token_counts: Tokens per chunk, used as weights for "weighted"
+        mode: "mean" (every chunk counts equally) or "weighted" (by length)
+
+    Returns:
+        np.ndarray: (dim,) float32 unit vector (zeros if nothing to pool)
+    """
+    if mode not in POOLING_MODES:
+        raise ValueError(f"Unknown pooling mode: {mode}")
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if mode == "weighted" and token_counts is not None:
+        weights = np.asarray(token_counts, dtype=np.float32)
+        pooled = (embeddings * weights[:, None]).sum(axis=0) / max(float(weights.sum()), 1e-9)
+    else:
+        pooled = embeddings.mean(axis=0)
+
+    norm = np.linalg.norm(pooled)
+    if norm == 0:
+        return pooled.astype(np.float32)
+    return (pooled / norm).astype(np.float32)
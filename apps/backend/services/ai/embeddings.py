@@ -6,17 +6,32 @@ Model: all-mpnet-base-v2 (768-dim vectors)
 Production-ready with error handling, caching, and performance monitoring.
 """
 
+import asyncio
 import json
 import logging
+import os
+import sqlite3
+import threading
 import time
 import hashlib
-from typing import List, Optional, Dict
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Optional, Dict, Tuple
 from functools import lru_cache
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from apps.backend.core.config import settings
+from apps.backend.core.metrics import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_LOOKUPS,
+    EMBEDDING_OPERATION_DURATION,
+)
+from .batching import MicroBatcher
+from .chunking import chunk_text, pool_embeddings
+from .histogram import WindowedHistogram, WINDOWS
+from .inference import InferenceExecutor, InferenceBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -37,42 +52,268 @@ class EmbeddingError(AIServiceError):
 
 
 class PerformanceMonitor:
-    """Monitor AI service performance."""
+    """Monitor AI service performance with fixed-memory streaming histograms."""
     
     def __init__(self):
-        self.metrics: Dict[str, List[float]] = {}
+        self.metrics: Dict[str, WindowedHistogram] = {}
+        self._lock = threading.Lock()
     
     def record_time(self, operation: str, duration: float):
         """Record operation duration."""
-        if operation not in self.metrics:
-            self.metrics[operation] = []
-        self.metrics[operation].append(duration)
+        histogram = self.metrics.get(operation)
+        if histogram is None:
+            with self._lock:
+                histogram = self.metrics.setdefault(operation, WindowedHistogram())
+        histogram.record(duration)
+        EMBEDDING_OPERATION_DURATION.labels(operation=operation).observe(duration)
     
-    def get_stats(self, operation: str) -> Dict[str, float]:
-        """Get statistics for an operation."""
-        if operation not in self.metrics or not self.metrics[operation]:
-            return {}
+    def get_stats(self, operation: str, window: Optional[str] = None) -> Dict[str, float]:
+        """
+        Get statistics for an operation.
         
-        times = self.metrics[operation]
-        return {
-            'count': len(times),
-            'min': round(min(times), 3),
-            'max': round(max(times), 3),
-            'avg': round(sum(times) / len(times), 3),
-            'p50': round(sorted(times)[len(times) // 2], 3),
-            'p95': round(sorted(times)[int(len(times) * 0.95)], 3),
-            'p99': round(sorted(times)[int(len(times) * 0.99)], 3)
-        }
+        Args:
+            operation: Operation name
+            window: None for lifetime stats, or '1m', '5m' or '1h'
+        """
+        if operation not in self.metrics:
+            return {}
+        return self.metrics[operation].get_stats(window)
     
     def get_all_stats(self) -> Dict[str, Dict[str, float]]:
-        """Get statistics for all operations."""
-        return {op: self.get_stats(op) for op in self.metrics}
+        """Get lifetime statistics for all operations, with sliding-window views."""
+        return {
+            op: {
+                **histogram.get_stats(),
+                'windows': {window: histogram.get_stats(window) for window in WINDOWS}
+            }
+            for op, histogram in list(self.metrics.items())
+        }
 
 
 # Global performance monitor
 perf_monitor = PerformanceMonitor()
 
 
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of embedding vectors bounded by total bytes.
+    
+    Vectors are stored as read-only float32 arrays. When an insert would
+    exceed the byte budget, least recently used entries are evicted.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Get a vector and mark it as most recently used."""
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+    
+    def put(self, key: str, vector) -> None:
+        """Insert a vector, evicting least recently used entries as needed."""
+        vector = np.array(vector, dtype=np.float32)
+        vector.setflags(write=False)
+        size = vector.nbytes
+        
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            
+            while self._entries and self._bytes + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+            
+            self._entries[key] = vector
+            self._bytes += size
+    
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get cache size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'cache_size': len(self._entries),
+                'cache_bytes': self._bytes,
+                'cache_max_bytes': self.max_bytes,
+                'cache_hits': self.hits,
+                'cache_misses': self.misses,
+                'cache_evictions': self.evictions,
+                'cache_hit_rate': round(self.hits / lookups * 100, 2) if lookups > 0 else 0.0
+            }
+
+
+class DiskEmbeddingCache:
+    """
+    Persistent embedding cache backed by a local SQLite file.
+    
+    Shared by every uvicorn worker on the host and kept across restarts.
+    Keys already include the model name and version, so a model upgrade
+    never serves stale vectors; entries under any other key prefix are
+    deleted when the cache is opened. The file is capped at `max_rows`:
+    every PRUNE_EVERY writes, the oldest entries (by created_at) beyond the
+    cap are deleted. The database runs in WAL mode so readers in one worker
+    do not block writers in another. Any SQLite error is logged and treated
+    as a miss; the cache never breaks encoding.
+    
+    Args:
+        path: SQLite file
+        max_rows: Most entries kept (0 for no limit)
+        key_prefix: Prefix of keys for the current model; other entries are dropped
+    """
+    
+    PRUNE_EVERY = 1000  # Writes between size checks
+    
+    def __init__(self, path: str, max_rows: int = 0, key_prefix: str = ""):
+        self.path = path
+        self.max_rows = max(0, max_rows)
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.pruned = 0
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, created_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_created_at ON embeddings (created_at)")
+        if key_prefix:
+            # Vectors of other model versions or backends can never be read again
+            cursor = conn.execute(
+                "DELETE FROM embeddings WHERE substr(key, 1, ?) != ?", (len(key_prefix), key_prefix)
+            )
+            self.pruned += max(cursor.rowcount, 0)
+        conn.commit()
+        self.prune()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection (sqlite3 connections are not shareable)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Get a vector by key, or None on miss or error."""
+        try:
+            row = self._connect().execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk embedding cache read failed: {str(e)}")
+            return None
+        
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return np.frombuffer(row[0], dtype=EmbeddingService._vector_dtype)
+    
+    def put(self, key: str, vector) -> None:
+        """Store a vector; existing keys are left untouched."""
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR IGNORE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                (key, np.asarray(vector, dtype=EmbeddingService._vector_dtype).tobytes(), time.time())
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk embedding cache write failed: {str(e)}")
+            return
+        
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            self.prune()
+    
+    def prune(self) -> int:
+        """Delete the oldest entries beyond max_rows; returns the number deleted."""
+        if not self.max_rows:
+            return 0
+        try:
+            conn = self._connect()
+            excess = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] - self.max_rows
+            if excess <= 0:
+                return 0
+            conn.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY created_at LIMIT ?)",
+                (excess,)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk embedding cache prune failed: {str(e)}")
+            return 0
+        self.pruned += excess
+        return excess
+    
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM embeddings")
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk embedding cache clear failed: {str(e)}")
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss/error counters for this worker."""
+        lookups = self.hits + self.misses
+        return {
+            'disk_cache_path': self.path,
+            'disk_cache_hits': self.hits,
+            'disk_cache_misses': self.misses,
+            'disk_cache_errors': self.errors,
+            'disk_cache_pruned': self.pruned,
+            'disk_cache_hit_rate': round(self.hits / lookups * 100, 2) if lookups > 0 else 0.0
+        }
+
+
 class EmbeddingService:
     """
     Service for generating text embeddings using sentence-transformers.
@@ -87,29 +328,63 @@ class EmbeddingService:
     _model_name = "all-mpnet-base-v2"
     _model_version = "2.3.1"
     _embedding_dim = 768
+    _vector_dtype = np.dtype("<f4")  # Little-endian float32 for binary storage
     _model_loaded = False
-    _cache: Dict[str, List[float]] = {}
-    _cache_size = 1000
-    _cache_hits = 0
-    _cache_misses = 0
+    _warmed_up = False
+    _warm_up_words = (8, 64, 256)  # Sequence lengths exercised during warm-up
+    _cache = EmbeddingCache(settings.EMBEDDING_CACHE_MAX_BYTES)
+    _disk_cache: Optional[DiskEmbeddingCache] = None
+    _disk_cache_checked = False
+    _disk_cache_lock = threading.Lock()
+    _batcher: Optional[MicroBatcher] = None
+    _executor: Optional[InferenceExecutor] = None
+    _executor_lock = threading.Lock()
+    _batcher_lock = threading.Lock()
+    
+    @classmethod
+    def _load_backend(cls):
+        """
+        Instantiate the inference backend selected by EMBEDDING_BACKEND.
+        
+        "torch" uses sentence-transformers; "onnx" and "onnx-int8" use the
+        exported model under EMBEDDING_ONNX_PATH via onnxruntime.
+        """
+        backend = settings.EMBEDDING_BACKEND
+        
+        if backend == "torch":
+            return SentenceTransformer(cls._model_name)
+        
+        if backend in ("onnx", "onnx-int8"):
+            from .onnx_backend import OnnxEmbeddingModel
+            return OnnxEmbeddingModel(
+                settings.EMBEDDING_ONNX_PATH,
+                quantized=backend == "onnx-int8",
+                num_threads=settings.EMBEDDING_TORCH_THREADS
+            )
+        
+        raise ValueError(f"Unknown embedding backend: {backend}")
     
     @classmethod
     def get_model(cls) -> SentenceTransformer:
         """
-        Lazy-load the sentence-transformer model with error handling.
+        Lazy-load the embedding model with error handling.
         
         Returns:
-            SentenceTransformer: The loaded embedding model
+            SentenceTransformer: The loaded embedding model (or an ONNX
+            backend exposing the same `encode` interface)
             
         Raises:
             ModelLoadError: If model fails to load
         """
         if cls._model is None:
             try:
-                logger.info(f"Loading embedding model: {cls._model_name} (version: {cls._model_version})")
+                logger.info(
+                    f"Loading embedding model: {cls._model_name} (version: {cls._model_version}, "
+                    f"backend: {settings.EMBEDDING_BACKEND})"
+                )
                 start_time = time.time()
                 
-                cls._model = SentenceTransformer(cls._model_name)
+                cls._model = cls._load_backend()
                 
                 # Validate embedding dimension
                 test_embedding = cls._model.encode("test")
@@ -145,6 +420,37 @@ class EmbeddingService:
         """Check if model is loaded."""
         return cls._model_loaded
     
+    @classmethod
+    def is_warmed_up(cls) -> bool:
+        """Check if the model is loaded and has run its warm-up batches."""
+        return cls._model_loaded and cls._warmed_up
+    
+    @classmethod
+    def warm_up(cls):
+        """
+        Load the model and run warm-up batches at several sequence lengths.
+        
+        The first encodes at a new shape are much slower than steady state
+        (allocator growth, kernel selection), so this runs them before any
+        user request does. Batches go through the inference pool so its
+        threads are started as well.
+        
+        Raises:
+            ModelLoadError: If the model fails to load
+        """
+        start_time = time.time()
+        cls.get_model()
+        
+        batch_size = max(1, settings.EMBEDDING_BATCH_MAX_SIZE)
+        for words in cls._warm_up_words:
+            texts = [" ".join(["renewable energy engineer"] * (words // 3 + 1))] * batch_size
+            cls._get_executor().submit(cls._encode_batch_now, texts, block=True).result()
+        
+        duration = time.time() - start_time
+        perf_monitor.record_time('warm_up', duration)
+        cls._warmed_up = True
+        logger.info(f"Embedding model warmed up in {duration:.2f}s")
+    
     @classmethod
     def get_model_info(cls) -> Dict[str, any]:
         """Get model information."""
@@ -152,40 +458,190 @@ class EmbeddingService:
             'model_name': cls._model_name,
             'model_version': cls._model_version,
             'embedding_dim': cls._embedding_dim,
+            'backend': settings.EMBEDDING_BACKEND,
             'model_loaded': cls._model_loaded,
-            'cache_size': len(cls._cache),
-            'cache_hits': cls._cache_hits,
-            'cache_misses': cls._cache_misses,
-            'cache_hit_rate': round(
-                (cls._cache_hits / (cls._cache_hits + cls._cache_misses) * 100), 2
-            ) if (cls._cache_hits + cls._cache_misses) > 0 else 0.0
+            'warmed_up': cls._warmed_up,
+            **cls._cache.get_stats(),
+            **(cls._disk_cache.get_stats() if cls._disk_cache else {})
         }
     
+    @classmethod
+    def get_embedding_version(cls) -> str:
+        """Version tag stored next to persisted vectors; rows with another tag are re-embedded."""
+        return f"{cls._model_name}:{cls._model_version}"
+    
+    @classmethod
+    def _cache_key_prefix(cls) -> str:
+        """Prefix shared by every cache key of the current model name, version and backend."""
+        return f"{cls._model_name}:{cls._model_version}:{settings.EMBEDDING_BACKEND}:"
+    
     @classmethod
     def _get_cache_key(cls, text: str) -> str:
-        """Generate cache key for text."""
-        return hashlib.md5(text.encode()).hexdigest()
+        """Generate cache key for text, scoped to the model name, version and backend."""
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        return f"{cls._cache_key_prefix()}{text_hash}"
+    
+    @classmethod
+    def _get_disk_cache(cls) -> Optional[DiskEmbeddingCache]:
+        """Open the persistent cache tier once, if it is configured."""
+        if not cls._disk_cache_checked:
+            with cls._disk_cache_lock:
+                if not cls._disk_cache_checked and settings.EMBEDDING_DISK_CACHE_PATH:
+                    try:
+                        cls._disk_cache = DiskEmbeddingCache(
+                            settings.EMBEDDING_DISK_CACHE_PATH,
+                            max_rows=settings.EMBEDDING_DISK_CACHE_MAX_ROWS,
+                            key_prefix=cls._cache_key_prefix()
+                        )
+                        logger.info(f"Disk embedding cache enabled at {settings.EMBEDDING_DISK_CACHE_PATH}")
+                    except (OSError, sqlite3.Error) as e:
+                        logger.warning(f"Disk embedding cache disabled: {str(e)}")
+                cls._disk_cache_checked = True
+        return cls._disk_cache
+    
+    @classmethod
+    def _get_from_cache(cls, cache_key: str) -> Optional[np.ndarray]:
+        """Get embedding from the memory cache, falling back to the disk cache."""
+        embedding = cls._cache.get(cache_key)
+        EMBEDDING_CACHE_LOOKUPS.labels(tier="memory", result="miss" if embedding is None else "hit").inc()
+        if embedding is not None:
+            return embedding
+        
+        disk_cache = cls._get_disk_cache()
+        if disk_cache is not None:
+            embedding = disk_cache.get(cache_key)
+            EMBEDDING_CACHE_LOOKUPS.labels(tier="disk", result="miss" if embedding is None else "hit").inc()
+            if embedding is not None:
+                cls._cache.put(cache_key, embedding)
+        
+        return embedding
+    
+    @classmethod
+    def _add_to_cache(cls, cache_key: str, embedding: np.ndarray):
+        """Add embedding to the memory cache and the disk cache."""
+        cls._cache.put(cache_key, embedding)
+        
+        disk_cache = cls._get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.put(cache_key, embedding)
+    
+    @classmethod
+    def _get_executor(cls) -> InferenceExecutor:
+        """Create the dedicated inference thread pool on first use."""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = InferenceExecutor(
+                        max_workers=settings.EMBEDDING_INFERENCE_WORKERS,
+                        max_pending=settings.EMBEDDING_INFERENCE_MAX_PENDING,
+                        torch_threads=settings.EMBEDDING_TORCH_THREADS
+                    )
+        return cls._executor
     
     @classmethod
-    def _get_from_cache(cls, cache_key: str) -> Optional[List[float]]:
-        """Get embedding from cache."""
-        if cache_key in cls._cache:
-            cls._cache_hits += 1
-            return cls._cache[cache_key]
-        return None
+    def _get_batcher(cls) -> MicroBatcher:
+        """Create the micro-batcher that coalesces concurrent single-text encodes."""
+        if cls._batcher is None:
+            with cls._batcher_lock:
+                if cls._batcher is None:
+                    cls._batcher = MicroBatcher(
+                        cls._run_micro_batch,
+                        max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+                        max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS,
+                        max_queue_size=settings.EMBEDDING_INFERENCE_MAX_PENDING,
+                        name="encode_text"
+                    )
+        return cls._batcher
+    
+    @classmethod
+    def _run_micro_batch(cls, texts: List[str]) -> np.ndarray:
+        """Run a coalesced batch on the inference pool (called from the batcher thread)."""
+        return cls._get_executor().submit(cls._encode_micro_batch, texts, block=True).result()
     
     @classmethod
-    def _add_to_cache(cls, cache_key: str, embedding: List[float]):
-        """Add embedding to cache."""
-        if len(cls._cache) < cls._cache_size:
-            cls._cache[cache_key] = embedding
-        cls._cache_misses += 1
+    def _encode_micro_batch(cls, texts: List[str]) -> np.ndarray:
+        """Run one batched model call for texts coalesced by the micro-batcher."""
+        start_time = time.time()
+        
+        model = cls.get_model()
+        EMBEDDING_BATCH_SIZE.labels(kind="micro_batch").observe(len(texts))
+        embeddings = model.encode(texts, batch_size=len(texts), convert_to_numpy=True)
+        
+        perf_monitor.record_time('encode_micro_batch', time.time() - start_time)
+        return embeddings
+    
+    @classmethod
+    def _encode_single(cls, text: str) -> np.ndarray:
+        """Run one unbatched model call (used when micro-batching is disabled)."""
+        model = cls.get_model()
+        return model.encode(text, convert_to_numpy=True)
+    
+    @classmethod
+    def _submit_encode(cls, text: str) -> Future:
+        """Schedule a single text for encoding off the calling thread."""
+        if settings.EMBEDDING_BATCHING_ENABLED:
+            return cls._get_batcher().submit(text)
+        return cls._get_executor().submit(cls._encode_single, text)
+    
+    @classmethod
+    def _validate_text(cls, text: str) -> bool:
+        """
+        Validate a single input text.
+        
+        Returns:
+            bool: False if the text is empty and should map to a zero vector
+            
+        Raises:
+            EmbeddingError: If the text is too long
+        """
+        if not text or not text.strip():
+            logger.warning("Empty text provided for encoding")
+            return False
+        
+        max_chars = settings.EMBEDDING_MAX_TEXT_CHARS
+        if len(text) > max_chars:
+            logger.warning(f"Text exceeds maximum length of {max_chars} characters: {len(text)}")
+            raise EmbeddingError(f"Text exceeds maximum length of {max_chars} characters")
+        
+        return True
+    
+    @classmethod
+    def _is_long_text(cls, text: str) -> bool:
+        """Check whether a text goes through long-document (chunked) encoding."""
+        return len(text) > settings.EMBEDDING_CHUNK_THRESHOLD_CHARS
+    
+    @classmethod
+    def _finish_encode(cls, cache_key: str, embedding: np.ndarray, start_time: float) -> List[float]:
+        """Validate a fresh embedding, record timing and cache it."""
+        # Validate embedding
+        if len(embedding) != cls._embedding_dim:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {cls._embedding_dim}, "
+                f"got {len(embedding)}"
+            )
+        
+        # Ensure float32 for database compatibility
+        embedding = embedding.astype(np.float32)
+        
+        # Validate embedding values
+        if not np.all(np.abs(embedding) <= 1.0):
+            raise ValueError("Embedding values outside expected range [-1.0, 1.0]")
+        
+        duration = time.time() - start_time
+        perf_monitor.record_time('encode_text', duration)
+        
+        # Add to cache
+        cls._add_to_cache(cache_key, embedding)
+        
+        return embedding.tolist()
     
     @classmethod
     def encode_text(cls, text: str) -> List[float]:
         """
         Convert a single text string to an embedding vector.
         
+        The model runs on the inference pool; this thread only waits.
+        
         Args:
             text: Input text to encode
             
@@ -194,51 +650,69 @@ class EmbeddingService:
             
         Raises:
             EmbeddingError: If encoding fails
+            InferenceBusyError: If the inference queue is full
         """
-        # Input validation
-        if not text or not text.strip():
-            logger.warning("Empty text provided for encoding")
+        if not cls._validate_text(text):
             return [0.0] * cls._embedding_dim
         
-        # Length validation
-        if len(text) > 10000:
-            logger.warning(f"Text exceeds maximum length of 10000 characters: {len(text)}")
-            raise EmbeddingError(f"Text exceeds maximum length of 10000 characters")
+        if cls._is_long_text(text):
+            return cls.encode_long_text(text)
         
         # Check cache
         cache_key = cls._get_cache_key(text)
         cached_embedding = cls._get_from_cache(cache_key)
         if cached_embedding is not None:
-            return cached_embedding
+            return cached_embedding.tolist()
         
         # Encode text
         try:
             start_time = time.time()
+            embedding = cls._submit_encode(text).result()
+            return cls._finish_encode(cache_key, embedding, start_time)
+        except InferenceBusyError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to encode text: {str(e)}")
+            raise EmbeddingError(f"Failed to encode text: {str(e)}")
+    
+    @classmethod
+    async def aencode_text(cls, text: str) -> List[float]:
+        """
+        Async version of encode_text that never blocks the event loop.
+        
+        Args:
+            text: Input text to encode
             
-            model = cls.get_model()
-            embedding = model.encode(text, convert_to_numpy=True)
-            
-            # Validate embedding
-            if len(embedding) != cls._embedding_dim:
-                raise ValueError(
-                    f"Embedding dimension mismatch: expected {cls._embedding_dim}, "
-                    f"got {len(embedding)}"
-                )
-            
-            # Ensure float32 for database compatibility
-            embedding = embedding.astype(np.float32)
-            
-            # Validate embedding values
-            if not all(-1.0 <= x <= 1.0 for x in embedding):
-                raise ValueError("Embedding values outside expected range [-1.0, 1.0]")
-            
-            duration = time.time() - start_time
-            perf_monitor.record_time('encode_text', duration)
-            
-            # Add to cache
-            cls._add_to_cache(cache_key, embedding.tolist())
+        Returns:
+            List[float]: 768-dimensional embedding vector
             
-            return embedding.tolist()
+        Raises:
+            EmbeddingError: If encoding fails
+            InferenceBusyError: If the inference queue is full
+        """
+        if not cls._validate_text(text):
+            return [0.0] * cls._embedding_dim
+        
+        # Long documents skip the micro-batcher: their chunks already form a batch
+        long_text = cls._is_long_text(text)
+        pooling = settings.EMBEDDING_CHUNK_POOLING
+        
+        # Check cache
+        cache_key = cls._get_long_cache_key(text, pooling) if long_text else cls._get_cache_key(text)
+        cached_embedding = cls._get_from_cache(cache_key)
+        if cached_embedding is not None:
+            return cached_embedding.tolist()
+        
+        # Encode text
+        try:
+            start_time = time.time()
+            if long_text:
+                embedding = (await cls._get_executor().run(cls._encode_batch_now, [text], pooling))[0]
+            else:
+                embedding = await asyncio.wrap_future(cls._submit_encode(text))
+            return cls._finish_encode(cache_key, embedding, start_time)
+        except InferenceBusyError:
+            raise
         except Exception as e:
             logger.error(f"Failed to encode text: {str(e)}")
             raise EmbeddingError(f"Failed to encode text: {str(e)}")
@@ -261,81 +735,281 @@ class EmbeddingService:
             return [0.0] * cls._embedding_dim
     
     @classmethod
-    def encode_user_skills(cls, skills: List[str]) -> List[float]:
+    def encode_user_skills(cls, skills: List[str], weights: Optional[List[float]] = None) -> List[float]:
         """
-        Encode a list of user skills into a single embedding vector.
+        Encode a list of user (or job) skills into a single embedding vector.
+        
+        The vector is the weighted mean of per-skill vectors from the skill
+        vocabulary, so only skills never seen before reach the model and the
+        result does not depend on skill order or case.
         
         Args:
             skills: List of skill strings
+            weights: Optional weight per skill
             
         Returns:
             List[float]: 768-dimensional embedding vector
             
         Raises:
-            EmbeddingError: If encoding fails
+            EmbeddingError: If encoding new skills fails
         """
         if not skills:
             logger.warning("Empty skills list provided for encoding")
             return [0.0] * cls._embedding_dim
         
-        # Combine skills into a single text
-        skills_text = " ".join(skills)
+        from .skill_vectors import skill_vocabulary
         
-        return cls.encode_text(skills_text)
+        start_time = time.time()
+        embedding = skill_vocabulary.compose(skills, weights)
+        perf_monitor.record_time('encode_skills', time.time() - start_time)
+        return embedding.tolist()
     
     @classmethod
-    def encode_batch(cls, texts: List[str]) -> List[List[float]]:
+    def _get_long_cache_key(cls, text: str, pooling: str) -> str:
+        """Cache key for a pooled long-document vector, scoped to the chunking settings."""
+        return (
+            f"{cls._get_cache_key(text)}:chunked:{pooling}:"
+            f"{settings.EMBEDDING_CHUNK_TOKENS}:{settings.EMBEDDING_CHUNK_OVERLAP_TOKENS}"
+        )
+    
+    @classmethod
+    def encode_long_text(cls, text: str, pooling: Optional[str] = None) -> List[float]:
         """
-        Encode multiple texts in a batch for better performance.
+        Encode a long document as one vector pooled over token-window chunks.
+        
+        The text is split into overlapping windows of EMBEDDING_CHUNK_TOKENS
+        tokens, all chunks are encoded in one batched model call, and the
+        chunk vectors are pooled and L2-normalized. Texts at or under
+        EMBEDDING_CHUNK_THRESHOLD_CHARS are encoded whole.
         
         Args:
-            texts: List of text strings to encode
+            text: Input text to encode
+            pooling: "mean" or "weighted" (defaults to EMBEDDING_CHUNK_POOLING)
             
         Returns:
-            List[List[float]]: List of 768-dimensional embedding vectors
+            List[float]: 768-dimensional embedding vector
             
         Raises:
             EmbeddingError: If encoding fails
+            InferenceBusyError: If the inference queue is full
         """
-        if not texts:
-            return []
+        if not cls._validate_text(text):
+            return [0.0] * cls._embedding_dim
         
-        # Validate input
+        pooling = pooling or settings.EMBEDDING_CHUNK_POOLING
+        cache_key = cls._get_long_cache_key(text, pooling)
+        cached_embedding = cls._get_from_cache(cache_key)
+        if cached_embedding is not None:
+            return cached_embedding.tolist()
+        
+        try:
+            start_time = time.time()
+            embedding = cls._get_executor().submit(cls._encode_batch_now, [text], pooling).result()[0]
+            return cls._finish_encode(cache_key, embedding, start_time)
+        except InferenceBusyError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to encode long text: {str(e)}")
+            raise EmbeddingError(f"Failed to encode long text: {str(e)}")
+    
+    @classmethod
+    def _encode_passages_now(cls, text: str, pooling: str) -> Tuple[np.ndarray, List[tuple], np.ndarray]:
+        """Chunk and encode one text in a single model call (executes on the inference pool)."""
+        model = cls.get_model()
+        spans = cls._chunk_text(model, text) or [(0, len(text), 0)]
+        embeddings = model.encode(
+            [text[start:end] for start, end, _ in spans], convert_to_numpy=True
+        ).astype(np.float32)
+        pooled = pool_embeddings(embeddings, [tokens for _, _, tokens in spans], mode=pooling)
+        return pooled, spans, embeddings
+    
+    @classmethod
+    def encode_passages(cls, text: str, pooling: Optional[str] = None) -> Dict[str, any]:
+        """
+        Encode a document and keep its chunk embeddings for passage-level matching.
+        
+        Unlike encode_long_text, every text is chunked regardless of length
+        and nothing is cached.
+        
+        Args:
+            text: Input text to encode
+            pooling: "mean" or "weighted" (defaults to EMBEDDING_CHUNK_POOLING)
+            
+        Returns:
+            Dict[str, any]: 'embedding' (pooled vector) and 'passages', a list
+            of {'start', 'end', 'tokens', 'embedding'} per chunk
+            
+        Raises:
+            EmbeddingError: If encoding fails
+            InferenceBusyError: If the inference queue is full
+        """
+        if not cls._validate_text(text):
+            return {'embedding': [0.0] * cls._embedding_dim, 'passages': []}
+        
+        pooling = pooling or settings.EMBEDDING_CHUNK_POOLING
+        try:
+            start_time = time.time()
+            pooled, spans, embeddings = cls._get_executor().submit(
+                cls._encode_passages_now, text, pooling
+            ).result()
+            perf_monitor.record_time('encode_passages', time.time() - start_time)
+        except InferenceBusyError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to encode passages: {str(e)}")
+            raise EmbeddingError(f"Failed to encode passages: {str(e)}")
+        
+        return {
+            'embedding': pooled.tolist(),
+            'passages': [
+                {'start': start, 'end': end, 'tokens': tokens, 'embedding': embedding.tolist()}
+                for (start, end, tokens), embedding in zip(spans, embeddings)
+            ]
+        }
+    
+    @classmethod
+    def _validate_batch(cls, texts: List[str]):
+        """Validate batch input in place; empty texts become empty strings."""
         for i, text in enumerate(texts):
             if not text or not text.strip():
                 logger.warning(f"Empty text at index {i} in batch")
                 texts[i] = ""
-            elif len(text) > 10000:
+            elif len(text) > settings.EMBEDDING_MAX_TEXT_CHARS:
                 logger.warning(f"Text at index {i} exceeds maximum length")
-                raise EmbeddingError(f"Text at index {i} exceeds maximum length of 10000 characters")
+                raise EmbeddingError(
+                    f"Text at index {i} exceeds maximum length of "
+                    f"{settings.EMBEDDING_MAX_TEXT_CHARS} characters"
+                )
+    
+    @classmethod
+    def _chunk_text(cls, model, text: str) -> List[Tuple[int, int, int]]:
+        """Split a long text into token windows using the model's tokenizer."""
+        return chunk_text(
+            text,
+            getattr(model, "tokenizer", None),
+            max_tokens=settings.EMBEDDING_CHUNK_TOKENS,
+            overlap=settings.EMBEDDING_CHUNK_OVERLAP_TOKENS
+        )
+    
+    @classmethod
+    def _expand_chunks(cls, model, texts: List[str]) -> Tuple[List[str], List[tuple]]:
+        """
+        Flatten texts into model inputs, replacing long texts by their chunks.
         
-        try:
-            start_time = time.time()
-            
-            model = cls.get_model()
-            embeddings = model.encode(texts, convert_to_numpy=True)
-            
-            # Validate embeddings
-            if len(embeddings) != len(texts):
+        Returns:
+            Tuple of the model inputs and, per text, (first_input, end_input,
+            spans) where spans is None for texts encoded whole
+        """
+        inputs = []
+        groups = []
+        for text in texts:
+            spans = cls._chunk_text(model, text) if cls._is_long_text(text) else None
+            if spans:
+                groups.append((len(inputs), len(inputs) + len(spans), spans))
+                inputs.extend(text[start:end] for start, end, _ in spans)
+            else:
+                groups.append((len(inputs), len(inputs) + 1, None))
+                inputs.append(text)
+        return inputs, groups
+    
+    @classmethod
+    def _encode_batch_now(cls, texts: List[str], pooling: Optional[str] = None) -> np.ndarray:
+        """
+        Run and validate a batched model call (executes on the inference pool).
+        
+        Long texts are split into chunks that are encoded in the same model
+        call as the other texts, then pooled back into one vector each.
+        """
+        start_time = time.time()
+        pooling = pooling or settings.EMBEDDING_CHUNK_POOLING
+        
+        model = cls.get_model()
+        inputs, groups = cls._expand_chunks(model, texts)
+        EMBEDDING_BATCH_SIZE.labels(kind="batch").observe(len(inputs))
+        embeddings = model.encode(inputs, convert_to_numpy=True)
+        
+        if any(spans is not None for _, _, spans in groups):
+            embeddings = np.vstack([
+                embeddings[first] if spans is None else pool_embeddings(
+                    embeddings[first:end], [tokens for _, _, tokens in spans], mode=pooling
+                )
+                for first, end, spans in groups
+            ])
+        
+        # Validate embeddings
+        if len(embeddings) != len(texts):
+            raise ValueError(
+                f"Number of embeddings ({len(embeddings)}) does not match "
+                f"number of texts ({len(texts)})"
+            )
+        
+        for i, embedding in enumerate(embeddings):
+            if len(embedding) != cls._embedding_dim:
                 raise ValueError(
-                    f"Number of embeddings ({len(embeddings)}) does not match "
-                    f"number of texts ({len(texts)})"
+                    f"Embedding at index {i} has wrong dimension: "
+                    f"expected {cls._embedding_dim}, got {len(embedding)}"
                 )
+        
+        duration = time.time() - start_time
+        perf_monitor.record_time('encode_batch', duration)
+        
+        # Ensure float32 for database compatibility
+        return embeddings.astype(np.float32)
+    
+    @classmethod
+    def encode_batch(cls, texts: List[str]) -> List[List[float]]:
+        """
+        Encode multiple texts in a batch for better performance.
+        
+        Args:
+            texts: List of text strings to encode
             
-            for i, embedding in enumerate(embeddings):
-                if len(embedding) != cls._embedding_dim:
-                    raise ValueError(
-                        f"Embedding at index {i} has wrong dimension: "
-                        f"expected {cls._embedding_dim}, got {len(embedding)}"
-                    )
+        Returns:
+            List[List[float]]: List of 768-dimensional embedding vectors
             
-            # Ensure float32 for database compatibility
-            embeddings = embeddings.astype(np.float32)
+        Raises:
+            EmbeddingError: If encoding fails
+            InferenceBusyError: If the inference queue is full
+        """
+        if not texts:
+            return []
+        
+        cls._validate_batch(texts)
+        
+        try:
+            embeddings = cls._get_executor().submit(cls._encode_batch_now, texts).result()
+            return [emb.tolist() for emb in embeddings]
+        except InferenceBusyError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to encode batch: {str(e)}")
+            raise EmbeddingError(f"Failed to encode batch: {str(e)}")
+    
+    @classmethod
+    async def aencode_batch(cls, texts: List[str]) -> List[List[float]]:
+        """
+        Async version of encode_batch that never blocks the event loop.
+        
+        Args:
+            texts: List of text strings to encode
             
-            duration = time.time() - start_time
-            perf_monitor.record_time('encode_batch', duration)
+        Returns:
+            List[List[float]]: List of 768-dimensional embedding vectors
             
+        Raises:
+            EmbeddingError: If encoding fails
+            InferenceBusyError: If the inference queue is full
+        """
+        if not texts:
+            return []
+        
+        cls._validate_batch(texts)
+        
+        try:
+            embeddings = await cls._get_executor().run(cls._encode_batch_now, texts)
             return [emb.tolist() for emb in embeddings]
+        except InferenceBusyError:
+            raise
         except Exception as e:
             logger.error(f"Failed to encode batch: {str(e)}")
             raise EmbeddingError(f"Failed to encode batch: {str(e)}")
@@ -375,6 +1049,69 @@ class EmbeddingService:
         except Exception as e:
             raise ValueError(f"Failed to parse vector: {str(e)}")
     
+    @classmethod
+    def vector_to_bytes(cls, vector) -> bytes:
+        """
+        Convert vector to packed float32 bytes for binary column storage.
+        
+        Args:
+            vector: Vector as list of floats or numpy array
+            
+        Returns:
+            bytes: Little-endian float32 representation (dim * 4 bytes)
+            
+        Raises:
+            ValueError: If vector is malformed
+        """
+        try:
+            array = np.asarray(vector, dtype=cls._vector_dtype)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Vector must contain only numbers: {str(e)}")
+        
+        if array.shape != (cls._embedding_dim,):
+            raise ValueError(
+                f"Vector dimension mismatch: expected {cls._embedding_dim}, "
+                f"got {array.shape}"
+            )
+        
+        return array.tobytes()
+    
+    @classmethod
+    def bytes_to_vector(cls, data) -> np.ndarray:
+        """
+        Convert stored embedding bytes to a vector without copying.
+        
+        Binary values are wrapped with `np.frombuffer`, so the returned array
+        is a read-only view over the column value. Legacy JSON text values
+        (from the old String(5000) columns) are still accepted so reads keep
+        working while the migration is in progress.
+        
+        Args:
+            data: Packed float32 bytes, or legacy JSON text/bytes
+            
+        Returns:
+            np.ndarray: float32 vector of shape (dim,)
+            
+        Raises:
+            ValueError: If data is neither a binary nor a JSON vector
+        """
+        if data is None:
+            raise ValueError("Vector data is empty")
+        
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if len(data) == cls._embedding_dim * cls._vector_dtype.itemsize:
+                return np.frombuffer(data, dtype=cls._vector_dtype)
+            
+            try:
+                data = bytes(data).decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError(
+                    f"Vector byte length mismatch: expected "
+                    f"{cls._embedding_dim * cls._vector_dtype.itemsize}, got {len(data)}"
+                )
+        
+        return np.asarray(cls.json_to_vector(data), dtype=np.float32)
+    
     @classmethod
     def vector_to_json(cls, vector: List[float]) -> str:
         """
@@ -409,8 +1146,8 @@ class EmbeddingService:
         Calculate cosine similarity between two vectors.
         
         Args:
-            vec1: First vector
-            vec2: Second vector
+            vec1: First vector (list or numpy array)
+            vec2: Second vector (list or numpy array)
             
         Returns:
             float: Cosine similarity score between -1.0 and 1.0
@@ -425,15 +1162,16 @@ class EmbeddingService:
                 f"got {len(vec1)} and {len(vec2)}"
             )
         
-        if not all(isinstance(x, (int, float)) for x in vec1):
+        try:
+            v1 = np.asarray(vec1, dtype=np.float32)
+        except (TypeError, ValueError):
             raise ValueError("vec1 must contain only numbers")
         
-        if not all(isinstance(x, (int, float)) for x in vec2):
+        try:
+            v2 = np.asarray(vec2, dtype=np.float32)
+        except (TypeError, ValueError):
             raise ValueError("vec2 must contain only numbers")
         
-        v1 = np.array(vec1, dtype=np.float32)
-        v2 = np.array(vec2, dtype=np.float32)
-        
         dot_product = np.dot(v1, v2)
         norm1 = np.linalg.norm(v1)
         norm2 = np.linalg.norm(v2)
@@ -458,15 +1196,17 @@ class EmbeddingService:
         """
         return {
             'model_info': cls.get_model_info(),
-            'performance': perf_monitor.get_all_stats()
+            'performance': perf_monitor.get_all_stats(),
+            'batching': cls._batcher.get_stats() if cls._batcher else {},
+            'inference': cls._executor.get_stats() if cls._executor else {}
         }
     
     @classmethod
     def clear_cache(cls):
-        """Clear the embedding cache."""
+        """Clear the embedding cache (memory and disk tiers)."""
         cls._cache.clear()
-        cls._cache_hits = 0
-        cls._cache_misses = 0
+        if cls._disk_cache is not None:
+            cls._disk_cache.clear()
         logger.info("Embedding cache cleared")
 
 
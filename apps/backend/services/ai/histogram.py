@@ -0,0 +1,158 @@
+"""
+Streaming Latency Histograms
+Fixed-memory, log-bucketed duration histograms with sliding windows
+
+Durations fall into logarithmic buckets (HDR-style) with bounded relative
+error, so memory is fixed no matter how many samples are recorded and a
+percentile query walks the buckets instead of sorting samples.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+# Sliding windows reported alongside lifetime stats (label -> seconds)
+WINDOWS = {'1m': 60, '5m': 300, '1h': 3600}
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram of durations in seconds.
+
+    Bucket i covers [min_value * base**i, min_value * base**(i + 1)) with
+    base = 1 + precision, so every reported percentile is within
+    `precision` (relative) of the true sample value. Values outside
+    [min_value, max_value] are clamped into the first or last bucket.
+    """
+
+    def __init__(self, min_value: float = 1e-6, max_value: float = 3600.0, precision: float = 0.02):
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_base = math.log1p(precision)
+        self._log_min = math.log(min_value)
+        self.num_buckets = int(math.ceil((math.log(max_value) - self._log_min) / self._log_base)) + 1
+
+    def bucket_for(self, value: float) -> int:
+        """Bucket index of a value."""
+        if value <= self.min_value:
+            return 0
+        index = int((math.log(value) - self._log_min) / self._log_base)
+        return min(index, self.num_buckets - 1)
+
+    def bucket_value(self, index: int) -> float:
+        """Representative (geometric midpoint) value of a bucket."""
+        return math.exp(self._log_min + (index + 0.5) * self._log_base)
+
+
+class _Slice:
+    """Sparse bucket counts for one time slice (or the lifetime total)."""
+
+    __slots__ = ('start', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, start: float = 0.0):
+        self.start = start
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, bucket: int, value: float):
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+
+class WindowedHistogram:
+    """
+    Lifetime histogram plus a ring of time slices for sliding-window stats.
+
+    Slices are `slice_seconds` wide and kept for the longest window, so a
+    window is exact to within one slice. Each slice stores only the
+    buckets it has seen, keeping memory bounded by buckets x slices.
+    """
+
+    def __init__(self, layout: Optional[LatencyHistogram] = None, slice_seconds: int = 10):
+        self.layout = layout or LatencyHistogram()
+        self.slice_seconds = slice_seconds
+        self._horizon = max(WINDOWS.values())
+        self._total = _Slice()
+        self._slices: deque = deque()
+        self._lock = threading.Lock()
+
+    def record(self, value: float, now: Optional[float] = None):
+        """Record one duration (seconds)."""
+        bucket = self.layout.bucket_for(value)
+        now = time.time() if now is None else now
+        slice_start = now - (now % self.slice_seconds)
+
+        with self._lock:
+            if not self._slices or self._slices[-1].start != slice_start:
+                self._slices.append(_Slice(slice_start))
+                while self._slices[0].start + self.slice_seconds <= now - self._horizon:
+                    self._slices.popleft()
+            self._slices[-1].add(bucket, value)
+            self._total.add(bucket, value)
+
+    def get_stats(self, window: Optional[str] = None, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Get count, min, max, avg and p50/p95/p99 for the lifetime or a window.
+
+        Args:
+            window: None for lifetime, or one of WINDOWS ('1m', '5m', '1h')
+
+        Returns:
+            Dict[str, float]: Statistics (empty if there are no samples)
+        """
+        with self._lock:
+            if window is None:
+                merged = self._total
+            else:
+                now = time.time() if now is None else now
+                cutoff = now - WINDOWS[window]
+                merged = _Slice()
+                for item in self._slices:
+                    if item.start + self.slice_seconds > cutoff:
+                        for bucket, count in item.counts.items():
+                            merged.counts[bucket] = merged.counts.get(bucket, 0) + count
+                        merged.count += item.count
+                        merged.total += item.total
+                        merged.min = min(merged.min, item.min)
+                        merged.max = max(merged.max, item.max)
+            return self._summarize(merged)
+
+    def _summarize(self, data: _Slice) -> Dict[str, float]:
+        """Turn merged bucket counts into summary statistics."""
+        if not data.count:
+            return {}
+
+        p50, p95, p99 = self._percentiles(data, (0.50, 0.95, 0.99))
+        return {
+            'count': data.count,
+            'min': round(data.min, 3),
+            'max': round(data.max, 3),
+            'avg': round(data.total / data.count, 3),
+            'p50': round(p50, 3),
+            'p95': round(p95, 3),
+            'p99': round(p99, 3)
+        }
+
+    def _percentiles(self, data: _Slice, quantiles) -> List[float]:
+        """Walk the buckets once, in order, to find each quantile."""
+        results = []
+        targets = [max(1, math.ceil(q * data.count)) for q in quantiles]
+        seen = 0
+        for bucket in sorted(data.counts):
+            seen += data.counts[bucket]
+            while targets[len(results):] and seen >= targets[len(results)]:
+                value = self.layout.bucket_value(bucket)
+                results.append(min(max(value, data.min), data.max))
+            if len(results) == len(targets):
+                break
+        return results
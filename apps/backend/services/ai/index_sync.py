@@ -0,0 +1,282 @@
+"""
+Job Index Sync
+Keeps job embeddings and the in-memory job indexes in step with job changes
+
+Job routes call `job_index_sync.notify` after each lifecycle transition. A
+background thread collects those events for a short window, embeds changed
+jobs in one batch, writes the vectors back, and upserts or tombstones them
+in the job vector index and the job keyword index. Every worker also polls
+recently updated jobs, and careers for the career keyword index, so changes
+made through another worker show up within seconds.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from apps.backend.core.config import settings
+from apps.backend.models.career import Career
+from apps.backend.models.job import Job, JobStatus
+from .embeddings import EmbeddingService
+from .keyword_index import career_keyword_index, job_keyword_index
+from .vector_index import job_index
+
+logger = logging.getLogger(__name__)
+
+
+def job_embedding_text(job) -> str:
+    """Text a job is embedded from: title, description, requirements and skills."""
+    parts = [job.title, job.description, job.requirements]
+    if job.required_skills:
+        parts.append(", ".join(str(skill) for skill in job.required_skills))
+    return ". ".join(part.strip() for part in parts if part and part.strip())
+
+
+def is_indexable(job) -> bool:
+    """Check whether a job belongs in the search index (mirrors indexable_job_criteria)."""
+    return bool(job.is_verified) and job.status == JobStatus.OPEN and job.is_active is not False
+
+
+class JobIndexSync:
+    """
+    Background worker that applies job changes to embeddings and the job index.
+
+    Events are keyed by job id, so repeated changes to one job inside the
+    debounce window are processed once.
+    """
+
+    def __init__(self, debounce_ms: float = 500.0, poll_seconds: float = 5.0, lookback_seconds: float = 60.0):
+        self.debounce = max(0.0, debounce_ms) / 1000.0
+        self.poll_seconds = poll_seconds
+        self.lookback = timedelta(seconds=lookback_seconds)
+        self._pending: Dict[int, bool] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_poll: Optional[datetime] = None
+
+        # Metrics
+        self.processed = 0
+        self.embedded = 0
+        self.upserted = 0
+        self.removed = 0
+        self.errors = 0
+
+    def notify(self, job_id: int, reembed: bool = False):
+        """
+        Record that a job changed.
+
+        Args:
+            job_id: Changed job
+            reembed: The job's text changed (created or edited), so its
+                embedding must be recomputed
+        """
+        with self._lock:
+            self._pending[job_id] = self._pending.get(job_id, False) or reembed
+        self.start()
+        self._wake.set()
+
+    def start(self):
+        """Start the background thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="job-index-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background thread after it finishes the current batch."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        """Worker loop: wait for events or the poll interval, then apply changes."""
+        next_poll = time.monotonic()
+        while not self._stop.is_set():
+            timeout = max(0.0, next_poll - time.monotonic()) if self.poll_seconds > 0 else None
+            if self._wake.wait(timeout):
+                # Let related changes (e.g. verify then publish) land in one batch
+                time.sleep(self.debounce)
+
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._wake.clear()
+
+            if pending:
+                try:
+                    self.sync_jobs(pending)
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Job index sync of {len(pending)} jobs failed, retrying: {str(e)}")
+                    # Retry on the next poll tick
+                    with self._lock:
+                        for job_id, reembed in pending.items():
+                            self._pending[job_id] = self._pending.get(job_id, False) or reembed
+
+            if self.poll_seconds > 0 and time.monotonic() >= next_poll:
+                next_poll = time.monotonic() + self.poll_seconds
+                try:
+                    self.poll_changes()
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Job index poll failed: {str(e)}")
+
+    def sync_jobs(self, changes: Dict[int, bool]):
+        """
+        Embed changed jobs in one batch, store the vectors and update the index.
+
+        Args:
+            changes: job id -> whether the job needs a fresh embedding
+        """
+        from apps.backend.db.session import SessionLocal
+
+        db = SessionLocal()
+        try:
+            jobs = db.query(Job).filter(Job.id.in_(list(changes))).all()
+            found = {job.id for job in jobs}
+
+            # Deleted jobs
+            for job_id in changes:
+                if job_id not in found:
+                    job_keyword_index.remove(job_id)
+                    if job_index.remove(job_id):
+                        self.removed += 1
+
+            to_embed = [
+                job for job in jobs
+                if changes[job.id] or (job.embedding is None and is_indexable(job))
+            ]
+            vectors = {}
+            if to_embed:
+                embeddings = EmbeddingService.encode_batch([job_embedding_text(job) for job in to_embed])
+                vectors = {job.id: embedding for job, embedding in zip(to_embed, embeddings)}
+
+            # Decide index updates before commit expires the loaded jobs
+            upserts = []
+            removals = []
+            keyword_upserts = []
+            keyword_removals = []
+            for job in jobs:
+                if job.is_verified:
+                    keyword_upserts.append((job.id, job_keyword_index.field_texts(job)))
+                else:
+                    keyword_removals.append(job.id)
+                if not is_indexable(job):
+                    removals.append(job.id)
+                elif job.id in vectors:
+                    upserts.append((job.id, vectors[job.id]))
+                elif job.embedding is not None:
+                    upserts.append((job.id, EmbeddingService.bytes_to_vector(job.embedding)))
+
+            if vectors:
+                version = EmbeddingService.get_embedding_version()
+                db.bulk_update_mappings(Job, [
+                    {
+                        "id": job_id,
+                        "embedding": EmbeddingService.vector_to_bytes(vector),
+                        "embedding_version": version
+                    }
+                    for job_id, vector in vectors.items()
+                ])
+                db.commit()
+                self.embedded += len(vectors)
+        finally:
+            db.close()
+
+        self._apply(upserts, removals)
+        self._apply_keywords(keyword_upserts, keyword_removals)
+        self.processed += len(changes)
+
+    def poll_changes(self):
+        """Apply jobs and careers updated recently, including by other workers, to this worker's indexes."""
+        if not (job_index.is_built() or job_keyword_index.is_built() or career_keyword_index.is_built()):
+            return
+
+        from apps.backend.db.session import SessionLocal
+
+        now = datetime.utcnow()
+        since = (self._last_poll or now) - self.lookback
+        self._last_poll = now
+
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(
+                    Job.id, Job.embedding, Job.status, Job.is_verified, Job.is_active,
+                    Job.title, Job.description, Job.requirements
+                )
+                .filter(Job.updated_at >= since)
+                .all()
+            )
+            career_rows = []
+            if career_keyword_index.is_built():
+                career_rows = (
+                    db.query(Career.id, Career.title, Career.description)
+                    .filter(Career.updated_at >= since)
+                    .all()
+                )
+        finally:
+            db.close()
+
+        upserts = []
+        removals = []
+        keyword_upserts = []
+        keyword_removals = []
+        for row in rows:
+            if not is_indexable(row):
+                removals.append(row.id)
+            elif row.embedding is not None:
+                upserts.append((row.id, EmbeddingService.bytes_to_vector(row.embedding)))
+            if row.is_verified:
+                keyword_upserts.append((row.id, job_keyword_index.field_texts(row)))
+            else:
+                keyword_removals.append(row.id)
+
+        if job_index.is_built():
+            self._apply(upserts, removals)
+        self._apply_keywords(keyword_upserts, keyword_removals)
+        # Deleted careers need no removal: keyword search only ranks ids the database still returns
+        for row in career_rows:
+            career_keyword_index.upsert(row.id, career_keyword_index.field_texts(row))
+
+    def _apply(self, upserts: Iterable, removals: Iterable[int]):
+        """Upsert and tombstone job vectors in the in-memory index."""
+        for job_id, vector in upserts:
+            job_index.upsert(job_id, vector)
+            self.upserted += 1
+        for job_id in removals:
+            if job_index.remove(job_id):
+                self.removed += 1
+
+    def _apply_keywords(self, upserts: Iterable, removals: Iterable[int]):
+        """Re-index and remove job texts in the keyword index (skipped until it is built)."""
+        if not job_keyword_index.is_built():
+            return
+        for job_id, texts in upserts:
+            job_keyword_index.upsert(job_id, texts)
+        for job_id in removals:
+            job_keyword_index.remove(job_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get sync counters."""
+        return {
+            'pending': len(self._pending),
+            'processed': self.processed,
+            'embedded': self.embedded,
+            'upserted': self.upserted,
+            'removed': self.removed,
+            'errors': self.errors
+        }
+
+
+# Process-wide singleton
+job_index_sync = JobIndexSync(
+    debounce_ms=settings.VECTOR_INDEX_SYNC_DEBOUNCE_MS,
+    poll_seconds=settings.VECTOR_INDEX_SYNC_SECONDS,
+    lookback_seconds=settings.VECTOR_INDEX_SYNC_LOOKBACK_SECONDS
+)
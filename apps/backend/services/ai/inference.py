@@ -0,0 +1,116 @@
+"""
+Inference Executor
+Dedicated, bounded thread pool for model inference
+
+Keeps transformer work off the event loop and off the shared request
+threadpool, and rejects new work once too many calls are pending
+(surfaced to clients as 503).
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
+
+from apps.backend.core.metrics import EMBEDDING_INFERENCE_REJECTED
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceBusyError(Exception):
+    """Exception raised when the inference queue is full."""
+    pass
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool that runs model inference.
+
+    At most `max_pending` calls may be queued or running at once; further
+    submissions fail fast with InferenceBusyError instead of piling up.
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 256, torch_threads: int = 0):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.torch_threads = torch_threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="inference"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+        # Metrics
+        self.completed = 0
+        self.rejected = 0
+
+        if torch_threads > 0:
+            self._set_torch_threads(torch_threads)
+
+    @staticmethod
+    def _set_torch_threads(num_threads: int):
+        """Set torch's intra-op thread count for this process."""
+        try:
+            import torch
+            torch.set_num_threads(num_threads)
+            logger.info(f"Torch intra-op threads set to {num_threads}")
+        except ImportError:
+            logger.warning("torch is not installed; ignoring intra-op thread setting")
+
+    def submit(self, fn: Callable, *args, block: bool = False) -> Future:
+        """
+        Schedule a call on the inference pool.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            block: Wait for a free slot instead of failing fast
+
+        Returns:
+            Future: Resolves to fn's return value
+
+        Raises:
+            InferenceBusyError: If the queue is full and block is False
+        """
+        if not self._slots.acquire(blocking=block):
+            self.rejected += 1
+            EMBEDDING_INFERENCE_REJECTED.inc()
+            raise InferenceBusyError(
+                f"Inference queue is full ({self.max_pending} pending calls)"
+            )
+
+        with self._pending_lock:
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future):
+        """Free a slot when a call finishes."""
+        with self._pending_lock:
+            self._pending -= 1
+            self.completed += 1
+        self._slots.release()
+
+    async def run(self, fn: Callable, *args):
+        """Run a call on the inference pool and await it without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool size and queue metrics."""
+        return {
+            'workers': self.max_workers,
+            'max_pending': self.max_pending,
+            'pending': self._pending,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'torch_threads': self.torch_threads
+        }
@@ -0,0 +1,672 @@
+"""
+Keyword Index
+In-memory BM25 inverted index for job and career keyword search
+
+Documents are tokenized per field and each field's term frequencies are
+weighted by a boost (BM25F-style), so a title hit counts more than a
+description hit. Postings are stored CSR-style: one byte stream of
+variable-byte encoded document gaps plus one float16 weight array, with an
+offset per term. New or changed documents are appended to small per-term
+tails and merged into the stream in bulk; removed documents are tombstoned
+and squeezed out by a compaction. Top-k uses MaxScore: terms are scored in
+order of their upper bound, and once the bounds of the remaining terms
+cannot lift an unseen document into the top-k, those terms are only probed
+for the surviving candidates.
+
+With KEYWORD_SEARCH_BACKEND=fulltext, keyword_search ranks in the database
+instead (MariaDB FULLTEXT indexes over the same columns) and these indexes
+stay unbuilt.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import case, false, or_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from apps.backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or our that the their this to
+was we will with you your
+""".split())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case word tokens without stopwords and single letters."""
+    if not text:
+        return []
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def varint_sizes(values: np.ndarray) -> np.ndarray:
+    """Encoded byte count of each non-negative integer."""
+    sizes = np.ones(len(values), dtype=np.int64)
+    rest = np.asarray(values, dtype=np.uint64) >> np.uint64(7)
+    while rest.any():
+        sizes += rest > 0
+        rest >>= np.uint64(7)
+    return sizes
+
+
+def encode_varint(values: np.ndarray) -> np.ndarray:
+    """Variable-byte encode non-negative integers (7 bits per byte, high bit = more follows)."""
+    values = np.asarray(values, dtype=np.uint64)
+    if len(values) == 0:
+        return np.empty(0, dtype=np.uint8)
+
+    sizes = varint_sizes(values)
+    starts = np.cumsum(sizes) - sizes
+    out = np.empty(int(sizes.sum()), dtype=np.uint8)
+    for position in range(int(sizes.max())):
+        present = sizes > position
+        byte = (values[present] >> np.uint64(7 * position)) & np.uint64(0x7F)
+        more = (sizes[present] > position + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[present] + position] = (byte | more).astype(np.uint8)
+    return out
+
+
+def decode_varint(data: np.ndarray) -> np.ndarray:
+    """Decode a variable-byte stream produced by `encode_varint`."""
+    if len(data) == 0:
+        return np.empty(0, dtype=np.int64)
+    last = data < 0x80
+    ends = np.flatnonzero(last)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    value_of_byte = np.cumsum(np.concatenate(([0], last[:-1]))).astype(np.int64)
+    shifts = (np.arange(len(data)) - starts[value_of_byte]) * 7
+    parts = (data & 0x7F).astype(np.int64) << shifts
+    return np.add.reduceat(parts, starts)
+
+
+class KeywordIndex:
+    """
+    BM25 index over text fields of a model, keyed by the model's id.
+
+    Args:
+        name: Index name used in logs and metrics
+        fields: Column name -> boost (term frequency multiplier)
+        criteria: Optional callable returning SQLAlchemy filter clauses
+            that restrict which rows `load` indexes
+        k1: BM25 term frequency saturation
+        b: BM25 length normalization
+    """
+
+    MERGE_RATIO = 0.1  # Merge tails once they hold this share of all postings
+    MIN_MERGE_POSTINGS = 20000
+
+    def __init__(
+        self,
+        name: str,
+        fields: Dict[str, float],
+        criteria: Optional[Callable[[], list]] = None,
+        k1: float = 1.2,
+        b: float = 0.75
+    ):
+        self.name = name
+        self.fields = dict(fields)
+        self.criteria = criteria
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._built_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self):
+        # Terms
+        self._term_ids: Dict[str, int] = {}
+        self._df: List[int] = []  # Live documents per term
+        self._max_weight: List[float] = []  # Upper bounds for MaxScore
+        self._min_length: List[float] = []
+
+        # Merged postings (CSR over terms)
+        self._offsets = np.zeros(1, dtype=np.int64)  # Byte offset per term
+        self._counts = np.zeros(1, dtype=np.int64)  # Posting offset per term
+        self._gaps = np.empty(0, dtype=np.uint8)
+        self._weights = np.empty(0, dtype=np.float16)
+
+        # Unmerged postings of recently added documents
+        self._tail_docs: Dict[int, List[int]] = {}
+        self._tail_weights: Dict[int, List[float]] = {}
+        self._tail_size = 0
+
+        # Documents, by ordinal (assigned in increasing order, so postings stay sorted)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._lengths = np.empty(0, dtype=np.float32)
+        self._live = np.empty(0, dtype=bool)
+        self._doc_terms: List[Optional[np.ndarray]] = []
+        self._size = 0
+        self._deleted = 0
+        self._total_length = 0.0
+        self._ordinal: Dict[int, int] = {}
+        self._hashes: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._size - self._deleted
+
+    # --- Documents -------------------------------------------------------
+
+    def field_texts(self, item) -> Dict[str, Optional[str]]:
+        """Indexed field texts of a model instance or row."""
+        return {field: getattr(item, field, None) for field in self.fields}
+
+    def _analyze(self, texts: Dict[str, Optional[str]]) -> Tuple[Dict[str, float], float]:
+        """Boosted term frequencies and boosted length of one document."""
+        weights: Counter = Counter()
+        length = 0.0
+        for field, boost in self.fields.items():
+            tokens = tokenize(texts.get(field))
+            length += boost * len(tokens)
+            for token, count in Counter(tokens).items():
+                weights[token] += boost * count
+        return weights, length
+
+    @staticmethod
+    def _content_hash(texts: Dict[str, Optional[str]]) -> str:
+        return hashlib.sha1("\x1f".join(texts.get(field) or "" for field in sorted(texts)).encode()).hexdigest()
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self._term_ids)
+            self._term_ids[term] = term_id
+            self._df.append(0)
+            self._max_weight.append(0.0)
+            self._min_length.append(math.inf)
+        return term_id
+
+    def _grow(self, needed: int):
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2, 1024)
+        self._ids = np.resize(self._ids, capacity)
+        self._lengths = np.resize(self._lengths, capacity)
+        self._live = np.resize(self._live, capacity)
+        self._live[self._size:] = False
+
+    def _add(self, item_id: int, weights: Dict[str, float], length: float):
+        """Append a document to the tails (lock held)."""
+        ordinal = self._size
+        self._grow(ordinal + 1)
+        self._ids[ordinal] = item_id
+        self._lengths[ordinal] = length
+        self._live[ordinal] = True
+        self._size += 1
+        self._ordinal[item_id] = ordinal
+        self._total_length += length
+
+        term_ids = np.empty(len(weights), dtype=np.int32)
+        for position, (term, weight) in enumerate(weights.items()):
+            weight = float(np.float16(weight))  # As stored, so the MaxScore bound holds
+            term_id = self._term_id(term)
+            term_ids[position] = term_id
+            self._tail_docs.setdefault(term_id, []).append(ordinal)
+            self._tail_weights.setdefault(term_id, []).append(weight)
+            self._df[term_id] += 1
+            self._max_weight[term_id] = max(self._max_weight[term_id], weight)
+            self._min_length[term_id] = min(self._min_length[term_id], length)
+        self._doc_terms.append(term_ids)
+        self._tail_size += len(weights)
+
+    def _delete(self, item_id: int) -> bool:
+        """Tombstone a document (lock held)."""
+        ordinal = self._ordinal.pop(item_id, None)
+        self._hashes.pop(item_id, None)
+        if ordinal is None:
+            return False
+        self._live[ordinal] = False
+        self._deleted += 1
+        self._total_length -= float(self._lengths[ordinal])
+        for term_id in self._doc_terms[ordinal]:
+            self._df[term_id] -= 1
+        self._doc_terms[ordinal] = None
+        return True
+
+    def upsert(self, item_id: int, texts: Dict[str, Optional[str]]) -> bool:
+        """
+        Index or re-index one document.
+
+        Args:
+            item_id: Model id
+            texts: Field name -> text
+
+        Returns:
+            bool: False if the document was already indexed with the same text
+        """
+        content = self._content_hash(texts)
+        if self._hashes.get(item_id) == content:
+            return False
+        weights, length = self._analyze(texts)
+        with self._lock:
+            self._delete(item_id)
+            if weights:
+                self._add(item_id, weights, length)
+                self._hashes[item_id] = content
+            self._maintain()
+        return True
+
+    def upsert_item(self, item) -> bool:
+        """Index or re-index a model instance (no-op until the index is built)."""
+        if not self.is_built():
+            return False
+        return self.upsert(item.id, self.field_texts(item))
+
+    def remove(self, item_id: int) -> bool:
+        """Remove a document; returns False if it was not indexed."""
+        with self._lock:
+            removed = self._delete(item_id)
+            if removed:
+                self._maintain()
+        return removed
+
+    # --- Postings ----------------------------------------------------------
+
+    def _decode_all(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Absolute ordinals of every merged posting, and the term of each."""
+        gaps = decode_varint(self._gaps)
+        counts = np.diff(self._counts)
+        terms = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+        # The first gap of each term is absolute, so subtract the running total before it
+        running = np.cumsum(gaps)
+        term_starts = self._counts[:-1]
+        before = np.zeros(len(counts), dtype=np.int64)
+        later = term_starts > 0
+        before[later] = running[term_starts[later] - 1]
+        return running - np.repeat(before, counts), terms
+
+    def _rebuild(self, compact: bool):
+        """Merge tails into the CSR arrays, optionally dropping tombstones (lock held)."""
+        docs, terms = self._decode_all()
+        weights = self._weights.astype(np.float32)
+
+        tail_terms = [term_id for term_id, ordinals in self._tail_docs.items() for _ in ordinals]
+        if tail_terms:
+            docs = np.concatenate([docs, np.fromiter(
+                (ordinal for ordinals in self._tail_docs.values() for ordinal in ordinals), dtype=np.int64
+            )])
+            weights = np.concatenate([weights, np.fromiter(
+                (weight for values in self._tail_weights.values() for weight in values), dtype=np.float32
+            )])
+            terms = np.concatenate([terms, np.asarray(tail_terms, dtype=np.int64)])
+
+        live = self._live[docs] if len(docs) else np.empty(0, dtype=bool)
+        docs, weights, terms = docs[live], weights[live], terms[live]
+
+        if compact:
+            live_ordinals = np.flatnonzero(self._live[:self._size])
+            remap = np.full(self._size, -1, dtype=np.int64)
+            remap[live_ordinals] = np.arange(len(live_ordinals))
+            docs = remap[docs]
+            self._ids = self._ids[live_ordinals].copy()
+            self._lengths = self._lengths[live_ordinals].copy()
+            self._live = np.ones(len(live_ordinals), dtype=bool)
+            self._doc_terms = [self._doc_terms[ordinal] for ordinal in live_ordinals]
+            self._size = len(live_ordinals)
+            self._deleted = 0
+            self._ordinal = {int(item_id): ordinal for ordinal, item_id in enumerate(self._ids)}
+
+        order = np.lexsort((docs, terms))
+        docs, weights, terms = docs[order], weights[order], terms[order]
+
+        n_terms = len(self._term_ids)
+        counts = np.bincount(terms, minlength=n_terms)
+        self._counts = np.concatenate(([0], np.cumsum(counts)))
+        first = self._counts[:-1][counts > 0]
+        gaps = np.diff(docs, prepend=0)
+        gaps[first] = docs[first]  # First posting of each term is absolute
+        self._gaps = encode_varint(gaps)
+        byte_counts = np.bincount(terms, weights=varint_sizes(gaps), minlength=n_terms).astype(np.int64)
+        self._offsets = np.concatenate(([0], np.cumsum(byte_counts)))
+        self._weights = weights.astype(np.float16)
+
+        # Tighten the MaxScore bounds to the postings that are left
+        max_weight = np.zeros(n_terms, dtype=np.float32)
+        min_length = np.full(n_terms, np.inf, dtype=np.float32)
+        np.maximum.at(max_weight, terms, weights)
+        np.minimum.at(min_length, terms, self._lengths[docs])
+        self._max_weight = max_weight.tolist()
+        self._min_length = min_length.tolist()
+
+        self._tail_docs, self._tail_weights, self._tail_size = {}, {}, 0
+
+    def _maintain(self):
+        """Compact after many removals, merge after many additions (lock held)."""
+        if self._deleted > max(1000, self._size // 4):
+            self._rebuild(compact=True)
+        elif self._tail_size > max(self.MIN_MERGE_POSTINGS, self.MERGE_RATIO * len(self._weights)):
+            self._rebuild(compact=False)
+
+    def _postings(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Live (ordinals, weights) of one term, sorted by ordinal (lock held)."""
+        docs = np.empty(0, dtype=np.int64)
+        weights = np.empty(0, dtype=np.float32)
+        if term_id + 1 < len(self._counts):
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            docs = np.cumsum(decode_varint(self._gaps[start:end]))
+            weights = self._weights[self._counts[term_id]:self._counts[term_id + 1]].astype(np.float32)
+        if term_id in self._tail_docs:
+            docs = np.concatenate([docs, np.asarray(self._tail_docs[term_id], dtype=np.int64)])
+            weights = np.concatenate([weights, np.asarray(self._tail_weights[term_id], dtype=np.float32)])
+        live = self._live[docs]
+        return docs[live], weights[live]
+
+    # --- Loading -----------------------------------------------------------
+
+    def load(self, db: Session, model) -> int:
+        """
+        Build the index from a model's text columns.
+
+        Args:
+            db: Database session
+            model: SQLAlchemy model class with `id` and the indexed columns
+
+        Returns:
+            int: Number of documents indexed
+        """
+        start_time = time.time()
+        columns = [getattr(model, field) for field in self.fields]
+        query = db.query(model.id, *columns)
+        if self.criteria is not None:
+            query = query.filter(*self.criteria())
+        rows = query.all()
+
+        documents = []
+        for row in rows:
+            texts = dict(zip(self.fields, row[1:]))
+            weights, length = self._analyze(texts)
+            if weights:
+                documents.append((row[0], weights, length, self._content_hash(texts)))
+
+        with self._lock:
+            self._reset()
+            for item_id, weights, length, content in documents:
+                self._add(item_id, weights, length)
+                self._hashes[item_id] = content
+            self._rebuild(compact=False)
+            self._built_at = time.time()
+
+        logger.info(
+            f"Built {self.name} keyword index: {len(documents)} documents, {len(self._term_ids)} terms, "
+            f"{len(self._gaps)} posting bytes in {time.time() - start_time:.2f}s"
+        )
+        return len(documents)
+
+    def is_built(self) -> bool:
+        """Check whether the index has been built at least once."""
+        return self._built_at is not None
+
+    def ensure_loaded(self, db: Session, model) -> "KeywordIndex":
+        """Load the index if it is missing or older than the refresh interval."""
+        if self._built_at is None or time.time() - self._built_at > settings.KEYWORD_INDEX_REFRESH_SECONDS:
+            self.load(db, model)
+        return self
+
+    # --- Search ------------------------------------------------------------
+
+    def _term_scores(self, idf: float, weights: np.ndarray, lengths: np.ndarray, avg_length: float) -> np.ndarray:
+        norm = self.k1 * (1.0 - self.b + self.b * lengths / avg_length)
+        return idf * weights * (self.k1 + 1.0) / (weights + norm)
+
+    def search(
+        self,
+        text: str,
+        k: int = 10,
+        allowed_ids: Optional[Iterable[int]] = None
+    ) -> Optional[List[Tuple[int, float]]]:
+        """
+        Top-k documents for a keyword query by BM25 score.
+
+        Args:
+            text: Query text (terms are OR-ed)
+            k: Number of results
+            allowed_ids: If given, only these ids are scored (term
+                statistics still cover the whole index)
+
+        Returns:
+            List of (id, score) pairs, best first, or None if the query has
+            no searchable terms
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms:
+            return None
+
+        with self._lock:
+            n_docs = len(self)
+            if n_docs == 0 or k <= 0:
+                return []
+            avg_length = max(self._total_length / n_docs, 1e-6)
+
+            # (term id, idf, upper bound) of query terms present in the index
+            scored_terms = []
+            for term in terms:
+                term_id = self._term_ids.get(term)
+                if term_id is None or self._df[term_id] <= 0:
+                    continue
+                df = self._df[term_id]
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                bound = float(self._term_scores(
+                    idf, np.float32(self._max_weight[term_id]), np.float32(self._min_length[term_id]), avg_length
+                ))
+                scored_terms.append((term_id, idf, bound))
+            if not scored_terms:
+                return []
+            scored_terms.sort(key=lambda entry: entry[2], reverse=True)
+
+            eligible = None
+            if allowed_ids is not None:
+                eligible = np.zeros(self._size, dtype=bool)
+                ordinals = [self._ordinal.get(item_id) for item_id in allowed_ids]
+                eligible[[ordinal for ordinal in ordinals if ordinal is not None]] = True
+
+            scores = np.zeros(self._size, dtype=np.float32)
+            seen = np.zeros(self._size, dtype=bool)
+            remaining = sum(bound for _, _, bound in scored_terms)
+            candidates = None  # Set once no unseen document can reach the top-k
+
+            for term_id, idf, bound in scored_terms:
+                remaining -= bound
+                docs, weights = self._postings(term_id)
+                if eligible is not None:
+                    keep = eligible[docs]
+                    docs, weights = docs[keep], weights[keep]
+
+                if candidates is None:
+                    scores[docs] += self._term_scores(idf, weights, self._lengths[docs], avg_length)
+                    seen[docs] = True
+                    pool = np.flatnonzero(seen)
+                else:
+                    positions = np.searchsorted(docs, candidates)
+                    hit = positions < len(docs)
+                    hit[hit] = docs[positions[hit]] == candidates[hit]
+                    matched = candidates[hit]
+                    scores[matched] += self._term_scores(
+                        idf, weights[positions[hit]], self._lengths[matched], avg_length
+                    )
+                    pool = candidates
+
+                if len(pool) > k:
+                    threshold = np.partition(scores[pool], len(pool) - k)[len(pool) - k]
+                    if remaining < threshold:
+                        # MaxScore: remaining terms cannot admit new documents
+                        candidates = pool[scores[pool] + remaining >= threshold]
+
+            pool = candidates if candidates is not None else np.flatnonzero(seen)
+            if len(pool) > k:
+                pool = pool[np.argpartition(-scores[pool], k - 1)[:k]]
+            order = np.lexsort((pool, -scores[pool]))
+            pool = pool[order]
+            return [(int(self._ids[ordinal]), float(scores[ordinal])) for ordinal in pool]
+
+    def match_count(self, text: str) -> int:
+        """
+        Number of documents matching at least one term of a keyword query.
+
+        Args:
+            text: Query text (terms are OR-ed)
+
+        Returns:
+            int: Live documents containing any query term
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        with self._lock:
+            matched = np.zeros(self._size, dtype=bool)
+            for term in terms:
+                term_id = self._term_ids.get(term)
+                if term_id is None or self._df[term_id] <= 0:
+                    continue
+                docs, _ = self._postings(term_id)
+                matched[docs] = True
+            return int(np.count_nonzero(matched))
+
+    def get_stats(self) -> dict:
+        """Get index size information."""
+        return {
+            'name': self.name,
+            'documents': len(self),
+            'terms': len(self._term_ids),
+            'posting_bytes': int(self._gaps.nbytes + self._weights.nbytes),
+            'tail_postings': self._tail_size,
+            'built_at': self._built_at
+        }
+
+
+def _substring_search(query, model, text: str):
+    """Plain ILIKE match on title and description (no relevance)."""
+    pattern = f"%{text}%"
+    return query.filter(or_(model.title.ilike(pattern), model.description.ilike(pattern))), None
+
+
+def fulltext_search(db: Session, query, model, columns: list, text: str):
+    """
+    Restrict a query to FULLTEXT matches for `text` (MariaDB/MySQL).
+
+    Uses natural-language or boolean mode per KEYWORD_FULLTEXT_MODE; boolean
+    mode requires every term and matches term prefixes. Other databases
+    (SQLite in development) fall back to ILIKE.
+
+    Args:
+        db: Database session
+        query: SQLAlchemy query over `model`
+        model: Job or Career
+        columns: Columns of the model's FULLTEXT index, in index order
+        text: Search text
+
+    Returns:
+        Tuple of the filtered query and an ORDER BY clause for relevance
+        (None on the ILIKE fallback)
+    """
+    terms = tokenize(text)
+    if not terms or db.get_bind().dialect.name not in ("mysql", "mariadb"):
+        return _substring_search(query, model, text)
+
+    # Tokens are alphanumeric only, so user input cannot inject boolean operators
+    if settings.KEYWORD_FULLTEXT_MODE == "boolean":
+        score = match(*columns, against=" ".join(f"+{term}*" for term in terms)).in_boolean_mode()
+    else:
+        score = match(*columns, against=" ".join(terms)).in_natural_language_mode()
+    return query.filter(score > 0), score.desc()
+
+
+def _admitted(query, model, ids: List[int]) -> List[int]:
+    """The ids `query` still admits, in the given order."""
+    if not ids:
+        return []
+    admitted = {row[0] for row in query.filter(model.id.in_(ids)).with_entities(model.id).all()}
+    return [item_id for item_id in ids if item_id in admitted]
+
+
+def keyword_search(db: Session, query, index: KeywordIndex, model, text: str, window: Optional[int] = None):
+    """
+    Restrict a query to the keyword matches for `text`, ranked by relevance.
+
+    Ranks with the in-process index, or in the database when
+    KEYWORD_SEARCH_BACKEND is "fulltext" (over the index's fields). Apply it
+    after every other filter.
+
+    With a `window` (offset + limit of the requested page), only the best
+    `window` matches that `query` admits are kept, so MaxScore can prune
+    and the database only checks a window-sized id list. If the filters
+    reject part of that window, the index is searched again, deeper. The
+    total is exact once every match has been ranked; otherwise it is the
+    index's match count scaled by the share of ranked matches the filters
+    kept (exact when they kept all of them). Without a window (results
+    sorted by another column) every match is kept and nothing is pruned.
+
+    Args:
+        db: Database session
+        query: SQLAlchemy query over `model`, with all other filters applied
+        index: Keyword index of `model`
+        model: Job or Career
+        text: Search text
+        window: Number of best matches needed, capped at
+            KEYWORD_SEARCH_MAX_RESULTS; None keeps every match
+
+    Returns:
+        Tuple of the filtered query, an ORDER BY clause for relevance and
+        the number of matches (relevance and total are None when the
+        database ranks, or when the text has no searchable terms and a
+        substring match is used instead; count the query then)
+    """
+    if settings.KEYWORD_SEARCH_BACKEND == "fulltext":
+        query, relevance = fulltext_search(db, query, model, [getattr(model, field) for field in index.fields], text)
+        return query, relevance, None
+
+    index.ensure_loaded(db, model)
+    everything = len(index)
+    if window is None:
+        window = everything
+    else:
+        window = max(1, min(window, settings.KEYWORD_SEARCH_MAX_RESULTS))
+
+    k = window
+    while True:
+        hits = index.search(text, k)
+        if hits is None:
+            return (*_substring_search(query, model, text), None)
+        ranked = _admitted(query, model, [item_id for item_id, _ in hits])
+        exhausted = len(hits) < k or k >= everything
+        if len(ranked) >= window or exhausted:
+            break
+        # The filters rejected part of the window; rank deeper
+        k *= 4
+
+    if not ranked:
+        return query.filter(false()), None, 0
+    if exhausted:
+        total = len(ranked)
+    else:
+        total = max(len(ranked), round(index.match_count(text) * len(ranked) / len(hits)))
+
+    ranked = ranked[:window]
+    relevance = case({item_id: rank for rank, item_id in enumerate(ranked)}, value=model.id, else_=len(ranked))
+    return query.filter(model.id.in_(ranked)), relevance, total
+
+
+def searchable_job_criteria() -> list:
+    """Jobs that keyword search can return: every verified job."""
+    from apps.backend.models.job import Job
+    return [Job.is_verified == True]
+
+
+# Singleton indexes (process-local; jobs are kept current by the job index sync).
+# Field order matches the ft_jobs_text / ft_careers_text FULLTEXT indexes.
+job_keyword_index = KeywordIndex(
+    "jobs", fields={"title": 3.0, "description": 1.0, "requirements": 1.5}, criteria=searchable_job_criteria
+)
+career_keyword_index = KeywordIndex("careers", fields={"title": 3.0, "description": 1.0})
@@ -7,11 +7,17 @@ import logging
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import func, inspect, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from apps.backend.models.career import Career
 from apps.backend.models.user import User
 from .embeddings import EmbeddingService
+from .skill_overlap import SkillIncidence, catalog_incidence, compare_skills
+from .vector_index import career_index, job_index
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +36,156 @@ class MatchingService:
     Service for matching user skills to career paths using semantic similarity.
     
     Uses cosine similarity between user skill embeddings and career embeddings
-    to find the best matching careers.
+    to find the best matching careers. Candidates come from one top-k search
+    of the career or job vector index with the user's stored skill vector;
+    only those rows are read from the database.
     """
     
     def __init__(self, embedding_service: EmbeddingService):
         self.embedding_service = embedding_service
     
+    def get_user_embedding(self, db: Session, user: User) -> np.ndarray:
+        """
+        Get a user's skill vector from the users table.
+        
+        The vector is written whenever the user's skills change; it is only
+        computed here (and saved) if it is missing or from another model
+        version.
+        
+        Args:
+            db: Database session
+            user: User object with skills
+            
+        Returns:
+            np.ndarray: 768-dimensional skill vector
+            
+        Raises:
+            EmbeddingError: If the vector has to be computed and encoding fails
+        """
+        # Not every caller passes an ORM row (e.g. the debug MockUser)
+        stored = getattr(user, "skill_embedding", None)
+        if (
+            stored is not None
+            and getattr(user, "skill_embedding_version", None) == self.embedding_service.get_embedding_version()
+        ):
+            return self.embedding_service.bytes_to_vector(stored)
+        
+        vector = np.asarray(self.embedding_service.encode_user_skills(user.skills), dtype=np.float32)
+        self._save_user_embedding(db, user, vector)
+        return vector
+    
+    def _save_user_embedding(self, db: Session, user: User, vector: np.ndarray):
+        """
+        Store a computed skill vector for a user row.
+        
+        Written in its own short transaction, so a read path never commits
+        (or flushes) the caller's session; the row's attributes are marked as
+        already saved. Objects that are not persistent rows of `db` are
+        skipped, and a failed write only means the vector is computed again.
+        """
+        state = inspect(user, raiseerr=False)
+        if state is None or not state.persistent or state.session is not db:
+            return
+        
+        values = {
+            "skill_embedding": self.embedding_service.vector_to_bytes(vector),
+            "skill_embedding_version": self.embedding_service.get_embedding_version()
+        }
+        try:
+            with db.get_bind().begin() as conn:
+                conn.execute(update(User).where(User.id == user.id).values(**values))
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not store skill embedding for user {user.id}: {str(e)}")
+            return
+        for key, value in values.items():
+            set_committed_value(user, key, value)
+    
+    def _catalog_incidence(self, db: Session, model) -> SkillIncidence:
+        """
+        Skill incidence of the active catalog, reused until the catalog changes.
+        
+        The version stamp is the number of active rows and their latest
+        updated_at; adding, removing, deactivating or editing an item
+        changes one of them.
+        """
+        active = model.is_active == True
+        version = tuple(db.query(func.count(model.id), func.max(model.updated_at)).filter(active).one())
+        
+        def load():
+            rows = db.query(model.id, model.required_skills).filter(active).all()
+            return [row[0] for row in rows], [row[1] for row in rows]
+        
+        return catalog_incidence.get(f"active_{model.__tablename__}", version, load)
+    
+    @staticmethod
+    def _overlap(
+        incidence: SkillIncidence,
+        covered: np.ndarray,
+        item,
+        skills: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """Matched and missing skills of an item, from the catalog matrix when it has the item."""
+        row = incidence.row_of(item.id)
+        if row is None:
+            # Added after the matrix was built
+            return compare_skills(skills, item.required_skills)
+        return incidence.overlap(covered, row)
+    
+    def _match_careers(
+        self,
+        db: Session,
+        skill_vector,
+        skills: List[str],
+        limit: int,
+        min_similarity: float
+    ) -> List[CareerMatch]:
+        """
+        Top active careers for a skill vector from one career index search.
+        
+        Args:
+            db: Database session
+            skill_vector: User (or query) skill vector
+            skills: Skills to compare with each career's required skills
+            limit: Maximum number of matches to return
+            min_similarity: Minimum similarity threshold (0-1)
+            
+        Returns:
+            List[CareerMatch]: Career matches sorted by similarity
+        """
+        # The career index holds every career; retired ones are few, so exclude them
+        inactive_ids = [row[0] for row in db.query(Career.id).filter(Career.is_active == False).all()]
+        
+        index = career_index.ensure_loaded(db, Career)
+        hits = index.search(skill_vector, limit, min_score=min_similarity, exclude_ids=inactive_ids)
+        
+        if not hits:
+            logger.warning("No matching active careers found in the career index")
+            return []
+        
+        # Hydrate only the top-k careers
+        careers = db.query(Career).filter(Career.id.in_([career_id for career_id, _ in hits])).all()
+        careers_by_id = {career.id: career for career in careers}
+        
+        # Skill overlap from the cached catalog matrix and one coverage vector
+        incidence = self._catalog_incidence(db, Career)
+        covered = incidence.coverage(skills)
+        
+        matches = []
+        for career_id, similarity in hits:
+            career = careers_by_id.get(career_id)
+            if career is None:
+                continue
+            
+            matched, missing = self._overlap(incidence, covered, career, skills)
+            matches.append(CareerMatch(
+                career=career,
+                similarity_score=similarity,
+                matched_skills=matched,
+                missing_skills=missing
+            ))
+        
+        return matches
+    
     def match_careers_for_user(
         self,
         db: Session,
@@ -59,48 +209,10 @@ class MatchingService:
             logger.warning(f"User {user.id} has no skills to match")
             return []
         
-        # Get user skill embedding
-        user_embedding = self.embedding_service.encode_user_skills(user.skills)
+        # Stored user skill vector (computed only if missing)
+        user_embedding = self.get_user_embedding(db, user)
         
-        # Get all careers
-        careers = db.query(Career).filter(Career.is_active == True).all()
-        
-        if not careers:
-            logger.warning("No active careers found in database")
-            return []
-        
-        # Calculate similarities
-        matches = []
-        for career in careers:
-            # Parse career embedding from JSON
-            career_embedding = self.embedding_service.json_to_vector(career.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                user_embedding, 
-                career_embedding
-            )
-            
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                # Find matched and missing skills
-                matched, missing = self._compare_skills(
-                    user.skills, 
-                    career.required_skills
-                )
-                
-                matches.append(CareerMatch(
-                    career=career,
-                    similarity_score=similarity,
-                    matched_skills=matched,
-                    missing_skills=missing
-                ))
-        
-        # Sort by similarity (descending)
-        matches.sort(key=lambda x: x.similarity_score, reverse=True)
-        
-        # Return top matches
-        return matches[:limit]
+        return self._match_careers(db, user_embedding, user.skills, limit, min_similarity)
     
     def match_careers_by_skills(
         self,
@@ -128,45 +240,7 @@ class MatchingService:
         # Get skill embedding
         skill_embedding = self.embedding_service.encode_user_skills(skills)
         
-        # Get all careers
-        careers = db.query(Career).filter(Career.is_active == True).all()
-        
-        if not careers:
-            logger.warning("No active careers found in database")
-            return []
-        
-        # Calculate similarities
-        matches = []
-        for career in careers:
-            # Parse career embedding from JSON
-            career_embedding = self.embedding_service.json_to_vector(career.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                skill_embedding, 
-                career_embedding
-            )
-            
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                # Find matched and missing skills
-                matched, missing = self._compare_skills(
-                    skills, 
-                    career.required_skills
-                )
-                
-                matches.append(CareerMatch(
-                    career=career,
-                    similarity_score=similarity,
-                    matched_skills=matched,
-                    missing_skills=missing
-                ))
-        
-        # Sort by similarity (descending)
-        matches.sort(key=lambda x: x.similarity_score, reverse=True)
-        
-        # Return top matches
-        return matches[:limit]
+        return self._match_careers(db, skill_embedding, skills, limit, min_similarity)
     
     def _compare_skills(
         self,
@@ -176,30 +250,17 @@ class MatchingService:
         """
         Compare user skills with required skills.
         
+        Skills match when they share a canonical skill id ("js" / "javascript")
+        or one name contains the other ("solar" / "solar pv", "sql" / "postgresql").
+        
         Args:
             user_skills: List of user's skills
             required_skills: List of required skills for a career
             
         Returns:
-            Tuple[List[str], List[str]]: (matched_skills, missing_skills)
+            Tuple[List[str], List[str]]: (matched_skills, missing_skills) as canonical names
         """
-        # Normalize skills to lowercase for comparison
-        user_skills_lower = [s.lower().strip() for s in user_skills]
-        required_skills_lower = [s.lower().strip() for s in required_skills]
-        
-        # Find matched skills
-        matched = []
-        for req_skill in required_skills_lower:
-            for user_skill in user_skills_lower:
-                # Check for exact match or partial match
-                if req_skill == user_skill or req_skill in user_skill or user_skill in req_skill:
-                    matched.append(req_skill)
-                    break
-        
-        # Find missing skills
-        missing = [s for s in required_skills_lower if s not in matched]
-        
-        return matched, missing
+        return compare_skills(user_skills, required_skills)
     
     def calculate_match_score(
         self,
@@ -224,7 +285,7 @@ class MatchingService:
         
         # Calculate skill overlap ratio
         matched, missing = self._compare_skills(user_skills, required_skills)
-        skill_overlap = len(matched) / len(required_skills) if required_skills else 0
+        skill_overlap = len(matched) / (len(matched) + len(missing)) if matched or missing else 0
         
         # Weighted combination (70% semantic, 30% skill overlap)
         combined_score = 0.7 * semantic_similarity + 0.3 * skill_overlap
@@ -292,56 +353,52 @@ class MatchingService:
         
         from apps.backend.models.job import Job
         
-        # Get user skill embedding
-        user_embedding = self.embedding_service.encode_user_skills(user.skills)
+        # Stored user skill vector (computed only if missing)
+        user_embedding = self.get_user_embedding(db, user)
         
-        # Get all active jobs
-        jobs = db.query(Job).filter(Job.is_active == True).all()
+        # One search of the job index (verified, open, active jobs)
+        index = job_index.ensure_loaded(db, Job)
+        hits = index.search(user_embedding, limit, min_score=0.3)
         
-        if not jobs:
-            logger.warning("No active jobs found in database")
+        if not hits:
+            logger.warning("No matching jobs found in the job index")
             return []
         
-        # Calculate similarities
+        # Hydrate only the top-k jobs
+        jobs = (
+            db.query(Job)
+            .options(joinedload(Job.employer))
+            .filter(Job.id.in_([job_id for job_id, _ in hits]))
+            .all()
+        )
+        jobs_by_id = {job.id: job for job in jobs}
+        hits = [(job_id, similarity) for job_id, similarity in hits if job_id in jobs_by_id]
+        
+        # Jobs change constantly, so overlap comes from a matrix of just these rows
+        incidence = SkillIncidence([jobs_by_id[job_id].required_skills for job_id, _ in hits])
+        covered = incidence.coverage(user.skills)
+        
         recommendations = []
-        for job in jobs:
-            # Parse job embedding from JSON
-            job_embedding = self.embedding_service.json_to_vector(job.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                user_embedding, 
-                job_embedding
-            )
+        for row, (job_id, similarity) in enumerate(hits):
+            job = jobs_by_id[job_id]
+            matched, missing = incidence.overlap(covered, row)
             
-            # Filter by minimum similarity
-            if similarity >= 0.3:
-                # Find matched and missing skills
-                matched, missing = self._compare_skills(
-                    user.skills, 
-                    job.required_skills
-                )
-                
-                recommendations.append({
-                    "job_id": job.id,
-                    "title": job.title,
-                    "description": job.description,
-                    "company_name": job.company_name,
-                    "location": job.location,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "similarity_score": round(similarity, 3),
-                    "matched_skills": matched,
-                    "missing_skills": missing,
-                    "required_skills": job.required_skills,
-                    "sdg_tags": job.sdg_tags
-                })
-        
-        # Sort by similarity (descending)
-        recommendations.sort(key=lambda x: x["similarity_score"], reverse=True)
-        
-        # Return top matches
-        return recommendations[:limit]
+            recommendations.append({
+                "job_id": job.id,
+                "title": job.title,
+                "description": job.description,
+                "company_name": job.employer.company_name if job.employer else None,
+                "location": job.location,
+                "salary_min": job.salary_min,
+                "salary_max": job.salary_max,
+                "similarity_score": round(similarity, 3),
+                "matched_skills": matched,
+                "missing_skills": missing,
+                "required_skills": job.required_skills,
+                "sdg_tags": job.sdg_tags
+            })
+        
+        return recommendations
 
 
 # Singleton instance for dependency injection
@@ -0,0 +1,174 @@
+"""
+ONNX Runtime Backend
+CPU inference backend for the sentence-transformer embedding model
+
+Runs an ONNX export of the same transformer with the same mean pooling and
+L2 normalization as the sentence-transformers pipeline, optionally with
+int8 dynamically quantized weights. `OnnxEmbeddingModel.encode` mirrors
+`SentenceTransformer.encode`, so EmbeddingService can use either backend.
+
+Requires the optional `onnxruntime` package (and `onnx` for export).
+"""
+
+import logging
+import os
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+MAX_SEQ_LENGTH = 384  # all-mpnet-base-v2 sentence-transformers setting
+
+
+class OnnxEmbeddingModel:
+    """
+    Embedding model served by onnxruntime on CPU.
+
+    Args:
+        model_dir: Directory holding the ONNX file(s) and tokenizer files
+        quantized: Use the int8 dynamically quantized export
+        num_threads: onnxruntime intra-op threads (0 keeps the default)
+    """
+
+    def __init__(self, model_dir: str, quantized: bool = False, num_threads: int = 0):
+        try:
+            import onnxruntime as ort
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                f"The ONNX embedding backend requires onnxruntime and transformers: {str(e)}"
+            )
+
+        model_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX model not found at {model_path}; "
+                f"run scripts/onnx_embeddings.py export first"
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+
+        self.model_path = model_path
+        self.quantized = quantized
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {item.name for item in self.session.get_inputs()}
+
+        logger.info(f"Loaded ONNX embedding model from {model_path}")
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Encode text(s) to L2-normalized, mean-pooled embeddings.
+
+        Args:
+            sentences: One text or a list of texts
+            batch_size: Texts per session run
+
+        Returns:
+            np.ndarray: (dim,) for a single text, (n, dim) for a list
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        batch_size = max(1, batch_size)
+
+        outputs = []
+        for start in range(0, len(texts), batch_size):
+            outputs.append(self._encode_batch(texts[start:start + batch_size]))
+
+        embeddings = np.vstack(outputs) if outputs else np.empty((0, 0), dtype=np.float32)
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Tokenize, run the session once, then mean-pool and normalize."""
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=MAX_SEQ_LENGTH,
+            return_tensors="np"
+        )
+        feeds = {
+            name: encoded[name].astype(np.int64)
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+            if name in self._input_names and name in encoded
+        }
+
+        token_embeddings = self.session.run(None, feeds)[0]
+
+        # Mean pooling over real (non-padding) tokens
+        mask = feeds["attention_mask"][..., None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled = summed / counts
+
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (pooled / norms).astype(np.float32)
+
+
+def export_onnx_model(model_name: str, output_dir: str, quantize: bool = True, opset: int = 14) -> List[str]:
+    """
+    Export a Hugging Face transformer to ONNX, optionally with an int8 copy.
+
+    Args:
+        model_name: Hub name, e.g. "sentence-transformers/all-mpnet-base-v2"
+        output_dir: Directory for the ONNX files and tokenizer
+        quantize: Also write a dynamically quantized int8 model
+        opset: ONNX opset version
+
+    Returns:
+        List[str]: Paths of the written model files
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+
+    dummy = tokenizer(["renewable energy engineer"], return_tensors="pt")
+    model_path = os.path.join(output_dir, MODEL_FILE)
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            model_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=opset,
+        )
+    tokenizer.save_pretrained(output_dir)
+    written = [model_path]
+    logger.info(f"Exported ONNX model to {model_path}")
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        quantized_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+        quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        written.append(quantized_path)
+        logger.info(f"Wrote int8 quantized model to {quantized_path}")
+
+    return written
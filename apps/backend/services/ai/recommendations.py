@@ -0,0 +1,189 @@
+"""
+Recommendation Service
+Serves precomputed recommendations from user_recommendations
+
+Rows are written nightly by the batch scorer (scripts/compute_recommendations.py)
+and on demand here: when a user's rows are missing, older than
+RECOMMENDATION_MAX_AGE_HOURS, or were invalidated by a skills change, they
+are recomputed with one vector index search and stored for later reads.
+Freshness comes from a per-user, per-type run marker, so an empty result is
+cached like any other.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from apps.backend.core.config import settings
+from apps.backend.models.career import Career
+from apps.backend.models.job import Job
+from apps.backend.models.user import User
+from apps.backend.models.user_recommendation import RecommendationType, UserRecommendation, UserRecommendationRun
+from .skill_overlap import SkillIncidence
+from .vector_index import career_index, indexable_job_criteria, job_index
+
+logger = logging.getLogger(__name__)
+
+
+def _is_concurrent_write(error: IntegrityError) -> bool:
+    """
+    Whether a recompute failed on a key another recompute already wrote.
+
+    Only the (user_id, item_type, item_id) unique key and the run marker's
+    (user_id, item_type) primary key count; any other violation (e.g. a
+    foreign key) is a real error.
+    """
+    message = str(error.orig)
+    if "Duplicate entry" in message:
+        # MySQL/MariaDB: "... for key 'uq_user_recommendations_item'" or "... for key '[table.]PRIMARY'"
+        # (user_recommendations ids are autoincrement, so a PRIMARY clash is the run marker)
+        return "uq_user_recommendations_item'" in message or "PRIMARY'" in message
+    # SQLite lists the columns: "UNIQUE constraint failed: user_recommendations.user_id, ..."
+    return message.startswith("UNIQUE constraint failed: user_recommendation")
+
+
+class RecommendationService:
+    """Read-through store of per-user career and job recommendations."""
+
+    @staticmethod
+    def _catalog(item_type: RecommendationType):
+        """Model and eligibility filters for an item type (same as the batch scorer)."""
+        if item_type == RecommendationType.CAREER:
+            return Career, [Career.is_active == True]
+        return Job, indexable_job_criteria()
+
+    def _read(self, db: Session, user_id: int, item_type: RecommendationType, limit: int) -> List[Tuple]:
+        """Stored recommendations joined with their still-eligible items, best first."""
+        model, criteria = self._catalog(item_type)
+        return (
+            db.query(UserRecommendation, model)
+            .join(model, model.id == UserRecommendation.item_id)
+            .filter(
+                UserRecommendation.user_id == user_id,
+                UserRecommendation.item_type == item_type,
+                *criteria
+            )
+            .order_by(UserRecommendation.rank)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def _computed_at(db: Session, user_id: int, item_type: RecommendationType) -> Optional[datetime]:
+        """When the user's recommendations of this type were last computed, if ever."""
+        return db.query(UserRecommendationRun.computed_at).filter(
+            UserRecommendationRun.user_id == user_id,
+            UserRecommendationRun.item_type == item_type
+        ).scalar()
+
+    def get_recommendations(
+        self,
+        db: Session,
+        user: User,
+        item_type: RecommendationType,
+        limit: int = 10
+    ) -> List[Tuple[UserRecommendation, object]]:
+        """
+        Get a user's top recommendations, recomputing them only if stale.
+
+        Args:
+            db: Database session
+            user: Current user
+            item_type: Careers or jobs
+            limit: Maximum number of recommendations
+
+        Returns:
+            List[Tuple[UserRecommendation, object]]: (recommendation, career or job) pairs
+        """
+        if not user.skills:
+            return []
+
+        computed_at = self._computed_at(db, user.id, item_type)
+        max_age = timedelta(hours=settings.RECOMMENDATION_MAX_AGE_HOURS)
+        if computed_at is not None and datetime.utcnow() - computed_at <= max_age:
+            return self._read(db, user.id, item_type, limit)
+
+        self.recompute(db, user, item_type, k=max(limit, settings.RECOMMENDATION_TOP_K))
+        return self._read(db, user.id, item_type, limit)
+
+    def recompute(self, db: Session, user: User, item_type: RecommendationType, k: Optional[int] = None) -> int:
+        """
+        Replace one user's stored recommendations of a type.
+
+        Args:
+            db: Database session
+            user: User with skills
+            item_type: Careers or jobs
+            k: Recommendations to keep (defaults to RECOMMENDATION_TOP_K)
+
+        Returns:
+            int: Recommendations stored (0 if a concurrent recompute stored them first)
+        """
+        from .matching import matching_service
+
+        k = k or settings.RECOMMENDATION_TOP_K
+        user_embedding = matching_service.get_user_embedding(db, user)
+
+        if item_type == RecommendationType.CAREER:
+            active_ids = [row[0] for row in db.query(Career.id).filter(Career.is_active == True).all()]
+            index = career_index.ensure_loaded(db, Career)
+            hits = index.search(
+                user_embedding, k, min_score=settings.RECOMMENDATION_MIN_SCORE, allowed_ids=active_ids
+            )
+        else:
+            index = job_index.ensure_loaded(db, Job)
+            hits = index.search(user_embedding, k, min_score=settings.RECOMMENDATION_MIN_SCORE)
+
+        model, _ = self._catalog(item_type)
+        required_skills = dict(
+            db.query(model.id, model.required_skills).filter(model.id.in_([item_id for item_id, _ in hits])).all()
+        ) if hits else {}
+        hits = [(item_id, score) for item_id, score in hits if item_id in required_skills]
+        incidence = SkillIncidence([required_skills[item_id] for item_id, _ in hits])
+        covered = incidence.coverage(user.skills)
+
+        computed_at = datetime.utcnow()
+        mappings = []
+        for row, (item_id, score) in enumerate(hits):
+            matched, missing = incidence.overlap(covered, row)
+            mappings.append({
+                "user_id": user.id,
+                "item_type": item_type,
+                "item_id": item_id,
+                "rank": len(mappings) + 1,
+                "score": round(score, 4),
+                "matched_skills": matched,
+                "missing_skills": missing,
+                "computed_at": computed_at
+            })
+
+        try:
+            self.invalidate(db, user.id, item_type)
+            db.bulk_insert_mappings(UserRecommendation, mappings)
+            db.add(UserRecommendationRun(user_id=user.id, item_type=item_type, computed_at=computed_at))
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if not _is_concurrent_write(e):
+                logger.error(f"Failed to store {item_type.value} recommendations for user {user.id}: {e.orig}")
+                raise
+            # Another request recomputed this user at the same time; its rows stand
+            logger.info(f"Concurrent {item_type.value} recommendation recompute for user {user.id}; kept the other")
+            return 0
+        logger.info(f"Recomputed {len(mappings)} {item_type.value} recommendations for user {user.id}")
+        return len(mappings)
+
+    def invalidate(self, db: Session, user_id: int, item_type: Optional[RecommendationType] = None):
+        """Delete a user's stored recommendations (caller commits) so the next read recomputes them."""
+        for model in (UserRecommendation, UserRecommendationRun):
+            query = db.query(model).filter(model.user_id == user_id)
+            if item_type is not None:
+                query = query.filter(model.item_type == item_type)
+            query.delete(synchronize_session=False)
+
+
+# Singleton instance
+recommendation_service = RecommendationService()
@@ -8,12 +8,14 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_
 
+from apps.backend.core.sdg import has_all_sdgs
 from apps.backend.models.job import Job
 from apps.backend.models.career import Career
 from .embeddings import EmbeddingService
+from .vector_index import job_index, career_index
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,8 @@ class SearchService:
     Service for semantic job search using vector similarity.
     
     Uses cosine similarity between query embeddings and job embeddings
-    to find the most relevant jobs.
+    to find the most relevant jobs. Scoring runs against the in-memory
+    vector indexes; only the top-k rows are loaded from the database.
     """
     
     def __init__(self, embedding_service: EmbeddingService):
@@ -74,56 +77,19 @@ class SearchService:
         # Generate query embedding
         query_embedding = self.embedding_service.encode_text(query)
         
-        # Build base query with ordering by creation date
-        base_query = db.query(Job).filter(
+        # Build eligibility query (ids only, no ORM hydration)
+        base_query = db.query(Job.id).filter(
             and_(
                 Job.is_active == True,
                 Job.is_verified == True
             )
-        ).order_by(desc(Job.created_at))
+        )
         
         # Apply filters
         if filters:
             base_query = self._apply_filters(base_query, filters)
         
-        # Get all matching jobs
-        jobs = base_query.all()
-        
-        if not jobs:
-            logger.warning("No jobs found matching filters")
-            return []
-        
-        # Calculate similarities
-        results = []
-        for job in jobs:
-            # Parse job embedding from JSON
-            job_embedding = self.embedding_service.json_to_vector(job.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                query_embedding, 
-                job_embedding
-            )
-            
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                # Get career title if available
-                career_title = None
-                if job.career:
-                    career_title = job.career.title
-                
-                results.append(JobSearchResult(
-                    job=job,
-                    similarity_score=similarity,
-                    career_title=career_title,
-                    searched_at=search_time
-                ))
-        
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        
-        # Return top results
-        return results[:limit]
+        return self._search_job_index(db, base_query, query_embedding, limit, min_similarity, search_time)
     
     def search_jobs_by_skills(
         self,
@@ -157,8 +123,8 @@ class SearchService:
         # Generate skill embedding
         skill_embedding = self.embedding_service.encode_user_skills(skills)
         
-        # Build base query with OR conditions for flexibility
-        base_query = db.query(Job).filter(
+        # Build eligibility query with OR conditions for flexibility
+        base_query = db.query(Job.id).filter(
             or_(
                 Job.is_active == True,
                 Job.is_verified == True
@@ -169,44 +135,7 @@ class SearchService:
         if filters:
             base_query = self._apply_filters(base_query, filters)
         
-        # Get all matching jobs
-        jobs = base_query.all()
-        
-        if not jobs:
-            logger.warning("No jobs found matching filters")
-            return []
-        
-        # Calculate similarities
-        results = []
-        for job in jobs:
-            # Parse job embedding from JSON
-            job_embedding = self.embedding_service.json_to_vector(job.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                skill_embedding, 
-                job_embedding
-            )
-            
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                # Get career title if available
-                career_title = None
-                if job.career:
-                    career_title = job.career.title
-                
-                results.append(JobSearchResult(
-                    job=job,
-                    similarity_score=similarity,
-                    career_title=career_title,
-                    searched_at=search_time
-                ))
-        
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        
-        # Return top results
-        return results[:limit]
+        return self._search_job_index(db, base_query, skill_embedding, limit, min_similarity, search_time)
     
     def search_careers(
         self,
@@ -238,34 +167,29 @@ class SearchService:
         # Generate query embedding
         query_embedding = self.embedding_service.encode_text(query)
         
-        # Get all active careers
-        careers = db.query(Career).filter(Career.is_active == True).all()
+        # Get ids of all active careers
+        active_ids = [row[0] for row in db.query(Career.id).filter(Career.is_active == True).all()]
         
-        if not careers:
+        if not active_ids:
             logger.warning("No active careers found")
             return []
         
-        # Calculate similarities
-        results = []
-        for career in careers:
-            # Parse career embedding from JSON
-            career_embedding = self.embedding_service.json_to_vector(career.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                query_embedding, 
-                career_embedding
-            )
-            
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                results.append((career, similarity))
+        # Score against the career index in one pass
+        index = career_index.ensure_loaded(db, Career)
+        hits = index.search(query_embedding, limit, min_score=min_similarity, allowed_ids=active_ids)
+        
+        if not hits:
+            return []
         
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
+        # Hydrate only the top-k careers
+        careers = db.query(Career).filter(Career.id.in_([career_id for career_id, _ in hits])).all()
+        careers_by_id = {career.id: career for career in careers}
         
-        # Return top results
-        return results[:limit]
+        return [
+            (careers_by_id[career_id], similarity)
+            for career_id, similarity in hits
+            if career_id in careers_by_id
+        ]
     
     def _apply_filters(self, query, filters: Dict):
         """
@@ -291,8 +215,7 @@ class SearchService:
         
         # SDG tags filter
         if "sdg_tags" in filters and filters["sdg_tags"]:
-            for sdg_tag in filters["sdg_tags"]:
-                query = query.filter(Job.sdg_tags.contains(sdg_tag))
+            query = query.filter(has_all_sdgs(Job.sdg_mask, filters["sdg_tags"]))
         
         # Career filter
         if "career_id" in filters and filters["career_id"]:
@@ -326,60 +249,92 @@ class SearchService:
         # Log search timestamp
         search_time = datetime.utcnow()
         
-        # Get the reference job
-        reference_job = db.query(Job).filter(Job.id == job_id).first()
+        # Get the reference embedding, preferring the in-memory index
+        index = job_index.ensure_loaded(db, Job)
+        reference_embedding = index.get_vector(job_id)
         
-        if not reference_job:
-            logger.warning(f"Job {job_id} not found")
-            return []
-        
-        # Parse reference job embedding
-        reference_embedding = self.embedding_service.json_to_vector(reference_job.embedding)
+        if reference_embedding is None:
+            reference_job = db.query(Job.id, Job.embedding).filter(Job.id == job_id).first()
+            
+            if not reference_job:
+                logger.warning(f"Job {job_id} not found")
+                return []
+            
+            if reference_job.embedding is None:
+                logger.warning(f"Job {job_id} has no embedding")
+                return []
+            
+            reference_embedding = self.embedding_service.bytes_to_vector(reference_job.embedding)
         
         # Get all other active jobs using AND conditions
-        jobs = db.query(Job).filter(
+        base_query = db.query(Job.id).filter(
             and_(
                 Job.id != job_id,
                 Job.is_active == True,
                 Job.is_verified == True
             )
-        ).all()
+        )
         
-        if not jobs:
-            logger.warning("No other jobs found")
+        return self._search_job_index(db, base_query, reference_embedding, limit, min_similarity, search_time)
+    
+    def _search_job_index(
+        self,
+        db: Session,
+        id_query,
+        query_embedding,
+        limit: int,
+        min_similarity: float,
+        search_time: datetime
+    ) -> List[JobSearchResult]:
+        """
+        Score eligible jobs against the job index and hydrate the top-k.
+        
+        Args:
+            db: Database session
+            id_query: SQLAlchemy query selecting eligible `Job.id` values
+            query_embedding: Query vector
+            limit: Maximum number of results
+            min_similarity: Minimum similarity threshold (0-1)
+            search_time: Timestamp recorded on each result
+            
+        Returns:
+            List[JobSearchResult]: Results sorted by similarity
+        """
+        eligible_ids = [row[0] for row in id_query.all()]
+        
+        if not eligible_ids:
+            logger.warning("No jobs found matching filters")
+            return []
+        
+        index = job_index.ensure_loaded(db, Job)
+        hits = index.search(query_embedding, limit, min_score=min_similarity, allowed_ids=eligible_ids)
+        
+        if not hits:
             return []
         
-        # Calculate similarities
+        # Hydrate only the top-k jobs, with the relations used for formatting
+        jobs = (
+            db.query(Job)
+            .options(joinedload(Job.career), joinedload(Job.employer))
+            .filter(Job.id.in_([job_id for job_id, _ in hits]))
+            .all()
+        )
+        jobs_by_id = {job.id: job for job in jobs}
+        
         results = []
-        for job in jobs:
-            # Parse job embedding from JSON
-            job_embedding = self.embedding_service.json_to_vector(job.embedding)
-            
-            # Calculate similarity
-            similarity = self.embedding_service.cosine_similarity(
-                reference_embedding, 
-                job_embedding
-            )
+        for job_id, similarity in hits:
+            job = jobs_by_id.get(job_id)
+            if job is None:
+                continue
             
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                # Get career title if available
-                career_title = None
-                if job.career:
-                    career_title = job.career.title
-                
-                results.append(JobSearchResult(
-                    job=job,
-                    similarity_score=similarity,
-                    career_title=career_title,
-                    searched_at=search_time
-                ))
-        
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        
-        # Return top results
-        return results[:limit]
+            results.append(JobSearchResult(
+                job=job,
+                similarity_score=similarity,
+                career_title=job.career.title if job.career else None,
+                searched_at=search_time
+            ))
+        
+        return results
     
     def format_search_results(self, results: List[JobSearchResult]) -> List[Dict]:
         """
@@ -0,0 +1,176 @@
+"""
+Shared Embedding Matrix
+Publishes vector index snapshots as memory-mapped files shared by all workers
+
+One worker (holding a file lock) reads the embeddings from the database and
+writes the normalized matrix, the id array and any IVF assignment as `.npy`
+files in a directory that should live on tmpfs (e.g. /run or /dev/shm). A
+small JSON pointer names the current generation and is replaced atomically.
+Every worker maps the files copy-on-write, so the catalog is held in memory
+once no matter how many workers run; only pages a worker changes through
+incremental upserts become private to that worker.
+"""
+
+import json
+import logging
+import os
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMatrixStore:
+    """
+    Generation-numbered matrix snapshots for one named index.
+
+    Files for generation g are `<name>.<g>.<part>.npy`; `<name>.current.json`
+    points at the latest complete generation. Older generations are unlinked
+    on publish; workers that still map them keep a valid view until they
+    attach the new one.
+
+    Args:
+        directory: Directory holding the snapshot files (tmpfs recommended)
+        name: Index name used in file names
+    """
+
+    def __init__(self, directory: str, name: str):
+        self.directory = directory
+        self.name = name
+
+    def _path(self, generation: int, part: str) -> str:
+        return os.path.join(self.directory, f"{self.name}.{generation}.{part}.npy")
+
+    @property
+    def _pointer_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.current.json")
+
+    def current(self) -> Optional[Dict]:
+        """
+        Read the pointer to the latest published snapshot.
+
+        Returns:
+            Optional[Dict]: generation, size, built_at and parts, or None if
+            nothing has been published yet
+        """
+        try:
+            with open(self._pointer_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable {self.name} snapshot pointer: {str(e)}")
+            return None
+
+    @contextmanager
+    def builder_lock(self):
+        """Hold the exclusive lock that elects the worker building the next snapshot."""
+        os.makedirs(self.directory, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+
+        with open(os.path.join(self.directory, f"{self.name}.lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def publish(
+        self,
+        matrix: np.ndarray,
+        ids: np.ndarray,
+        built_at: float,
+        centroids: Optional[np.ndarray] = None,
+        assign: Optional[np.ndarray] = None
+    ) -> Dict:
+        """
+        Write a new snapshot and make it current (call with builder_lock held).
+
+        The matrix is written with spare rows so workers can append a few
+        upserted vectors before having to copy it.
+
+        Args:
+            matrix: (n, dim) normalized float32 vectors
+            ids: (n,) item ids
+            built_at: Timestamp of the database read
+            centroids: IVF centroids, if the index is partitioned
+            assign: IVF list per row, if the index is partitioned
+
+        Returns:
+            Dict: The new pointer (see `current`)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        previous = self.current()
+        generation = (previous["generation"] + 1) if previous else 1
+        size = len(ids)
+        capacity = size + max(1024, size // 16)
+
+        shared = np.lib.format.open_memmap(
+            self._path(generation, "matrix"), mode="w+", dtype=np.float32, shape=(capacity, matrix.shape[1])
+        )
+        shared[:size] = matrix
+        shared.flush()
+        del shared
+
+        padded_ids = np.full(capacity, -1, dtype=np.int64)
+        padded_ids[:size] = ids
+        np.save(self._path(generation, "ids"), padded_ids)
+
+        parts = ["matrix", "ids"]
+        if centroids is not None and assign is not None:
+            np.save(self._path(generation, "centroids"), centroids)
+            np.save(self._path(generation, "assign"), assign)
+            parts += ["centroids", "assign"]
+
+        pointer = {"generation": generation, "size": size, "built_at": built_at, "parts": parts}
+        temp_path = f"{self._pointer_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(pointer, f)
+        os.replace(temp_path, self._pointer_path)
+
+        self._remove_older(generation)
+        logger.info(f"Published {self.name} snapshot generation {generation} ({size} vectors)")
+        return pointer
+
+    def _remove_older(self, generation: int):
+        """Unlink files of earlier generations (mapped views stay valid)."""
+        prefix = f"{self.name}."
+        for file_name in os.listdir(self.directory):
+            if not file_name.startswith(prefix) or not file_name.endswith(".npy"):
+                continue
+            file_generation = file_name[len(prefix):].split(".", 1)[0]
+            if file_generation.isdigit() and int(file_generation) < generation:
+                try:
+                    os.remove(os.path.join(self.directory, file_name))
+                except OSError:
+                    pass
+
+    def attach(self, pointer: Dict) -> Dict[str, np.ndarray]:
+        """
+        Map a snapshot's arrays copy-on-write.
+
+        Reads share the page cache with every other worker; writes (upserts,
+        tombstones) copy only the touched pages into this process.
+
+        Args:
+            pointer: Snapshot pointer from `current` or `publish`
+
+        Returns:
+            Dict[str, np.ndarray]: Arrays by part name
+
+        Raises:
+            FileNotFoundError: If the generation was replaced while attaching
+        """
+        return {
+            part: np.load(self._path(pointer["generation"], part), mmap_mode="c")
+            for part in pointer["parts"]
+        }
@@ -0,0 +1,165 @@
+"""
+Skill Overlap
+Matched and missing skills of one user against a whole catalog at once
+
+A catalog's required-skill lists are held as a CSR item × skill incidence
+matrix whose columns are sorted canonical skill ids. A user's skills become
+one dense 0/1 coverage vector over the same columns, expanded through the
+skill dictionary's containment map so that a skill covers every catalog
+skill it contains or is contained in as a substring, the semantics of the
+original string comparison ("solar" covers "solar pv", "sql" covers
+"postgresql", "python programming" covers "python"; single letters such as
+"r" therefore cover many skills). The map is kept per id, so coverage is a
+lookup plus a sorted-array search and never compares names. Matched counts
+for every item are then a single sparse-dense product, and the
+matched/missing names of an item are a slice of the CSR arrays. The matrix
+of a whole catalog is cached in `catalog_incidence` under a version stamp
+of the catalog and only rebuilt when the stamp changes.
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from apps.backend.services.skill_dictionary import skill_dictionary
+
+
+class SkillIncidence:
+    """
+    CSR incidence matrix of a catalog's required skills.
+
+    Row i is the i-th skill list passed in; `indices` keeps each row's
+    columns in their required order so overlap results come back in that
+    order. Column j is skill id `skill_ids[j]`, named `names[j]`.
+
+    Args:
+        skill_lists: Required skills per catalog item
+        item_ids: Optional catalog item id per row, for `row_of`
+    """
+
+    def __init__(self, skill_lists: Sequence[Optional[Sequence[str]]], item_ids: Optional[Sequence[int]] = None):
+        rows = [skill_dictionary.id_list(skills) for skills in skill_lists]
+        self._rows: Dict[int, int] = {item_id: row for row, item_id in enumerate(item_ids if item_ids is not None else [])}
+
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=self.indptr[1:])
+        row_ids = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+
+        self.skill_ids = np.unique(row_ids)
+        self.indices = np.searchsorted(self.skill_ids, row_ids).astype(np.int32)
+        self.names: List[str] = skill_dictionary.names(self.skill_ids)
+        self.row_sizes = np.diff(self.indptr)
+
+    def __len__(self) -> int:
+        return len(self.row_sizes)
+
+    def row_of(self, item_id: int) -> Optional[int]:
+        """Row of a catalog item id, or None if the item is not in this matrix."""
+        return self._rows.get(item_id)
+
+    def coverage(self, skills: Optional[Sequence[str]]) -> np.ndarray:
+        """
+        Dense 0/1 vector of the catalog skills a user's skills cover.
+
+        Args:
+            skills: User's skills
+
+        Returns:
+            np.ndarray: int32 vector with one entry per column
+        """
+        covered = np.zeros(len(self.skill_ids), dtype=np.int32)
+        user_ids = skill_dictionary.ids(skills)
+        if len(user_ids) == 0 or len(self.skill_ids) == 0:
+            return covered
+
+        related = np.concatenate([skill_dictionary.related(skill_id) for skill_id in user_ids.tolist()])
+        columns = np.searchsorted(self.skill_ids, related).clip(max=len(self.skill_ids) - 1)
+        covered[columns[self.skill_ids[columns] == related]] = 1
+        return covered
+
+    def matched_counts(self, covered: np.ndarray) -> np.ndarray:
+        """
+        Matched required skills of every item (incidence @ covered).
+
+        Args:
+            covered: Vector from `coverage`
+
+        Returns:
+            np.ndarray: Matched count per row; missing counts are `row_sizes - counts`
+        """
+        running = np.zeros(len(self.indices) + 1, dtype=np.int64)
+        np.cumsum(covered[self.indices], out=running[1:])
+        return running[self.indptr[1:]] - running[self.indptr[:-1]]
+
+    def overlap(self, covered: np.ndarray, row: int) -> Tuple[List[str], List[str]]:
+        """
+        Matched and missing skills of one item.
+
+        Args:
+            covered: Vector from `coverage`
+            row: Item position in the catalog
+
+        Returns:
+            Tuple[List[str], List[str]]: (matched, missing) canonical names, in required order
+        """
+        columns = self.indices[self.indptr[row]:self.indptr[row + 1]].tolist()
+        names = self.names
+        return (
+            [names[column] for column in columns if covered[column]],
+            [names[column] for column in columns if not covered[column]]
+        )
+
+
+class IncidenceCache:
+    """
+    Latest SkillIncidence per catalog, reused while the catalog's version is unchanged.
+
+    Callers pass a cheap version stamp of the catalog (e.g. its row count and
+    latest updated_at) and a loader for its skill lists; the lists are only
+    read and the matrix only rebuilt when the stamp changes, or when the
+    skill dictionary replaced ids the cached matrix was built with.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Hashable, int, SkillIncidence]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        name: str,
+        version: Hashable,
+        load: Callable[[], Tuple[Sequence[int], Sequence[Optional[Sequence[str]]]]]
+    ) -> SkillIncidence:
+        """
+        Incidence matrix of a catalog, rebuilt only if its version changed.
+
+        Args:
+            name: Catalog name (e.g. "careers")
+            version: Version stamp of the catalog's current contents
+            load: Returns (item ids, required skills per item) of the catalog
+
+        Returns:
+            SkillIncidence: Matrix with one row per loaded item (see `row_of`)
+        """
+        generation = skill_dictionary.generation
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is not None and entry[0] == version and entry[1] == generation:
+            return entry[2]
+
+        item_ids, skill_lists = load()
+        incidence = SkillIncidence(skill_lists, item_ids)
+        with self._lock:
+            self._entries[name] = (version, generation, incidence)
+        return incidence
+
+
+def compare_skills(skills: Optional[Sequence[str]], required_skills: Optional[Sequence[str]]) -> Tuple[List[str], List[str]]:
+    """Matched and missing skills for a single item (a one-row catalog)."""
+    incidence = SkillIncidence([required_skills])
+    return incidence.overlap(incidence.coverage(skills), 0)
+
+
+# Process-wide cache of whole-catalog matrices
+catalog_incidence = IncidenceCache()
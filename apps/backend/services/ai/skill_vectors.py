@@ -0,0 +1,249 @@
+"""
+Skill Vectors
+Composes skill-list embeddings from a vocabulary of per-skill vectors
+
+Each normalized skill name is encoded once and stored in the
+skill_embeddings table. A user's or job's skill list is then embedded as
+the (weighted) mean of its skills' vectors, which is pure NumPy: reordering
+or re-saving the same skills never calls the model, and adding a skill only
+encodes that one skill.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from apps.backend.services.skill_dictionary import skill_dictionary
+from .embeddings import AIServiceError, EmbeddingService
+from .inference import InferenceBusyError
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_skill(skill) -> str:
+    """Vocabulary key for a skill: its canonical name in the skill dictionary."""
+    return skill_dictionary.canonical_name(skill)
+
+
+class SkillVocabulary:
+    """
+    In-memory skill → vector map backed by the skill_embeddings table.
+
+    The table is read once per process; skills missing from memory are
+    looked up in the table (another worker may have stored them), and only
+    the rest are encoded, in one batch, and written back. If the database is
+    unavailable the vocabulary keeps working in memory only.
+    """
+
+    def __init__(self, dim: int = EmbeddingService._embedding_dim):
+        self.dim = dim
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.encoded = 0
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    @staticmethod
+    def _normalize_vector(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _read_rows(self, names: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Read current-version vectors from the table, optionally only for some names."""
+        from apps.backend.db.session import SessionLocal
+        from apps.backend.models.skill_embedding import SkillEmbedding
+
+        db = SessionLocal()
+        try:
+            query = db.query(SkillEmbedding.name, SkillEmbedding.embedding).filter(
+                SkillEmbedding.embedding_version == EmbeddingService.get_embedding_version()
+            )
+            if names is not None:
+                query = query.filter(SkillEmbedding.name.in_(names))
+            return {
+                name: self._normalize_vector(EmbeddingService.bytes_to_vector(raw))
+                for name, raw in query.all()
+            }
+        finally:
+            db.close()
+
+    def _write_rows(self, vectors: Dict[str, np.ndarray]):
+        """Insert new skills and refresh rows stored by another model version."""
+        from apps.backend.db.session import SessionLocal
+        from apps.backend.models.skill_embedding import SkillEmbedding
+
+        version = EmbeddingService.get_embedding_version()
+        db = SessionLocal()
+        try:
+            existing = {
+                row.name: row
+                for row in db.query(SkillEmbedding).filter(SkillEmbedding.name.in_(list(vectors)))
+            }
+            for name, vector in vectors.items():
+                row = existing.get(name)
+                if row is None:
+                    row = SkillEmbedding(name=name)
+                    db.add(row)
+                row.embedding = EmbeddingService.vector_to_bytes(vector)
+                row.embedding_version = version
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same skills first; its vectors are equivalent
+            db.rollback()
+        finally:
+            db.close()
+
+    def _ensure_loaded(self):
+        """Read the whole vocabulary once per process."""
+        if self._loaded:
+            return
+        try:
+            rows = self._read_rows()
+        except SQLAlchemyError as e:
+            logger.warning(f"Skill vocabulary not loaded from database: {str(e)}")
+            return
+        with self._lock:
+            for name, vector in rows.items():
+                self._vectors.setdefault(name, vector)
+            self._loaded = True
+        logger.info(f"Loaded {len(rows)} skill vectors")
+
+    def get_vectors(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Get vectors for normalized skill names, encoding unknown ones.
+
+        Args:
+            names: Skill names already passed through normalize_skill
+
+        Returns:
+            Dict[str, np.ndarray]: Normalized vector per name
+
+        Raises:
+            EmbeddingError: If encoding new skills fails
+            InferenceBusyError: If the inference queue is full
+        """
+        self._ensure_loaded()
+        names = list(dict.fromkeys(names))
+        missing = [name for name in names if name not in self._vectors]
+        self.hits += len(names) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            found = {}
+            try:
+                found = self._read_rows(missing)
+            except SQLAlchemyError as e:
+                logger.warning(f"Skill vocabulary lookup failed: {str(e)}")
+
+            to_encode = [name for name in missing if name not in found]
+            if to_encode:
+                encoded = {
+                    name: self._normalize_vector(vector)
+                    for name, vector in zip(to_encode, EmbeddingService.encode_batch(to_encode))
+                }
+                self.encoded += len(encoded)
+                try:
+                    self._write_rows(encoded)
+                except SQLAlchemyError as e:
+                    logger.warning(f"Skill vectors not persisted: {str(e)}")
+                found.update(encoded)
+
+            with self._lock:
+                self._vectors.update(found)
+
+        return {name: self._vectors[name] for name in names}
+
+    def compose(self, skills: List[str], weights: Optional[List[float]] = None) -> np.ndarray:
+        """
+        Embed a skill list as the weighted mean of its skills' vectors.
+
+        Skills are normalized first, so order, case and duplicates do not
+        change the result (a duplicated skill keeps its largest weight).
+
+        Args:
+            skills: Skill names
+            weights: Optional weight per skill (e.g. proficiency); defaults to 1
+
+        Returns:
+            np.ndarray: L2-normalized float32 vector (zeros if no skills)
+        """
+        if weights is not None and len(weights) != len(skills):
+            raise ValueError(f"Got {len(weights)} weights for {len(skills)} skills")
+
+        totals: Dict[str, float] = {}
+        for position, skill in enumerate(skills):
+            name = normalize_skill(skill)
+            if name:
+                weight = 1.0 if weights is None else float(weights[position])
+                totals[name] = max(totals.get(name, weight), weight)
+
+        totals = {name: weight for name, weight in totals.items() if weight > 0}
+        if not totals:
+            return np.zeros(self.dim, dtype=np.float32)
+
+        vectors = self.get_vectors(totals)
+        matrix = np.stack([vectors[name] for name in totals])
+        weight_array = np.fromiter(totals.values(), dtype=np.float32, count=len(totals))
+        return self._normalize_vector(weight_array @ matrix / weight_array.sum())
+
+    def clear(self):
+        """Forget the in-memory vocabulary (the table is left as is)."""
+        with self._lock:
+            self._vectors = {}
+            self._loaded = False
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get vocabulary size and lookup counters."""
+        return {
+            'size': len(self._vectors),
+            'hits': self.hits,
+            'misses': self.misses,
+            'encoded': self.encoded
+        }
+
+
+# Process-wide singleton
+skill_vocabulary = SkillVocabulary()
+
+
+def set_user_skill_embedding(user, vector: Optional[np.ndarray]):
+    """Store a user's skill vector and its version on the model (caller commits)."""
+    if vector is None:
+        user.skill_embedding = None
+        user.skill_embedding_version = None
+    else:
+        user.skill_embedding = EmbeddingService.vector_to_bytes(vector)
+        user.skill_embedding_version = EmbeddingService.get_embedding_version()
+
+
+def refresh_user_skill_embedding(user) -> Optional[np.ndarray]:
+    """
+    Recompute a user's stored skill vector after their skills changed (caller commits).
+
+    Never fails the profile update: if new skills cannot be encoded right
+    now, the stored vector is cleared and recomputed on the next match.
+
+    Args:
+        user: User whose `skills` were just updated
+
+    Returns:
+        Optional[np.ndarray]: The new vector, or None if cleared
+    """
+    vector = None
+    if user.skills:
+        try:
+            vector = skill_vocabulary.compose(user.skills)
+        except (AIServiceError, InferenceBusyError) as e:
+            logger.warning(f"Deferring skill embedding for user {user.id}: {str(e)}")
+    set_user_skill_embedding(user, vector)
+    return vector
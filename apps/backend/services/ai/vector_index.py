@@ -0,0 +1,490 @@
+"""
+Vector Index
+Process-local in-memory index of job and career embeddings
+
+Holds every embedding as one contiguous, L2-normalized float32 matrix so a
+query is scored against the whole catalog with a single matrix-vector product.
+Large catalogs can add an IVF partitioning (VECTOR_INDEX_ANN=ivf) so a query
+only scores the rows in its closest lists. With VECTOR_INDEX_SHARED_DIR set,
+one worker builds each snapshot and all workers map the same matrix.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Tuple, Iterable
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from apps.backend.core.config import settings
+from apps.backend.core.metrics import VECTOR_INDEX_SIZE
+from .ann_index import IVFIndex
+from .embeddings import EmbeddingService
+from .shared_matrix import SharedMatrixStore
+
+logger = logging.getLogger(__name__)
+
+
+class VectorIndex:
+    """
+    In-memory embedding matrix with an id → row map.
+
+    Vectors are normalized once at build time, so cosine similarity against
+    a normalized query reduces to a dot product. Top-k selection uses
+    `np.argpartition`, which is O(N) instead of a full sort.
+
+    Rows live in a buffer with spare capacity so single vectors can be
+    upserted without copying the matrix. Removed rows are tombstoned
+    (id -1) and squeezed out once they make up a quarter of the buffer.
+
+    Args:
+        name: Index name used in logs and metrics
+        dim: Vector dimension
+        criteria: Optional callable returning SQLAlchemy filter clauses
+            that restrict which rows `load` indexes
+        shared: Optional snapshot store; `load` then publishes the matrix
+            for all workers and `ensure_loaded` attaches newer snapshots
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dim: int = EmbeddingService._embedding_dim,
+        criteria: Optional[Callable[[], list]] = None,
+        shared: Optional[SharedMatrixStore] = None
+    ):
+        self.name = name
+        self.dim = dim
+        self.criteria = criteria
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._matrix = np.empty((0, dim), dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._size = 0  # Rows in use, including tombstones
+        self._deleted = 0
+        self._id_to_row = {}
+        self._ann: Optional[IVFIndex] = None
+        self._built_at: Optional[float] = None
+        self._generation: Optional[int] = None  # Attached shared snapshot
+        self._checked_at = 0.0
+
+    def __len__(self) -> int:
+        return self._size - self._deleted
+
+    @staticmethod
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize vectors row-wise; zero vectors stay zero.
+
+        Args:
+            vectors: 1-D vector or 2-D matrix
+
+        Returns:
+            np.ndarray: Contiguous float32 array of the same shape
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _build_ann(self, matrix: np.ndarray) -> Optional[IVFIndex]:
+        """Build the IVF partitioning if it is enabled and the catalog is large enough."""
+        if settings.VECTOR_INDEX_ANN != "ivf" or len(matrix) < settings.VECTOR_INDEX_ANN_MIN_SIZE:
+            return None
+
+        start_time = time.time()
+        ann = IVFIndex(nlist=settings.VECTOR_INDEX_IVF_NLIST or None)
+        ann.build(matrix)
+        logger.info(f"Trained IVF for {self.name} vector index in {time.time() - start_time:.2f}s")
+        return ann
+
+    def build(self, ids: List[int], vectors: np.ndarray):
+        """
+        Replace the index contents.
+
+        Args:
+            ids: Row ids (job or career ids)
+            vectors: Matrix of shape (len(ids), dim)
+        """
+        matrix = self.normalize(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+        id_array = np.asarray(ids, dtype=np.int64)
+        self._install(matrix, id_array, len(id_array), self._build_ann(matrix), time.time())
+        logger.info(f"Built {self.name} vector index with {len(id_array)} vectors")
+
+    def _install(
+        self,
+        matrix: np.ndarray,
+        ids: np.ndarray,
+        size: int,
+        ann: Optional[IVFIndex],
+        built_at: float,
+        generation: Optional[int] = None
+    ):
+        """Swap in new buffers; searches already running keep the old ones."""
+        id_to_row = {int(item_id): row for row, item_id in enumerate(ids[:size].tolist())}
+
+        with self._lock:
+            self._matrix = matrix
+            self._ids = ids
+            self._size = size
+            self._deleted = 0
+            self._id_to_row = id_to_row
+            self._ann = ann
+            self._built_at = built_at
+            self._generation = generation
+
+        VECTOR_INDEX_SIZE.labels(index=self.name).set(size)
+
+    def load(self, db: Session, model) -> int:
+        """
+        Build the index from a model's `id` and `embedding` columns.
+
+        Only the two columns are selected; ORM objects are never hydrated,
+        and binary embeddings are read with `np.frombuffer` (no parsing).
+        Rows with missing or malformed embeddings are skipped. A shared
+        index publishes the result as a new snapshot for every worker.
+
+        Args:
+            db: Database session
+            model: SQLAlchemy model class with `id` and `embedding` columns
+
+        Returns:
+            int: Number of vectors indexed
+        """
+        if self.shared is not None:
+            with self.shared.builder_lock():
+                self._attach(self._publish(db, model))
+            return len(self)
+
+        ids, matrix = self._read(db, model)
+        self.build(ids, matrix)
+        return len(ids)
+
+    def _read(self, db: Session, model) -> Tuple[List[int], np.ndarray]:
+        """Read (ids, vectors) of every indexable row."""
+        query = db.query(model.id, model.embedding).filter(model.embedding.isnot(None))
+        if self.criteria is not None:
+            query = query.filter(*self.criteria())
+        rows = query.all()
+
+        ids = []
+        vectors = []
+        for item_id, raw in rows:
+            try:
+                vectors.append(EmbeddingService.bytes_to_vector(raw))
+                ids.append(item_id)
+            except ValueError as e:
+                logger.warning(f"Skipping {self.name} {item_id} with invalid embedding: {str(e)}")
+
+        matrix = np.vstack(vectors) if vectors else np.empty((0, self.dim), dtype=np.float32)
+        return ids, matrix
+
+    def _publish(self, db: Session, model) -> dict:
+        """Read the rows, train IVF if enabled, and publish a shared snapshot (builder lock held)."""
+        ids, vectors = self._read(db, model)
+        built_at = time.time()
+        matrix = self.normalize(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+        ann = self._build_ann(matrix)
+        pointer = self.shared.publish(
+            matrix,
+            np.asarray(ids, dtype=np.int64),
+            built_at,
+            centroids=ann.centroids if ann is not None else None,
+            assign=ann._assign if ann is not None else None
+        )
+        logger.info(f"Built {self.name} vector index with {len(ids)} vectors")
+        return pointer
+
+    def _attach(self, pointer: dict):
+        """Map a published snapshot and make it this worker's index."""
+        arrays = self.shared.attach(pointer)
+        size = pointer["size"]
+
+        ann = None
+        if "centroids" in arrays:
+            ann = IVFIndex(nlist=settings.VECTOR_INDEX_IVF_NLIST or None)
+            ann.centroids = np.array(arrays["centroids"])
+            ann._set_assignments(np.array(arrays["assign"][:size]))
+
+        self._install(arrays["matrix"], arrays["ids"], size, ann, pointer["built_at"], pointer["generation"])
+        logger.info(f"Attached {self.name} vector index generation {pointer['generation']} ({size} vectors)")
+
+    def _refresh_shared(self, db: Session, model):
+        """
+        Attach the newest shared snapshot, building one first if it is missing or too old.
+
+        The pointer file is checked at most every VECTOR_INDEX_SHARED_CHECK_SECONDS.
+        Workers that find the snapshot stale queue on the builder lock; the
+        first one rebuilds and the rest attach its result.
+        """
+        now = time.time()
+        if not self.is_stale() and now - self._checked_at < settings.VECTOR_INDEX_SHARED_CHECK_SECONDS:
+            return
+        self._checked_at = now
+
+        max_age = settings.VECTOR_INDEX_REFRESH_SECONDS
+        pointer = self.shared.current()
+        if pointer is None or now - pointer["built_at"] > max_age:
+            with self.shared.builder_lock():
+                pointer = self.shared.current()
+                if pointer is None or time.time() - pointer["built_at"] > max_age:
+                    pointer = self._publish(db, model)
+
+        if pointer["generation"] != self._generation:
+            try:
+                self._attach(pointer)
+            except FileNotFoundError:
+                # Replaced by a newer generation between reading the pointer and mapping it
+                self._checked_at = 0.0
+
+    def upsert(self, item_id: int, vector):
+        """
+        Insert or replace one vector without rebuilding the index.
+
+        Args:
+            item_id: Row id (job or career id)
+            vector: Embedding (normalized here)
+        """
+        vector = self.normalize(np.asarray(vector, dtype=np.float32).reshape(self.dim))
+        item_id = int(item_id)
+
+        with self._lock:
+            row = self._id_to_row.get(item_id)
+            if row is None:
+                if self._size == len(self._ids):
+                    self._grow()
+                row = self._size
+                self._matrix[row] = vector
+                self._ids[row] = item_id
+                self._id_to_row[item_id] = row
+                # Publish the row only after it is written
+                self._size += 1
+            else:
+                self._matrix[row] = vector
+
+            if self._ann is not None:
+                self._ann.assign_row(row, vector)
+
+        VECTOR_INDEX_SIZE.labels(index=self.name).set(len(self))
+
+    def remove(self, item_id: int) -> bool:
+        """
+        Remove one vector.
+
+        Args:
+            item_id: Row id (job or career id)
+
+        Returns:
+            bool: True if the id was indexed
+        """
+        with self._lock:
+            row = self._id_to_row.pop(int(item_id), None)
+            if row is None:
+                return False
+
+            self._ids[row] = -1
+            self._deleted += 1
+            if self._ann is not None:
+                self._ann.remove_row(row)
+
+            if self._deleted > max(1024, self._size // 4):
+                self._compact()
+
+        VECTOR_INDEX_SIZE.labels(index=self.name).set(len(self))
+        return True
+
+    def _grow(self):
+        """
+        Double the row capacity (lock held). Readers keep the old buffers.
+
+        For a shared snapshot this copies the matrix into this worker until
+        the next snapshot is attached.
+        """
+        capacity = max(1024, 2 * len(self._ids))
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        ids = np.full(capacity, -1, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        self._matrix, self._ids = matrix, ids
+
+    def _compact(self):
+        """Squeeze out tombstoned rows (lock held). Readers keep the old buffers."""
+        live = np.flatnonzero(self._ids[:self._size] >= 0)
+        self._matrix = self._matrix[live]
+        self._ids = self._ids[live]
+        self._size = len(live)
+        self._deleted = 0
+        self._id_to_row = {int(item_id): row for row, item_id in enumerate(self._ids)}
+        if self._ann is not None:
+            self._ann = self._ann.compacted(live)
+        logger.info(f"Compacted {self.name} vector index to {self._size} vectors")
+
+    def is_built(self) -> bool:
+        """Check whether the index has been built at least once."""
+        return self._built_at is not None
+
+    def is_stale(self, max_age: Optional[float] = None) -> bool:
+        """Check whether the index was never built or is older than max_age seconds."""
+        if self._built_at is None:
+            return True
+        if max_age is None:
+            max_age = settings.VECTOR_INDEX_REFRESH_SECONDS
+        return time.time() - self._built_at > max_age
+
+    def ensure_loaded(self, db: Session, model) -> "VectorIndex":
+        """Load the index if it is missing or older than the refresh interval."""
+        if self.shared is not None:
+            self._refresh_shared(db, model)
+        elif self.is_stale():
+            self.load(db, model)
+        return self
+
+    def get_vector(self, item_id: int) -> Optional[np.ndarray]:
+        """Get the normalized vector stored for an id, if any."""
+        with self._lock:
+            row = self._id_to_row.get(item_id)
+            if row is None:
+                return None
+            return self._matrix[row].copy()
+
+    def search(
+        self,
+        query_vector,
+        k: int,
+        min_score: float = -1.0,
+        allowed_ids: Optional[Iterable[int]] = None,
+        exclude_ids: Optional[Iterable[int]] = None,
+        exact: bool = False,
+        nprobe: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the top-k most similar ids for a query vector.
+
+        With an IVF partitioning, only rows in the `nprobe` closest lists are
+        scored (exactly, against the full vectors). If fewer than k eligible
+        rows are found there, or the allowed set is small, the search falls
+        back to an exact scan.
+
+        Args:
+            query_vector: Query embedding (normalized here)
+            k: Maximum number of results
+            min_score: Minimum cosine similarity to keep
+            allowed_ids: If given, only these ids are eligible
+            exclude_ids: Ids that are never returned
+            exact: Always scan every row
+            nprobe: IVF lists to visit (defaults to VECTOR_INDEX_IVF_NPROBE)
+
+        Returns:
+            List[Tuple[int, float]]: (id, similarity) pairs, best first
+        """
+        # Take one consistent snapshot; writers swap or append, never shrink, these buffers
+        with self._lock:
+            matrix, ids, size, ann = self._matrix, self._ids, self._size, self._ann
+            live, id_to_row = size - self._deleted, self._id_to_row
+
+        if k <= 0 or live <= 0:
+            return []
+
+        matrix, ids = matrix[:size], ids[:size]
+        query = self.normalize(np.asarray(query_vector, dtype=np.float32).reshape(self.dim))
+        allowed = np.fromiter(allowed_ids, dtype=np.int64) if allowed_ids is not None else None
+        excluded = np.fromiter(exclude_ids, dtype=np.int64) if exclude_ids is not None else None
+
+        rows = None
+        probed = False
+        if allowed is not None and len(allowed) * 4 <= size:
+            # A small allowed set is cheaper to score exactly than to probe
+            rows = np.fromiter(
+                (id_to_row.get(int(item_id), -1) for item_id in allowed), dtype=np.int64
+            )
+        elif ann is not None and not exact:
+            rows = ann.candidates(query, nprobe or settings.VECTOR_INDEX_IVF_NPROBE)
+            probed = True
+
+        rows, scores = self._score(matrix, ids, query, rows, allowed, excluded)
+        if probed and len(rows) < k:
+            # The probed lists held too few eligible rows (e.g. strict filters)
+            rows, scores = self._score(matrix, ids, query, None, allowed, excluded)
+
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for position in top:
+            score = float(scores[position])
+            if score < min_score:
+                break
+            results.append((int(ids[rows[position]]), max(-1.0, min(1.0, score))))
+
+        return results
+
+    @staticmethod
+    def _score(
+        matrix: np.ndarray,
+        ids: np.ndarray,
+        query: np.ndarray,
+        rows: Optional[np.ndarray],
+        allowed: Optional[np.ndarray],
+        excluded: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score eligible rows exactly.
+
+        Args:
+            rows: Candidate row numbers, or None for every row
+
+        Returns:
+            Tuple of eligible row numbers and their similarity scores
+        """
+        every_row = rows is None
+        if every_row:
+            rows = np.arange(len(ids))
+        else:
+            rows = rows[(rows >= 0) & (rows < len(ids))]
+
+        row_ids = ids[rows]
+        keep = row_ids >= 0
+        if allowed is not None:
+            keep &= np.isin(row_ids, allowed)
+        if excluded is not None:
+            keep &= ~np.isin(row_ids, excluded)
+        rows = rows[keep]
+
+        # Candidate rows come in list order, so only an unfiltered scan can skip the gather
+        if every_row and len(rows) == len(ids):
+            return rows, matrix @ query
+        return rows, matrix[rows] @ query
+
+    def get_stats(self) -> dict:
+        """Get index size information."""
+        return {
+            'name': self.name,
+            'size': len(self),
+            'dim': self.dim,
+            'bytes': int(self._matrix.nbytes),
+            'built_at': self._built_at,
+            'shared_generation': self._generation,
+            'ann': self._ann.get_stats() if self._ann is not None else None
+        }
+
+
+def indexable_job_criteria() -> list:
+    """Jobs that belong in the search index: verified, OPEN and active."""
+    from apps.backend.models.job import Job, JobStatus
+    return [Job.is_verified == True, Job.status == JobStatus.OPEN, Job.is_active == True]
+
+
+def shared_store(name: str) -> Optional[SharedMatrixStore]:
+    """Snapshot store for an index when VECTOR_INDEX_SHARED_DIR is configured."""
+    if not settings.VECTOR_INDEX_SHARED_DIR:
+        return None
+    return SharedMatrixStore(settings.VECTOR_INDEX_SHARED_DIR, name)
+
+
+# Singleton indexes (process-local, or backed by shared snapshots)
+job_index = VectorIndex("jobs", criteria=indexable_job_criteria, shared=shared_store("jobs"))
+career_index = VectorIndex("careers", shared=shared_store("careers"))
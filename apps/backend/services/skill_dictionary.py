@@ -0,0 +1,336 @@
+"""
+Skill Dictionary
+Canonical skill names, alias resolution and integer skill ids
+
+Skill lists are canonicalized when they are written (lower case, single
+spaces, aliases such as "js" resolved to "javascript") and every canonical
+name is interned in the `skills` table. Skill overlap is computed over these
+ids (see services/ai/skill_overlap.py) instead of by re-normalizing and
+comparing strings: the dictionary keeps a containment map from each id to
+the ids of the skills whose names it contains or is contained in (plain
+substrings, as the original string comparison did: "sql" and "postgresql"),
+filled when a name is registered, so matching a user never compares names. The ids also key the
+job_skills and career_skills filter tables (see services/skill_index.py).
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+MAX_SKILL_LENGTH = 255  # skills.name column size
+
+# Built-in aliases; rows in skill_aliases add to (and override) these
+DEFAULT_ALIASES: Dict[str, str] = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "k8s": "kubernetes",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+    "gis": "geographic information systems",
+    "pv": "solar pv",
+    "solar photovoltaic": "solar pv",
+    "ev": "electric vehicles",
+    "ev systems": "electric vehicles",
+    "hvac systems": "hvac",
+    "esg": "esg reporting",
+    "ghg accounting": "carbon accounting",
+    "lca": "life cycle assessment",
+    "leed": "leed certification",
+    "autocad 2d": "autocad",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "project mgmt": "project management",
+}
+
+
+def normalize_skill_name(skill) -> str:
+    """Lower-case a skill and collapse whitespace (no alias resolution)."""
+    if skill is None:
+        return ""
+    return " ".join(str(skill).lower().split())[:MAX_SKILL_LENGTH]
+
+
+class SkillDictionary:
+    """
+    In-memory view of the skills and skill_aliases tables.
+
+    Ids come from the `skills` table. Names that were never interned (e.g.
+    skills typed into a query string) get a negative, process-local id, so
+    they still compare correctly within this process without a write.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        self._default_aliases = dict(DEFAULT_ALIASES if aliases is None else aliases)
+        self._aliases = dict(self._default_aliases)
+        self._name_to_id: Dict[str, int] = {}
+        self._id_to_name: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._next_local_id = -1
+        # Containment map: id -> ids it covers (itself, the skills inside it, the skills containing it)
+        self._related: Dict[int, Set[int]] = {}
+        self._related_arrays: Dict[int, np.ndarray] = {}
+        # Bumped whenever an id is replaced, so matrices keyed by old ids can be rebuilt
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return sum(1 for skill_id in self._id_to_name if skill_id > 0)
+
+    def load(self, db=None):
+        """(Re)read all skills and aliases from the database."""
+        from apps.backend.db.session import SessionLocal
+        from apps.backend.models.skill import Skill, SkillAlias
+
+        session = db or SessionLocal()
+        try:
+            skills = session.query(Skill.id, Skill.name).all()
+            aliases = (
+                session.query(SkillAlias.alias, Skill.name)
+                .join(Skill, Skill.id == SkillAlias.skill_id)
+                .all()
+            )
+        finally:
+            if db is None:
+                session.close()
+
+        with self._lock:
+            for skill_id, name in skills:
+                self._register(name, skill_id, link=False)
+            self._link_all()
+            self._aliases = {**self._default_aliases, **dict(aliases)}
+            self._loaded = True
+        logger.info(f"Loaded {len(skills)} skills and {len(aliases)} aliases")
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        try:
+            self.load()
+        except SQLAlchemyError as e:
+            # Keep working with process-local ids until the database is reachable
+            logger.warning(f"Skill dictionary not loaded from database: {str(e)}")
+            self._loaded = True
+
+    def _register(self, name: str, skill_id: int, link: bool = True):
+        """Map a name to an id (lock held), replacing a process-local id."""
+        previous = self._name_to_id.get(name)
+        if previous == skill_id:
+            return
+        if previous is not None:
+            self._id_to_name.pop(previous, None)
+            self._unlink(previous)
+            self.generation += 1
+        self._name_to_id[name] = skill_id
+        self._id_to_name[skill_id] = name
+        if link:
+            self._link(skill_id)
+
+    # --- Containment map ---------------------------------------------------
+
+    @staticmethod
+    def _parts(name: str) -> Iterable[str]:
+        """Every substring of a name (the skills it can contain)."""
+        for start in range(len(name)):
+            for end in range(start + 1, len(name) + 1):
+                yield name[start:end]
+
+    @staticmethod
+    def _covers_name(outer: str, inner: str) -> bool:
+        """Whether `inner` is a substring of `outer`."""
+        return inner in outer
+
+    def _relate(self, first: int, second: int):
+        self._related.setdefault(first, {first}).add(second)
+        self._related.setdefault(second, {second}).add(first)
+        self._related_arrays.pop(first, None)
+        self._related_arrays.pop(second, None)
+
+    def _link(self, skill_id: int):
+        """Add one new id to the containment map (lock held)."""
+        name = self._id_to_name[skill_id]
+        self._related.setdefault(skill_id, {skill_id})
+        self._related_arrays.pop(skill_id, None)
+        for part in set(self._parts(name)):
+            part_id = self._name_to_id.get(part)
+            if part_id is not None and part_id != skill_id:
+                self._relate(skill_id, part_id)
+        for other_id, other in self._id_to_name.items():
+            if other_id != skill_id and self._covers_name(other, name):
+                self._relate(skill_id, other_id)
+
+    def _unlink(self, skill_id: int):
+        """Drop an id from the containment map (lock held)."""
+        for other_id in self._related.pop(skill_id, ()):
+            if other_id != skill_id:
+                self._related[other_id].discard(skill_id)
+                self._related_arrays.pop(other_id, None)
+        self._related_arrays.pop(skill_id, None)
+
+    def _link_all(self):
+        """Rebuild the containment map of every name (lock held)."""
+        self._related = {skill_id: {skill_id} for skill_id in self._id_to_name}
+        self._related_arrays = {}
+        # Every contained pair is found from the containing name's parts
+        for skill_id, name in self._id_to_name.items():
+            for part in set(self._parts(name)):
+                part_id = self._name_to_id.get(part)
+                if part_id is not None and part_id != skill_id:
+                    self._relate(skill_id, part_id)
+
+    def related(self, skill_id: int) -> np.ndarray:
+        """
+        Sorted ids a skill covers when matching.
+
+        Args:
+            skill_id: Skill id
+
+        Returns:
+            np.ndarray: int32 ids of the skill itself, the skills it contains
+                and the skills that contain it
+        """
+        array = self._related_arrays.get(skill_id)
+        if array is None:
+            with self._lock:
+                related = self._related.get(skill_id, {skill_id})
+                array = np.fromiter(sorted(related), dtype=np.int32, count=len(related))
+                self._related_arrays[skill_id] = array
+        return array
+
+    def canonical_name(self, skill) -> str:
+        """Normalized, alias-resolved name of a skill ("" for blanks)."""
+        name = normalize_skill_name(skill)
+        return self._aliases.get(name, name)
+
+    def canonicalize(self, skills: Optional[Iterable]) -> List[str]:
+        """Canonical names of a skill list, de-duplicated in first-seen order."""
+        names = (self.canonical_name(skill) for skill in (skills or []))
+        return [name for name in dict.fromkeys(names) if name]
+
+    def intern(self, skills: Optional[Iterable]) -> List[str]:
+        """
+        Canonicalize a skill list for storage and add new names to the skills table.
+
+        New names are committed in their own session; the dictionary only
+        grows, so a failed write of the calling request leaves nothing
+        inconsistent.
+
+        Args:
+            skills: Skill names as entered
+
+        Returns:
+            List[str]: Canonical names to store on the user, job or career
+        """
+        self._ensure_loaded()
+        names = self.canonicalize(skills)
+        new_names = [name for name in names if self._name_to_id.get(name, -1) < 0]
+        if new_names:
+            try:
+                self._insert(new_names)
+            except SQLAlchemyError as e:
+                logger.warning(f"Skills not interned: {str(e)}")
+        return names
+
+    def _insert(self, names: List[str]):
+        """Insert names into the skills table and record their ids."""
+        from apps.backend.db.session import SessionLocal
+        from apps.backend.models.skill import Skill
+
+        db = SessionLocal()
+        try:
+            for name in names:
+                try:
+                    with db.begin_nested():
+                        db.add(Skill(name=name))
+                except IntegrityError:
+                    pass  # Interned concurrently by another worker
+            db.commit()
+            rows = db.query(Skill.id, Skill.name).filter(Skill.name.in_(names)).all()
+        finally:
+            db.close()
+
+        with self._lock:
+            for skill_id, name in rows:
+                self._register(name, skill_id)
+
+    def _id_for(self, name: str) -> int:
+        """Id of a canonical name, assigning a process-local one if it was never interned."""
+        skill_id = self._name_to_id.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._name_to_id.get(name)
+                if skill_id is None:
+                    skill_id = self._next_local_id
+                    self._next_local_id -= 1
+                    self._register(name, skill_id)
+        return skill_id
+
+    def id_of(self, name: str) -> int:
+        """Id of a canonical skill name."""
+        self._ensure_loaded()
+        return self._id_for(name)
+
+    def stored_ids(self, names: Iterable[str], db=None) -> Dict[str, int]:
+        """
+        Database ids of canonical names, reading names this process has not seen.
+
+        Another worker may have interned a name after this dictionary was
+        loaded, so names with a process-local id are looked up once more.
+
+        Args:
+            names: Canonical skill names
+            db: Optional session to read with
+
+        Returns:
+            Dict[str, int]: Id per name that exists in the skills table
+        """
+        from apps.backend.db.session import SessionLocal
+        from apps.backend.models.skill import Skill
+
+        self._ensure_loaded()
+        names = list(dict.fromkeys(names))
+        unknown = [name for name in names if self._name_to_id.get(name, -1) < 0]
+        if unknown:
+            session = db or SessionLocal()
+            try:
+                rows = session.query(Skill.id, Skill.name).filter(Skill.name.in_(unknown)).all()
+            finally:
+                if db is None:
+                    session.close()
+            with self._lock:
+                for skill_id, name in rows:
+                    self._register(name, skill_id)
+        return {name: self._name_to_id[name] for name in names if self._name_to_id.get(name, -1) > 0}
+
+    def id_list(self, skills: Optional[Iterable], canonical: bool = False) -> np.ndarray:
+        """
+        Int32 ids of a skill list, de-duplicated in first-seen order.
+
+        Args:
+            skills: Skill names
+            canonical: Names are already canonical (stored lists), so skip normalization
+
+        Returns:
+            np.ndarray: Skill ids
+        """
+        self._ensure_loaded()
+        names = list(dict.fromkeys(name for name in (skills or []) if name)) if canonical else self.canonicalize(skills)
+        return np.fromiter((self._id_for(name) for name in names), dtype=np.int32, count=len(names))
+
+    def ids(self, skills: Optional[Iterable], canonical: bool = False) -> np.ndarray:
+        """Sorted, unique int32 ids of a skill list."""
+        return np.unique(self.id_list(skills, canonical))
+
+    def names(self, ids: Iterable[int]) -> List[str]:
+        """Canonical names for skill ids."""
+        return [self._id_to_name[int(skill_id)] for skill_id in ids]
+
+
+# Process-wide singleton
+skill_dictionary = SkillDictionary()
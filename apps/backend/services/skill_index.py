@@ -0,0 +1,102 @@
+"""
+Skill Index
+Inverted skill → job and skill → career indexes for required-skill filters
+
+Job.required_skills and Career.required_skills stay the source of truth
+(JSON arrays of canonical names); job_skills and career_skills mirror them
+as (item, skill id) rows so "has all of these skills" filters become an
+indexed lookup on (skill_id, item_id) instead of a JSON scan per skill.
+Writers call set_job_skills / set_career_skills after changing the lists.
+"""
+
+import logging
+from typing import Iterable, Optional
+
+from sqlalchemy import false, func, select
+from sqlalchemy.orm import Session
+
+from apps.backend.models.career import Career
+from apps.backend.models.job import Job
+from apps.backend.models.skill import CareerSkill, JobSkill
+from apps.backend.services.skill_dictionary import skill_dictionary
+
+logger = logging.getLogger(__name__)
+
+
+def _replace_links(db: Session, link_model, item_column, item_id: int, skills: Optional[Iterable[str]]):
+    """Replace an item's rows in a skill link table (caller commits)."""
+    names = skill_dictionary.canonicalize(skills)
+    ids = skill_dictionary.stored_ids(names, db=db)
+    missing = [name for name in names if name not in ids]
+    if missing:
+        # Interning failed when the list was written; without ids the item would never match a filter
+        skill_dictionary.intern(missing)
+        ids.update(skill_dictionary.stored_ids(missing, db=db))
+        missing = [name for name in missing if name not in ids]
+        if missing:
+            logger.warning(
+                f"{link_model.__tablename__}: item {item_id} has skills without ids, not filterable: {missing}"
+            )
+    db.query(link_model).filter(item_column == item_id).delete(synchronize_session=False)
+    if ids:
+        db.bulk_insert_mappings(
+            link_model, [{item_column.key: item_id, "skill_id": skill_id} for skill_id in set(ids.values())]
+        )
+
+
+def set_job_skills(db: Session, job: Job):
+    """
+    Sync job_skills with a job's required skills (caller commits).
+
+    Args:
+        db: Database session
+        job: Job whose required_skills were just set (flushed if it has no id yet)
+    """
+    if job.id is None:
+        db.flush()
+    _replace_links(db, JobSkill, JobSkill.job_id, job.id, job.required_skills)
+
+
+def set_career_skills(db: Session, career: Career):
+    """
+    Sync career_skills with a career's required skills (caller commits).
+
+    Args:
+        db: Database session
+        career: Career whose required_skills were just set (flushed if it has no id yet)
+    """
+    if career.id is None:
+        db.flush()
+    _replace_links(db, CareerSkill, CareerSkill.career_id, career.id, career.required_skills)
+
+
+def _having_all(db: Session, link_model, item_column, target_column, skills: Iterable[str]):
+    """Filter criterion: the item has every skill (an intersection over the skill index)."""
+    names = skill_dictionary.canonicalize(skills)
+    if not names:
+        return None
+    ids = skill_dictionary.stored_ids(names, db=db)
+    if len(ids) < len(names):
+        # A skill nobody has ever listed cannot match
+        return false()
+
+    skill_ids = set(ids.values())
+    matching = (
+        select(item_column)
+        .where(link_model.skill_id.in_(skill_ids))
+        .group_by(item_column)
+        .having(func.count() == len(skill_ids))
+    )
+    return target_column.in_(matching)
+
+
+def filter_jobs_by_skills(db: Session, query, skills: Iterable[str]):
+    """Restrict a Job query to jobs requiring all of the given skills."""
+    criterion = _having_all(db, JobSkill, JobSkill.job_id, Job.id, skills)
+    return query if criterion is None else query.filter(criterion)
+
+
+def filter_careers_by_skills(db: Session, query, skills: Iterable[str]):
+    """Restrict a Career query to careers requiring all of the given skills."""
+    criterion = _having_all(db, CareerSkill, CareerSkill.career_id, Career.id, skills)
+    return query if criterion is None else query.filter(criterion)
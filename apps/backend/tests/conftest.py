@@ -0,0 +1,32 @@
+"""
+Test configuration
+
+Modules are imported as `apps.backend.*`, so the repository root has to be
+importable when pytest runs from apps/backend (as CI does). Tests that need
+a database get an in-memory SQLite session with the full schema.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture
+def db():
+    """Session on an empty in-memory SQLite database with every table."""
+    import apps.backend.models  # noqa: F401  (registers every table)
+    from apps.backend.db.base import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
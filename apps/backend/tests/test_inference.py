@@ -0,0 +1,39 @@
+"""
+Inference executor tests: async entry point and backpressure.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from apps.backend.services.ai.inference import InferenceBusyError, InferenceExecutor
+
+
+def test_run_awaits_the_pool_result():
+    executor = InferenceExecutor(max_workers=2, max_pending=4)
+
+    async def main():
+        return await asyncio.gather(*(executor.run(pow, value, 2) for value in range(4)))
+
+    assert asyncio.run(main()) == [0, 1, 4, 9]
+    assert executor.get_stats()['pending'] == 0
+    assert executor.get_stats()['completed'] == 4
+
+
+def test_full_queue_rejects_instead_of_waiting():
+    executor = InferenceExecutor(max_workers=1, max_pending=2)
+    release = threading.Event()
+    running = [executor.submit(release.wait) for _ in range(2)]
+
+    async def main():
+        with pytest.raises(InferenceBusyError):
+            await executor.run(pow, 2, 2)
+        release.set()
+        # A slot frees up once a queued call finishes
+        await asyncio.wrap_future(running[0])
+        await asyncio.wrap_future(running[1])
+        return await executor.run(pow, 2, 3)
+
+    assert asyncio.run(main()) == 8
+    assert executor.get_stats()['rejected'] == 1
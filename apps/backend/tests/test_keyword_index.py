@@ -0,0 +1,293 @@
+"""
+Keyword index tests: varint coding, incremental merges and compaction,
+MaxScore top-k and the windowed keyword_search, each checked against a
+brute-force reference.
+"""
+
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from apps.backend.core.config import settings
+from apps.backend.models.career import Career
+from apps.backend.services.ai.keyword_index import (
+    KeywordIndex,
+    decode_varint,
+    encode_varint,
+    keyword_search,
+    tokenize,
+    varint_sizes,
+)
+
+FIELDS = {"title": 3.0, "description": 1.0, "requirements": 1.5}
+VOCABULARY = [f"w{number}" for number in range(60)]
+
+
+def reference_varint(values):
+    """Byte-at-a-time LEB128 encoding."""
+    out = []
+    for value in values:
+        while True:
+            byte = value & 0x7F
+            value >>= 7
+            if value:
+                out.append(byte | 0x80)
+            else:
+                out.append(byte)
+                break
+    return np.asarray(out, dtype=np.uint8)
+
+
+def random_text(rng, words):
+    # Zipf-like draw, so a few terms are frequent (cheap MaxScore bounds) and most are rare
+    picks = [VOCABULARY[min(int(rng.paretovariate(1.0)) - 1, len(VOCABULARY) - 1)] for _ in range(words)]
+    return " ".join(picks)
+
+
+def random_document(rng):
+    return {
+        "title": random_text(rng, rng.randint(1, 4)),
+        "description": random_text(rng, rng.randint(0, 30)),
+        "requirements": random_text(rng, rng.randint(0, 8)) if rng.random() < 0.7 else None,
+    }
+
+
+def analyze(texts):
+    """Boosted term weights (as stored, in float16) and boosted length."""
+    weights = Counter()
+    length = 0.0
+    for field, boost in FIELDS.items():
+        tokens = tokenize(texts.get(field))
+        length += boost * len(tokens)
+        for token in tokens:
+            weights[token] += boost
+    return {term: float(np.float16(weight)) for term, weight in weights.items()}, length
+
+
+def reference_scores(documents, text, allowed_ids=None, k1=1.2, b=0.75):
+    """BM25 score of every matching document, with statistics over all documents."""
+    analyzed = {item_id: analyze(texts) for item_id, texts in documents.items()}
+    analyzed = {item_id: entry for item_id, entry in analyzed.items() if entry[0]}
+    n_docs = len(analyzed)
+    avg_length = max(sum(length for _, length in analyzed.values()) / n_docs, 1e-6)
+
+    scores = {}
+    for term in dict.fromkeys(tokenize(text)):
+        df = sum(1 for weights, _ in analyzed.values() if term in weights)
+        if df == 0:
+            continue
+        idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+        for item_id, (weights, length) in analyzed.items():
+            if term not in weights or (allowed_ids is not None and item_id not in allowed_ids):
+                continue
+            weight = weights[term]
+            norm = k1 * (1.0 - b + b * length / avg_length)
+            scores[item_id] = scores.get(item_id, 0.0) + idf * weight * (k1 + 1.0) / (weight + norm)
+    return scores
+
+
+def assert_matches_reference(index, documents, text, k, allowed_ids=None):
+    results = index.search(text, k, allowed_ids=allowed_ids)
+    expected = reference_scores(documents, text, allowed_ids)
+    best = sorted(expected.values(), reverse=True)[:k]
+
+    assert len(results) == len(best)
+    for item_id, score in results:
+        assert score == pytest.approx(expected[item_id], rel=1e-4)
+    # Ids may swap within float32 ties, so compare the score sequence
+    assert [score for _, score in results] == pytest.approx(best, rel=1e-4)
+    assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+
+
+def assert_postings_match(index, documents):
+    """Every term's merged + tail postings hold exactly the live documents containing it."""
+    analyzed = {item_id: analyze(texts)[0] for item_id, texts in documents.items()}
+    for term, term_id in index._term_ids.items():
+        ordinals, weights = index._postings(term_id)
+        assert np.all(np.diff(ordinals) > 0)
+        found = {int(index._ids[ordinal]): float(weight) for ordinal, weight in zip(ordinals, weights)}
+        expected = {item_id: weights[term] for item_id, weights in analyzed.items() if term in weights}
+        assert found == expected
+
+
+@pytest.mark.parametrize("values", [
+    [],
+    [0],
+    [0, 1, 127, 128, 255, 16383, 16384, 2 ** 21 - 1, 2 ** 21, 2 ** 35, 2 ** 62],
+])
+def test_varint_matches_reference(values):
+    encoded = encode_varint(np.asarray(values, dtype=np.int64))
+
+    np.testing.assert_array_equal(encoded, reference_varint(values))
+    np.testing.assert_array_equal(varint_sizes(np.asarray(values, dtype=np.int64)),
+                                  [len(reference_varint([value])) for value in values])
+    np.testing.assert_array_equal(decode_varint(encoded), values)
+
+
+def test_varint_round_trip_random():
+    rng = np.random.default_rng(7)
+    values = (rng.pareto(0.5, size=5000) * 10).astype(np.int64) % (2 ** 40)
+
+    np.testing.assert_array_equal(decode_varint(encode_varint(values)), values)
+
+
+def test_incremental_updates_match_reference():
+    rng = random.Random(11)
+    index = KeywordIndex("test", FIELDS)
+    index.MIN_MERGE_POSTINGS = 40  # Merge often so tails and merged postings are both exercised
+    documents = {}
+
+    for step in range(600):
+        action = rng.random()
+        if action < 0.6 or not documents:
+            item_id = rng.randint(1, 250)
+            documents[item_id] = random_document(rng)
+            index.upsert(item_id, documents[item_id])
+        else:
+            item_id = rng.choice(sorted(documents))
+            del documents[item_id]
+            assert index.remove(item_id)
+
+        if step % 50 == 49:
+            assert len(index) == sum(1 for texts in documents.values() if analyze(texts)[0])
+            assert_postings_match(index, documents)
+            for _ in range(5):
+                text = random_text(rng, rng.randint(1, 5))
+                assert_matches_reference(index, documents, text, k=rng.choice([1, 3, 10, 1000]))
+
+    assert not index.remove(-1)
+
+
+def test_compaction_matches_reference():
+    rng = random.Random(5)
+    index = KeywordIndex("test", FIELDS)
+    documents = {item_id: random_document(rng) for item_id in range(1, 400)}
+    for item_id, texts in documents.items():
+        index.upsert(item_id, texts)
+
+    for item_id in rng.sample(sorted(documents), 150):
+        del documents[item_id]
+        index.remove(item_id)
+    with index._lock:
+        index._rebuild(compact=True)
+
+    assert index._size == len(index)
+    assert_postings_match(index, documents)
+    for _ in range(20):
+        assert_matches_reference(index, documents, random_text(rng, rng.randint(1, 6)), k=rng.choice([1, 5, 20]))
+
+
+@pytest.mark.parametrize("k", [1, 2, 5, 25])
+def test_maxscore_top_k_matches_exhaustive(k):
+    rng = random.Random(k)
+    index = KeywordIndex("test", FIELDS)
+    documents = {item_id: random_document(rng) for item_id in range(1, 800)}
+    for item_id, texts in documents.items():
+        index.upsert(item_id, texts)
+
+    # Frequent terms next to rare ones, so low-bound terms get pruned to probes
+    for text in ["w0 w1 w2 w40", "w0 w55", "w3 w17 w29 w0 w1", "w59", "w1 w2 w3 w4 w5 w6 w7 w8"]:
+        assert_matches_reference(index, documents, text, k)
+
+
+def test_allowed_ids_keep_global_statistics():
+    rng = random.Random(3)
+    index = KeywordIndex("test", FIELDS)
+    documents = {item_id: random_document(rng) for item_id in range(1, 300)}
+    for item_id, texts in documents.items():
+        index.upsert(item_id, texts)
+
+    allowed = set(rng.sample(sorted(documents), 40)) | {10_000}  # Unknown ids are ignored
+    for text in ["w0 w1", "w2 w30 w5", "w0"]:
+        for k in (1, 5, len(allowed)):
+            assert_matches_reference(index, documents, text, k, allowed_ids=allowed)
+    assert index.search("w0", 5, allowed_ids=[]) == []
+
+
+def test_unsearchable_query_returns_none():
+    index = KeywordIndex("test", FIELDS)
+    index.upsert(1, {"title": "solar installer"})
+
+    assert index.search("the and of", 5) is None
+    assert index.search("wind", 5) == []
+    assert index.search("solar", 0) == []
+
+
+@pytest.fixture
+def career_catalog(db, monkeypatch):
+    monkeypatch.setattr(settings, "KEYWORD_SEARCH_BACKEND", "index")
+    monkeypatch.setattr(settings, "KEYWORD_SEARCH_MAX_RESULTS", 1000)
+    rng = random.Random(5)
+    for number in range(300):
+        texts = random_document(rng)
+        db.add(Career(
+            title=texts["title"], description=texts["description"], required_skills=[], sdg_tags=[],
+            demand_score=float(number % 10)
+        ))
+    db.commit()
+
+    index = KeywordIndex("careers", {"title": 3.0, "description": 1.0})
+    index.load(db, Career)
+    searches = []
+    search = index.search
+
+    def recorded_search(text, k=10, allowed_ids=None):
+        searches.append(k)
+        return search(text, k, allowed_ids)
+
+    index.search = recorded_search
+    return index, searches
+
+
+def reference_page(db, index, text, demand_score):
+    """Every match the filter admits, ranked by a search restricted to them."""
+    eligible = [row[0] for row in db.query(Career.id).filter(Career.demand_score >= demand_score).all()]
+    return [item_id for item_id, _ in KeywordIndex.search(index, text, len(eligible), allowed_ids=eligible)]
+
+
+@pytest.mark.parametrize("demand_score", [0, 5, 9])
+@pytest.mark.parametrize("text", ["w0 w1", "w3 w17", "w40"])
+def test_keyword_search_window_matches_full_ranking(db, career_catalog, text, demand_score):
+    index, searches = career_catalog
+    expected = reference_page(db, index, text, demand_score)
+
+    for window in (1, 10, 45):
+        searches.clear()
+        query = db.query(Career).filter(Career.demand_score >= demand_score)
+        query, relevance, total = keyword_search(db, query, index, Career, text, window=window)
+
+        assert [career.id for career in query.order_by(relevance)] == expected[:window]
+        # The first search only ranks the window, so MaxScore can prune
+        assert searches[0] == window
+        if demand_score == 0 or len(expected) <= window:
+            assert total == len(expected)
+        else:
+            assert total >= min(window, len(expected))
+
+
+def test_keyword_search_without_window_keeps_every_match(db, career_catalog):
+    index, searches = career_catalog
+    expected = reference_page(db, index, "w0 w2", 5)
+
+    query = db.query(Career).filter(Career.demand_score >= 5)
+    query, relevance, total = keyword_search(db, query, index, Career, "w0 w2")
+
+    assert total == query.count() == len(expected)
+    assert [career.id for career in query.order_by(relevance)] == expected
+    assert index.match_count("w0 w2") == len(reference_scores(
+        {career.id: {"title": career.title, "description": career.description} for career in db.query(Career)},
+        "w0 w2"
+    ))
+
+
+def test_keyword_search_without_terms_falls_back_to_substrings(db, career_catalog):
+    index, _ = career_catalog
+
+    query, relevance, total = keyword_search(db, db.query(Career), index, Career, "the")
+    assert relevance is None and total is None
+
+    query, relevance, total = keyword_search(db, db.query(Career), index, Career, "w99", window=10)
+    assert query.count() == 0 and total == 0
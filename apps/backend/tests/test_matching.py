@@ -0,0 +1,167 @@
+"""
+Matching service tests: the cached catalog skill matrix follows catalog
+changes, and matches come from one vector index search with the stored user
+vector.
+"""
+
+import numpy as np
+import pytest
+
+from apps.backend.models.career import Career
+from apps.backend.models.job import Job, JobStatus
+from apps.backend.models.user import User, UserRole
+from apps.backend.services.ai import matching
+from apps.backend.services.ai.embeddings import EmbeddingService
+from apps.backend.services.ai.matching import matching_service
+from apps.backend.services.ai.vector_index import VectorIndex, indexable_job_criteria
+from apps.backend.services.skill_dictionary import skill_dictionary
+
+DIM = EmbeddingService._embedding_dim
+
+
+@pytest.fixture(autouse=True)
+def local_dictionary(monkeypatch):
+    monkeypatch.setattr(skill_dictionary, "_loaded", True)
+
+
+@pytest.fixture
+def indexes(monkeypatch):
+    careers = VectorIndex("careers")
+    jobs = VectorIndex("jobs", criteria=indexable_job_criteria)
+    monkeypatch.setattr(matching, "career_index", careers)
+    monkeypatch.setattr(matching, "job_index", jobs)
+    return careers, jobs
+
+
+def random_vectors(rng, rows):
+    vectors = rng.standard_normal((rows, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def add_user(db, skills, vector):
+    user = User(
+        email="seeker@example.com",
+        password_hash="x",
+        role=UserRole.USER,
+        skills=skills,
+        skill_embedding=EmbeddingService.vector_to_bytes(vector),
+        skill_embedding_version=EmbeddingService.get_embedding_version()
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def reference_top_k(query, items, k, min_score):
+    """Brute-force cosine over every eligible row, best first."""
+    scored = sorted(
+        ((float(vector @ query), item_id) for item_id, vector in items),
+        key=lambda pair: -pair[0]
+    )
+    return [item_id for score, item_id in scored if score >= min_score][:k]
+
+
+def add_career(db, title, skills, **fields):
+    career = Career(title=title, description=f"{title} role", required_skills=skills, sdg_tags=[7], **fields)
+    db.add(career)
+    db.commit()
+    return career
+
+
+def test_catalog_incidence_follows_catalog_changes(db):
+    solar = add_career(db, "Solar Technician", ["solar pv", "electrical"])
+    add_career(db, "Data Analyst", ["sql", "python"])
+    add_career(db, "Retired", ["cobol"], is_active=False)
+
+    first = matching_service._catalog_incidence(db, Career)
+    assert matching_service._catalog_incidence(db, Career) is first
+    assert len(first) == 2
+    assert first.overlap(first.coverage(["postgresql", "solar"]), first.row_of(solar.id)) == (["solar pv"], ["electrical"])
+
+    solar.required_skills = ["solar pv", "roofing"]
+    db.commit()
+    edited = matching_service._catalog_incidence(db, Career)
+    assert edited is not first
+    assert edited.overlap(edited.coverage(["roof"]), edited.row_of(solar.id)) == (["roofing"], ["solar pv"])
+
+    wind = add_career(db, "Wind Technician", ["wind turbines"])
+    added = matching_service._catalog_incidence(db, Career)
+    assert added is not edited and added.row_of(wind.id) is not None
+
+    wind.is_active = False
+    db.commit()
+    assert matching_service._catalog_incidence(db, Career).row_of(wind.id) is None
+
+
+@pytest.fixture
+def no_encoding(monkeypatch):
+    def encode(*args, **kwargs):
+        raise AssertionError("the stored user vector should be used")
+    monkeypatch.setattr(matching_service.embedding_service, "encode_user_skills", encode)
+
+
+def test_career_matches_come_from_the_index(db, indexes, no_encoding):
+    rng = np.random.default_rng(0)
+    vectors = random_vectors(rng, 40)
+    careers = []
+    for position, vector in enumerate(vectors):
+        careers.append(add_career(
+            db, f"Career {position}", ["solar pv", "python"] if position % 2 else ["wind"],
+            embedding=EmbeddingService.vector_to_bytes(vector), is_active=position % 5 != 0
+        ))
+    # Steer the user towards a retired career; it must still be skipped
+    query = random_vectors(rng, 1)[0] + vectors[0]
+    query /= np.linalg.norm(query)
+    user = add_user(db, ["solar"], query)
+
+    active = [(career.id, vector) for career, vector in zip(careers, vectors) if career.is_active]
+    matches = matching_service.match_careers_for_user(db, user, limit=7, min_similarity=-1.0)
+
+    assert [match.career.id for match in matches] == reference_top_k(query, active, 7, -1.0)
+    for match in matches:
+        np.testing.assert_allclose(match.similarity_score, vectors[careers.index(match.career)] @ query, atol=1e-5)
+        if "python" in match.career.required_skills:
+            assert (match.matched_skills, match.missing_skills) == (["solar pv"], ["python"])
+        else:
+            assert (match.matched_skills, match.missing_skills) == ([], ["wind"])
+
+    # A threshold cuts the list short instead of padding it
+    threshold = float(sorted(vectors[[careers.index(c) for c in careers if c.is_active]] @ query)[-3])
+    matches = matching_service.match_careers_for_user(db, user, limit=7, min_similarity=threshold)
+    assert [match.career.id for match in matches] == reference_top_k(query, active, 7, threshold)
+
+
+def test_job_recommendations_come_from_the_index(db, indexes, no_encoding):
+    rng = np.random.default_rng(1)
+    employer = User(email="employer@example.com", password_hash="x", role=UserRole.EMPLOYER, company_name="Sunworks")
+    db.add(employer)
+    db.commit()
+
+    query = random_vectors(rng, 1)[0]
+    vectors = random_vectors(rng, 30)
+    # Pull half of the jobs close to the user so some clear the 0.3 threshold
+    vectors[::2] += 2 * query
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    eligible = []
+    for position, vector in enumerate(vectors):
+        job = Job(
+            employer_id=employer.id, title=f"Job {position}", description="Field work",
+            required_skills=["solar pv installation", "rust"], sdg_tags=[7],
+            status=JobStatus.OPEN if position % 3 else JobStatus.DRAFT, is_verified=True, is_active=True,
+            embedding=EmbeddingService.vector_to_bytes(vector)
+        )
+        db.add(job)
+        db.flush()
+        if job.status == JobStatus.OPEN:
+            eligible.append((job.id, vector))
+    db.commit()
+    user = add_user(db, ["solar pv", "python"], query)
+
+    recommendations = matching_service.get_job_recommendations(db, user, limit=4)
+
+    assert [item["job_id"] for item in recommendations] == reference_top_k(query, eligible, 4, 0.3)
+    assert len(recommendations) == 4
+    for item in recommendations:
+        assert item["company_name"] == "Sunworks"
+        assert (item["matched_skills"], item["missing_skills"]) == (["solar pv installation"], ["rust"])
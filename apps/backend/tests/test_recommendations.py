@@ -0,0 +1,84 @@
+"""
+Recommendation store tests: a concurrent recompute keeps the other writer's
+rows, and any other integrity error still surfaces.
+"""
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from apps.backend.core.config import settings
+from apps.backend.models.career import Career
+from apps.backend.models.user import User, UserRole
+from apps.backend.models.user_recommendation import RecommendationType, UserRecommendation, UserRecommendationRun
+from apps.backend.services.ai import recommendations
+from apps.backend.services.ai.embeddings import EmbeddingService
+from apps.backend.services.ai.recommendations import RecommendationService
+from apps.backend.services.ai.vector_index import VectorIndex
+from apps.backend.services.skill_dictionary import skill_dictionary
+
+DIM = EmbeddingService._embedding_dim
+
+
+@pytest.fixture(autouse=True)
+def catalog(db, monkeypatch):
+    monkeypatch.setattr(skill_dictionary, "_loaded", True)
+    monkeypatch.setattr(settings, "RECOMMENDATION_TOP_K", 5, raising=False)
+    monkeypatch.setattr(settings, "RECOMMENDATION_MIN_SCORE", -1.0, raising=False)
+    monkeypatch.setattr(recommendations, "career_index", VectorIndex("careers"))
+
+    rng = np.random.default_rng(0)
+    for number in range(8):
+        db.add(Career(
+            title=f"Career {number}", description="Field work", required_skills=["solar pv"], sdg_tags=[7],
+            embedding=EmbeddingService.vector_to_bytes(rng.standard_normal(DIM).astype(np.float32))
+        ))
+    db.commit()
+
+
+def seeker(db=None, user_id=None):
+    vector = np.random.default_rng(1).standard_normal(DIM).astype(np.float32)
+    user = User(
+        id=user_id,
+        email=f"seeker{user_id or ''}@example.com",
+        password_hash="x",
+        role=UserRole.USER,
+        skills=["solar"],
+        skill_embedding=EmbeddingService.vector_to_bytes(vector),
+        skill_embedding_version=EmbeddingService.get_embedding_version()
+    )
+    if db is not None:
+        db.add(user)
+        db.commit()
+    return user
+
+
+def stored(db, user_id):
+    return db.query(UserRecommendation).filter(UserRecommendation.user_id == user_id).count()
+
+
+def test_concurrent_recompute_keeps_the_stored_rows(db, monkeypatch):
+    service = RecommendationService()
+    user = seeker(db)
+    assert service.recompute(db, user, RecommendationType.CAREER) == 5
+
+    # The other request has stored its rows between our delete and insert
+    monkeypatch.setattr(service, "invalidate", lambda *args: None)
+    assert service.recompute(db, user, RecommendationType.CAREER) == 0
+    assert stored(db, user.id) == 5
+
+    # Same for the run marker alone, when there are no rows to store
+    monkeypatch.setattr(settings, "RECOMMENDATION_MIN_SCORE", 2.0, raising=False)
+    assert service.recompute(db, user, RecommendationType.CAREER) == 0
+    assert db.query(UserRecommendationRun).filter(UserRecommendationRun.user_id == user.id).count() == 1
+
+
+def test_other_integrity_errors_are_raised(db):
+    db.execute(text("PRAGMA foreign_keys=ON"))
+    service = RecommendationService()
+
+    # No such user row: the foreign key fails, which is not a concurrent recompute
+    with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+        service.recompute(db, seeker(user_id=999), RecommendationType.CAREER)
+    assert stored(db, 999) == 0
@@ -0,0 +1,98 @@
+"""
+Skill dictionary tests: ids, aliases and the id containment map against a
+brute-force check over every pair of names.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from apps.backend.models.skill import Skill, SkillAlias
+from apps.backend.services.skill_dictionary import SkillDictionary
+
+WORDS = ["solar", "pv", "wind", "energy", "python", "programming", "r", "rust", "carbon", "accounting", "sql"]
+
+
+def covers(outer, inner):
+    """Substring containment, as the original string comparison."""
+    return inner in outer
+
+
+def assert_related_matches_reference(dictionary):
+    ids = {name: skill_id for name, skill_id in dictionary._name_to_id.items()}
+    for name, skill_id in ids.items():
+        expected = sorted(
+            other_id for other, other_id in ids.items()
+            if covers(name, other) or covers(other, name)
+        )
+        np.testing.assert_array_equal(dictionary.related(skill_id), expected)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Skill.metadata.create_all(engine, tables=[Skill.__table__, SkillAlias.__table__])
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def dictionary(session):
+    rng = random.Random(0)
+    names = {" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))) for _ in range(120)}
+    session.add_all(Skill(name=name) for name in sorted(names))
+    session.add(Skill(name="javascript"))
+    session.flush()
+    javascript_id = session.query(Skill.id).filter(Skill.name == "javascript").scalar()
+    session.add(SkillAlias(alias="ecmascript", skill_id=javascript_id))
+    session.commit()
+
+    dictionary = SkillDictionary()
+    dictionary.load(session)
+    return dictionary
+
+
+def test_load_maps_names_ids_and_aliases(dictionary, session):
+    stored = dict(session.query(Skill.name, Skill.id).all())
+
+    assert len(dictionary) == len(stored)
+    assert dictionary.canonicalize(["  JS ", "EcmaScript", "javascript", ""]) == ["javascript"]
+    assert dictionary.id_of("javascript") == stored["javascript"]
+
+    names = [name for name in ["solar pv", "wind", "python", "javascript"] if name in stored]
+    expected = sorted(stored[name] for name in names)
+    np.testing.assert_array_equal(dictionary.ids(["JS"] + [name.upper() for name in names]), expected)
+    assert dictionary.names(expected) == sorted(names, key=stored.get)
+
+
+def test_related_matches_brute_force(dictionary):
+    assert_related_matches_reference(dictionary)
+
+
+def test_local_ids_join_the_map_and_are_replaced_when_stored(dictionary, session):
+    generation = dictionary.generation
+    local_ids = [dictionary.id_of(name) for name in ["solar pv installation", "offshore wind energy"]]
+
+    assert local_ids == [-1, -2]
+    assert_related_matches_reference(dictionary)
+
+    # Another worker interns the name; looking it up again replaces the local id
+    session.add(Skill(name="solar pv installation"))
+    session.commit()
+    stored = dictionary.stored_ids(["solar pv installation"], db=session)["solar pv installation"]
+
+    assert stored > 0 and dictionary.id_of("solar pv installation") == stored
+    assert local_ids[0] not in dictionary._id_to_name
+    assert dictionary.generation == generation + 1
+    assert_related_matches_reference(dictionary)
+
+
+def test_id_list_keeps_first_seen_order(dictionary):
+    ids = dictionary.id_list(["Wind", "solar", "wind", "JS"])
+
+    assert dictionary.names(ids) == ["wind", "solar", "javascript"]
+    np.testing.assert_array_equal(dictionary.ids(["wind", "solar", "js"]), np.sort(ids))
@@ -0,0 +1,121 @@
+"""
+Skill overlap tests: CSR matched/missing skills against the original
+pairwise substring check.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from apps.backend.services.ai.skill_overlap import IncidenceCache, SkillIncidence, compare_skills
+from apps.backend.services.skill_dictionary import skill_dictionary
+
+
+@pytest.fixture(autouse=True)
+def local_dictionary(monkeypatch):
+    # Work with process-local ids instead of reading the skills table
+    monkeypatch.setattr(skill_dictionary, "_loaded", True)
+
+
+WORDS = [
+    "solar", "pv", "wind", "energy", "python", "programming", "r", "rust", "carbon", "accounting", "data", "js",
+    "sql", "postgresql", "excel", "excellence",
+]
+
+
+def random_skill(rng):
+    skill = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+    # Case and spacing variants must canonicalize to the same skill
+    return rng.choice([skill, skill.upper(), f"  {skill} "])
+
+
+def random_skills(rng, size):
+    if rng.random() < 0.05:
+        return None
+    return [random_skill(rng) for _ in range(rng.randint(0, size))]
+
+
+def covers(user_skill, required):
+    """Substring containment either way, as the original _compare_skills."""
+    return user_skill in required or required in user_skill
+
+
+def reference_overlap(skills, required_skills):
+    user = skill_dictionary.canonicalize(skills)
+    required = skill_dictionary.canonicalize(required_skills)
+    matched = [name for name in required if any(covers(skill, name) for skill in user)]
+    missing = [name for name in required if name not in matched]
+    return matched, missing
+
+
+def assert_matches_reference(incidence, skill_lists, skills):
+    covered = incidence.coverage(skills)
+    counts = incidence.matched_counts(covered)
+
+    for row, required_skills in enumerate(skill_lists):
+        matched, missing = reference_overlap(skills, required_skills)
+        assert incidence.overlap(covered, row) == (matched, missing)
+        assert counts[row] == len(matched)
+        assert incidence.row_sizes[row] == len(matched) + len(missing)
+
+
+def test_incidence_matches_brute_force():
+    rng = random.Random(1)
+    skill_lists = [random_skills(rng, 6) for _ in range(200)]
+    incidence = SkillIncidence(skill_lists)
+
+    assert len(incidence) == len(skill_lists)
+    for _ in range(50):
+        assert_matches_reference(incidence, skill_lists, random_skills(rng, 5))
+
+
+def test_containment_is_by_substring():
+    incidence = SkillIncidence([["Solar PV", "Python", "PostgreSQL", "Excellence", "Wind"], ["sql"]])
+
+    covered = incidence.coverage(["solar", "python programming", "SQL", "excel"])
+    assert incidence.overlap(covered, 0) == (["solar pv", "python", "postgresql", "excellence"], ["wind"])
+    assert incidence.overlap(covered, 1) == (["sql"], [])
+    np.testing.assert_array_equal(incidence.matched_counts(covered), [4, 1])
+
+    # Aliases resolve before matching ("pv" -> "solar pv")
+    assert compare_skills(["pv"], ["solar pv installation", "wind"]) == (["solar pv installation"], ["wind"])
+    assert compare_skills(None, ["wind"]) == ([], ["wind"])
+    assert compare_skills(["wind"], None) == ([], [])
+
+
+def test_compare_skills_matches_brute_force():
+    rng = random.Random(2)
+    for _ in range(300):
+        skills, required_skills = random_skills(rng, 4), random_skills(rng, 4)
+        assert compare_skills(skills, required_skills) == reference_overlap(skills, required_skills)
+
+
+def test_cache_rebuilds_only_when_the_version_changes():
+    rng = random.Random(3)
+    cache = IncidenceCache()
+    item_ids = list(range(100, 130))
+    skill_lists = [random_skills(rng, 4) for _ in item_ids]
+    loads = []
+
+    def load():
+        loads.append(1)
+        return item_ids, skill_lists
+
+    first = cache.get("careers", (30, "v1"), load)
+    assert cache.get("careers", (30, "v1"), load) is first
+    assert len(loads) == 1
+    assert first.row_of(104) == 4 and first.row_of(99) is None
+
+    skill_lists[4] = ["carbon accounting"]
+    rebuilt = cache.get("careers", (30, "v2"), load)
+    assert rebuilt is not first and len(loads) == 2
+    assert_matches_reference(rebuilt, skill_lists, ["carbon"])
+
+    # A replaced dictionary id also invalidates the matrices built with it
+    skill_dictionary.generation += 1
+    try:
+        assert cache.get("careers", (30, "v2"), load) is not rebuilt
+    finally:
+        skill_dictionary.generation -= 1
+    assert cache.get("jobs", (30, "v2"), load) is not rebuilt
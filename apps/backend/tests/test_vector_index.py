@@ -0,0 +1,151 @@
+"""
+Vector index tests: IVF probing against an exact scan and against
+brute-force list assignment.
+"""
+
+import numpy as np
+import pytest
+
+from apps.backend.core.config import settings
+from apps.backend.services.ai.ann_index import IVFIndex
+from apps.backend.services.ai.vector_index import VectorIndex
+
+DIM = 16
+
+
+@pytest.fixture
+def ivf_settings(monkeypatch):
+    monkeypatch.setattr(settings, "VECTOR_INDEX_ANN", "ivf")
+    monkeypatch.setattr(settings, "VECTOR_INDEX_ANN_MIN_SIZE", 1)
+    monkeypatch.setattr(settings, "VECTOR_INDEX_IVF_NLIST", 12)
+    monkeypatch.setattr(settings, "VECTOR_INDEX_IVF_NPROBE", 3)
+
+
+MEANS = np.random.default_rng(99).standard_normal((12, DIM))
+
+
+def clustered(rng, rows):
+    """Unit vectors around a few fixed centers, so IVF lists are meaningful."""
+    vectors = MEANS[rng.integers(0, len(MEANS), rows)] + 0.3 * rng.standard_normal((rows, DIM))
+    return VectorIndex.normalize(vectors)
+
+
+def reference_search(ids, vectors, query, k, allowed=None, excluded=()):
+    query = VectorIndex.normalize(query)
+    scores = vectors @ query
+    ranked = [
+        (item_id, float(score)) for item_id, score in zip(ids, scores)
+        if (allowed is None or item_id in allowed) and item_id not in excluded
+    ]
+    ranked.sort(key=lambda pair: -pair[1])
+    return ranked[:k]
+
+
+def assert_same_results(results, expected):
+    assert [item_id for item_id, _ in results] == [item_id for item_id, _ in expected]
+    np.testing.assert_allclose([score for _, score in results], [score for _, score in expected], atol=1e-6)
+
+
+def test_candidates_are_the_closest_lists():
+    rng = np.random.default_rng(0)
+    matrix = clustered(rng, 500)
+    ann = IVFIndex(nlist=10)
+    ann.build(matrix)
+
+    # Brute force: every row's nearest centroid, and the nprobe centroids nearest the query
+    assign = np.argmax(matrix @ ann.centroids.T, axis=1)
+    for nprobe in (1, 3, 10, 50):
+        query = VectorIndex.normalize(rng.standard_normal(DIM))
+        probe = np.argsort(-(ann.centroids @ query))[:min(nprobe, 10)]
+        expected = np.flatnonzero(np.isin(assign, probe))
+        np.testing.assert_array_equal(np.sort(ann.candidates(query, nprobe)), expected)
+
+
+def test_full_probe_matches_exact_scan(ivf_settings):
+    rng = np.random.default_rng(1)
+    ids = list(range(100, 700))
+    vectors = clustered(rng, len(ids))
+    index = VectorIndex("test", dim=DIM)
+    index.build(ids, vectors)
+    assert index._ann is not None
+
+    for _ in range(20):
+        query = rng.standard_normal(DIM)
+        expected = reference_search(ids, vectors, query, 10)
+        assert_same_results(index.search(query, 10, nprobe=12), expected)
+        assert_same_results(index.search(query, 10, exact=True), expected)
+
+
+def test_partial_probe_scores_exactly_and_recalls(ivf_settings):
+    rng = np.random.default_rng(2)
+    ids = list(range(1, 2001))
+    vectors = clustered(rng, len(ids))
+    index = VectorIndex("test", dim=DIM)
+    index.build(ids, vectors)
+    exact = dict(zip(ids, vectors))
+
+    hits = 0
+    for query in clustered(rng, 30):
+        results = index.search(query, 10, nprobe=3)
+        assert len(results) == 10
+        normalized_query = VectorIndex.normalize(query)
+        for item_id, score in results:
+            assert score == pytest.approx(float(exact[item_id] @ normalized_query), abs=1e-5)
+        hits += len({item_id for item_id, _ in results} & {item_id for item_id, _ in reference_search(ids, vectors, query, 10)})
+    assert hits / 300 >= 0.9
+
+
+def test_filters_and_fallback_match_reference(ivf_settings):
+    rng = np.random.default_rng(3)
+    ids = list(range(1, 801))
+    vectors = clustered(rng, len(ids))
+    index = VectorIndex("test", dim=DIM)
+    index.build(ids, vectors)
+
+    query = rng.standard_normal(DIM)
+    # Large allowed set (probed) whose matches may sit outside the probed lists
+    allowed = set(ids[::3])
+    excluded = set(ids[:50])
+    # nprobe=1 leaves too few eligible rows, so the search must fall back to an exact scan
+    assert_same_results(
+        index.search(query, 300, allowed_ids=allowed, exclude_ids=excluded, nprobe=1),
+        reference_search(ids, vectors, query, 300, allowed, excluded)
+    )
+    # Small allowed set is scored directly
+    small = set(rng.choice(ids, 20, replace=False).tolist())
+    assert_same_results(
+        index.search(query, 5, allowed_ids=small, nprobe=1),
+        reference_search(ids, vectors, query, 5, small)
+    )
+
+
+def test_upserts_and_removals_stay_in_lists(ivf_settings):
+    rng = np.random.default_rng(4)
+    ids = list(range(1, 401))
+    vectors = clustered(rng, len(ids))
+    index = VectorIndex("test", dim=DIM)
+    index.build(ids, vectors)
+    current = dict(zip(ids, vectors))
+
+    for item_id in rng.choice(ids, 150, replace=False).tolist():
+        if rng.random() < 0.5:
+            del current[item_id]
+            index.remove(item_id)
+        else:
+            current[item_id] = clustered(rng, 1)[0]
+            index.upsert(item_id, current[item_id])
+    for item_id in range(1000, 1050):
+        current[item_id] = clustered(rng, 1)[0]
+        index.upsert(item_id, current[item_id])
+
+    live_ids = list(current)
+    live_vectors = np.stack([current[item_id] for item_id in live_ids])
+    queries = rng.standard_normal((10, DIM))
+    for query in queries:
+        assert_same_results(index.search(query, 15, nprobe=12), reference_search(live_ids, live_vectors, query, 15))
+
+    # Compaction renumbers rows; the lists must follow
+    with index._lock:
+        index._compact()
+    for query in queries:
+        assert_same_results(index.search(query, 15, nprobe=12), reference_search(live_ids, live_vectors, query, 15))
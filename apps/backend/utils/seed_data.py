@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session
 from apps.backend.db.session import engine
 from apps.backend.models import user, career, job, application, analytics, saved_job, job_alert, notification, browse_history
 from apps.backend.core.security import get_password_hash
+from apps.backend.services.skill_dictionary import skill_dictionary
+from apps.backend.services.skill_index import set_career_skills, set_job_skills
 from datetime import datetime, timezone
 import json
 
@@ -45,6 +47,8 @@ def seed_users(session: Session):
             language="en"
         ),
     ]
+    for seeded_user in users:
+        seeded_user.skills = skill_dictionary.intern(seeded_user.skills) if seeded_user.skills else None
     session.add_all(users)
     print("✅ Users seeded")
 
@@ -149,7 +153,12 @@ def seed_careers(session: Session):
             is_active=True
         ),
     ]
+    # Canonical skill names, as the career routes store them, plus their career_skills rows
+    for seeded_career in careers_list:
+        seeded_career.required_skills = skill_dictionary.intern(seeded_career.required_skills)
     session.add_all(careers_list)
+    for seeded_career in careers_list:
+        set_career_skills(session, seeded_career)
     print("✅ Careers seeded")
 
 
@@ -243,7 +252,13 @@ def seed_jobs(session: Session):
             is_active=True
         ),
     ]
+    # Canonical skill names, as the job routes store them, plus their job_skills rows
+    for seeded_job in jobs_list:
+        seeded_job.required_skills = skill_dictionary.intern(seeded_job.required_skills)
+        seeded_job.preferred_skills = skill_dictionary.intern(seeded_job.preferred_skills)
     session.add_all(jobs_list)
+    for seeded_job in jobs_list:
+        set_job_skills(session, seeded_job)
     print("✅ Jobs seeded")
 
 